@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+#
+# aio_bench.py
+#	Point lookups from an asyncio event loop: with wiredtiger.aio, keeping
+# up to ops_max searches in flight, compared with one cursor[key] at a time.
+from __future__ import print_function
+
+import asyncio, random, time
+import wtbench
+import wiredtiger
+from wiredtiger.aio import AsyncConnection
+
+nrows = 200000
+nlookups = 100000
+ops_max = 1024
+uri = 'table:bench'
+
+def populate(conn):
+    session = conn.open_session()
+    session.create(uri, 'key_format=Q,value_format=SQ')
+    cursor = session.open_cursor(uri, None, 'bulk')
+    for i in range(nrows):
+        cursor[i] = ('value%010d' % i, i)
+    session.close()
+
+def keys():
+    r = random.Random(42)
+    return [r.randrange(nrows) for i in range(nlookups)]
+
+def getitem(conn):
+    session = conn.open_session()
+    cursor = session.open_cursor(uri, None, None)
+    start = time.time()
+    for k in keys():
+        cursor[k]
+    elapsed = time.time() - start
+    session.close()
+    return nlookups / elapsed
+
+def aio(conn):
+    loop = asyncio.new_event_loop()
+    aconn = AsyncConnection(conn, ops_max, loop)
+    start = time.time()
+    loop.run_until_complete(
+        asyncio.gather(*[aconn.search(uri, k) for k in keys()]))
+    elapsed = time.time() - start
+    aconn.close()
+    loop.close()
+    return nlookups / elapsed
+
+if __name__ == '__main__':
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('aio_bench'),
+        'create,cache_size=1GB,async=(enabled=true,ops_max=%d,threads=4)' %
+        ops_max)
+    populate(conn)
+    base = getitem(conn)
+    wtbench.report('cursor[key]', base)
+    wtbench.report('aio search, %d in flight' % ops_max, aio(conn), base)
+    conn.close()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# load_bench.py
+#	Loading a table from Python: one record at a time, and in batches with
+# insert_many.
+from __future__ import print_function
+
+import wtbench
+import wiredtiger
+
+nrows = 100000
+batch_size = 1000
+
+def records(start, stop):
+    return [(i, ('value%010d' % i, i)) for i in range(start, stop)]
+
+def load(config, fn):
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('load_bench'),
+        'create,cache_size=1GB')
+    session = conn.open_session()
+    session.create('table:bench', 'key_format=Q,value_format=SQ')
+    cursor = session.open_cursor('table:bench', None, config)
+    rate = wtbench.measure(lambda n: fn(session, cursor, n), nrows, 1)
+    conn.close()
+    return rate
+
+def setitem(session, cursor, n):
+    for k, v in records(0, n):
+        cursor[k] = v
+
+def insert_many(session, cursor, n):
+    for start in range(0, n, batch_size):
+        cursor.insert_many(records(start, start + batch_size))
+
+def insert_many_txn(session, cursor, n):
+    for start in range(0, n, batch_size):
+        cursor.insert_many(records(start, start + batch_size), True)
+
+if __name__ == '__main__':
+    base = load(None, setitem)
+    wtbench.report('cursor[key] = value', base)
+    wtbench.report('insert_many',
+        load(None, insert_many), base)
+    wtbench.report('insert_many, transaction',
+        load(None, insert_many_txn), base)
+    base = load('bulk', setitem)
+    wtbench.report('bulk cursor[key] = value', base)
+    wtbench.report('bulk insert_many',
+        load('bulk', insert_many), base)
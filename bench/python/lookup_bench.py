@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# lookup_bench.py
+#	Batches of random point lookups: one cursor[key] at a time, and with
+# search_many, sorted and unsorted.  Each is measured with the table in the
+# cache, and after reopening the database so the cache starts empty.
+from __future__ import print_function
+
+import random, time
+import wtbench
+import wiredtiger
+
+nrows = 500000
+nlookups = 50000
+batch_size = 200
+home = 'WT_BENCH/lookup_bench'
+uri = 'table:bench'
+
+def populate():
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('lookup_bench'),
+        'create,cache_size=1GB')
+    session = conn.open_session()
+    session.create(uri, 'key_format=Q,value_format=SQ')
+    cursor = session.open_cursor(uri, None, 'bulk')
+    for i in range(nrows):
+        cursor[i] = ('value%010d' % i, i)
+    conn.close()
+
+def batches():
+    r = random.Random(42)
+    keys = [r.randrange(nrows * 2) for i in range(nlookups)]
+    return [keys[i:i + batch_size] for i in range(0, nlookups, batch_size)]
+
+def getitem(cursor, batch):
+    result = []
+    for k in batch:
+        try:
+            result.append(cursor[k])
+        except KeyError:
+            result.append(None)
+    return result
+
+def search_sorted(cursor, batch):
+    return cursor.search_many(batch)
+
+def search_unsorted(cursor, batch):
+    return cursor.search_many(batch, sort=False)
+
+# With warm set, read the whole table before measuring.
+def lookup(fn, warm):
+    best = None
+    for i in range(3):
+        conn = wiredtiger.wiredtiger_open(home, 'cache_size=1GB')
+        session = conn.open_session()
+        cursor = session.open_cursor(uri, None, None)
+        if warm:
+            for record in cursor:
+                pass
+        start = time.time()
+        for batch in batches():
+            fn(cursor, batch)
+        elapsed = time.time() - start
+        conn.close()
+        if best == None or elapsed < best:
+            best = elapsed
+    return nlookups / best
+
+if __name__ == '__main__':
+    populate()
+    for warm in (True, False):
+        cache = 'warm' if warm else 'cold'
+        base = lookup(getitem, warm)
+        wtbench.report('cursor[key], %s' % cache, base)
+        wtbench.report('search_many, %s' % cache,
+            lookup(search_sorted, warm), base)
+        wtbench.report('search_many unsorted, %s' % cache,
+            lookup(search_unsorted, warm), base)
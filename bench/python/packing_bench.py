@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# packing_bench.py
+#	Compare the compiled packing accelerator with the pure Python packing
+# functions.
+from __future__ import print_function
+
+import wtbench
+from wiredtiger import intpacking, packing
+
+# Format strings and a sample row for each.
+formats = [
+    ('i', (12345,)),
+    ('Q', (2**40,)),
+    ('S', ('a short string',)),
+    ('u', (b'\x00' * 100,)),
+    ('5Q', (1, 2**20, 2**40, 2**63, 0)),
+    ('SiQu', ('key0000012345', -42, 2**48, b'\xab' * 64)),
+    ('iiiiiiiiii', tuple(range(-5, 5))),
+]
+
+def bench_format(fmt, values, count):
+    pack_py, unpack_py = packing._pack_python, packing._unpack_python
+    pack_c, unpack_c = packing.pack, packing.unpack
+    packed = pack_py(fmt, *values)
+    assert pack_c(fmt, *values) == packed
+
+    def run_pack_py(n):
+        for i in range(n):
+            pack_py(fmt, *values)
+    def run_pack_c(n):
+        for i in range(n):
+            pack_c(fmt, *values)
+    def run_unpack_py(n):
+        for i in range(n):
+            unpack_py(fmt, packed)
+    def run_unpack_c(n):
+        for i in range(n):
+            unpack_c(fmt, packed)
+
+    base = wtbench.measure(run_pack_py, count)
+    wtbench.report('pack   %-10s python' % fmt, base)
+    wtbench.report('pack   %-10s compiled' % fmt,
+        wtbench.measure(run_pack_c, count), base)
+    base = wtbench.measure(run_unpack_py, count)
+    wtbench.report('unpack %-10s python' % fmt, base)
+    wtbench.report('unpack %-10s compiled' % fmt,
+        wtbench.measure(run_unpack_c, count), base)
+
+if __name__ == '__main__':
+    if not packing.accelerated:
+        print('packing accelerator not built, nothing to compare')
+    else:
+        for fmt, values in formats:
+            bench_format(fmt, values, 100000)
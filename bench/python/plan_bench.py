@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# plan_bench.py
+#	Measure compiled format plans: packing with a plan against parsing the
+# format on every call, and cursor reads and writes that use them.
+from __future__ import print_function
+
+import wtbench
+import wiredtiger
+from wiredtiger import packing
+
+formats = [
+    ('SiQu', ('key0000012345', -42, 2**48, b'\xab' * 64)),
+    ('5Q', (1, 2**20, 2**40, 2**63, 0)),
+]
+
+def bench_plan(fmt, values, count):
+    plans = [('python', packing._pack_python, packing._unpack_python,
+        packing._python_plan(fmt))]
+    if packing.accelerated:
+        plans.append(('compiled', packing.pack, packing.unpack,
+            packing.compile_format(fmt)))
+    packed = packing._pack_python(fmt, *values)
+
+    for name, pack, unpack, plan in plans:
+        assert plan.pack(*values) == packed
+        def run_pack(n):
+            for i in range(n):
+                pack(fmt, *values)
+        def run_pack_plan(n):
+            for i in range(n):
+                plan.pack(*values)
+        def run_unpack(n):
+            for i in range(n):
+                unpack(fmt, packed)
+        def run_unpack_plan(n):
+            for i in range(n):
+                plan.unpack(packed)
+
+        base = wtbench.measure(run_pack, count)
+        wtbench.report('pack   %-5s %-8s format' % (fmt, name), base)
+        wtbench.report('pack   %-5s %-8s plan' % (fmt, name),
+            wtbench.measure(run_pack_plan, count), base)
+        base = wtbench.measure(run_unpack, count)
+        wtbench.report('unpack %-5s %-8s format' % (fmt, name), base)
+        wtbench.report('unpack %-5s %-8s plan' % (fmt, name),
+            wtbench.measure(run_unpack_plan, count), base)
+
+# Cursor writes and reads through set_key/set_value and get_key/get_value,
+# which pack and unpack using the cursor's plans.
+def bench_cursor(count):
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('plan_bench'),
+        'create,cache_size=500MB')
+    session = conn.open_session()
+    session.create('table:bench',
+        'key_format=SiQu,value_format=5Q')
+    cursor = session.open_cursor('table:bench')
+    value = formats[1][1]
+
+    def run_insert(n):
+        session.begin_transaction()
+        for i in range(n):
+            cursor.set_key('key%010d' % i, i, 2**48, b'\xab' * 64)
+            cursor.set_value(*value)
+            cursor.insert()
+        session.commit_transaction()
+    def run_scan(n):
+        cursor.reset()
+        while cursor.next() == 0:
+            cursor.get_key()
+            cursor.get_value()
+
+    wtbench.report('cursor SiQu/5Q insert',
+        wtbench.measure(run_insert, count))
+    wtbench.report('cursor SiQu/5Q scan', wtbench.measure(run_scan, count))
+    conn.close()
+
+if __name__ == '__main__':
+    for fmt, values in formats:
+        bench_plan(fmt, values, 100000)
+    bench_cursor(100000)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+#
+# row_bench.py
+#	Scanning a wide table and reading one value column, with the columns
+# unpacked for every record and with lazy rows.  Reports the scan rate and
+# the peak memory allocated while holding every record.
+from __future__ import print_function
+
+import time, tracemalloc
+import wtbench
+import wiredtiger
+
+nrows = 100000
+ncols = 20
+uri = 'table:bench'
+
+def populate(conn):
+    session = conn.open_session()
+    session.create(uri, 'key_format=Q,value_format=' + 'S' * ncols)
+    cursor = session.open_cursor(uri, None, 'bulk')
+    value = tuple('column %d value' % c for c in range(ncols))
+    for i in range(nrows):
+        cursor[i] = value
+    session.close()
+
+def scan(conn, lazy):
+    session = conn.open_session()
+    cursor = session.open_cursor(uri, None, None)
+    cursor.lazy_rows = lazy
+    tracemalloc.start()
+    start = time.time()
+    records = list(cursor)
+    for r in records:
+        r[5]
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    session.close()
+    return nrows / elapsed, peak
+
+if __name__ == '__main__':
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('row_bench'),
+        'create,cache_size=1GB')
+    populate(conn)
+    base, base_peak = scan(conn, False)
+    wtbench.report('unpacked rows', base)
+    rate, peak = scan(conn, True)
+    wtbench.report('lazy rows', rate, base)
+    print('peak memory: unpacked %.1fMB, lazy %.1fMB' %
+        (base_peak / 1e6, peak / 1e6))
+    conn.close()
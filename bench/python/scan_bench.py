@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# scan_bench.py
+#	Full table scans from Python: one record at a time, by iterating, in
+# batches, and into arrays of the integer columns.
+from __future__ import print_function
+
+import wtbench
+import wiredtiger
+
+nrows = 200000
+
+def populate(session, uri):
+    session.create(uri, 'key_format=Q,value_format=SQ')
+    cursor = session.open_cursor(uri, None, 'bulk')
+    for i in range(nrows):
+        cursor[i] = ('value%010d' % i, i)
+    cursor.close()
+
+if __name__ == '__main__':
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('scan_bench'),
+        'create,cache_size=1GB')
+    session = conn.open_session()
+    uri = 'table:bench'
+    populate(session, uri)
+    cursor = session.open_cursor(uri, None, None)
+
+    def scan_next(n):
+        cursor.reset()
+        while cursor.next() == 0:
+            cursor.get_keys() + cursor.get_values()
+    def scan_iter(n):
+        cursor.reset()
+        for record in cursor:
+            pass
+    def scan_batch(size, raw=False):
+        def scan(n):
+            cursor.reset()
+            while len(cursor.next_batch(size, raw)) == size:
+                pass
+        return scan
+    def scan_arrays(n):
+        cursor.scan_to_arrays([0, 2])
+
+    base = wtbench.measure(scan_next, nrows)
+    wtbench.report('next, get_keys, get_values', base)
+    wtbench.report('iterate', wtbench.measure(scan_iter, nrows), base)
+    for size in (10, 100, 1000):
+        wtbench.report('next_batch(%d)' % size,
+            wtbench.measure(scan_batch(size), nrows), base)
+    wtbench.report('next_batch(100, raw=True)',
+        wtbench.measure(scan_batch(100, True), nrows), base)
+    wtbench.report('scan_to_arrays',
+        wtbench.measure(scan_arrays, nrows), base)
+    conn.close()
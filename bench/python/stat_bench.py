@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+#
+# stat_bench.py
+#	Polling the statistics of many tables: iterating over a statistics
+# cursor for each table, compared with Session.stat_snapshot.
+from __future__ import print_function
+
+import time
+import wtbench
+import wiredtiger
+
+ntables = 1000
+
+def cursor_poll(session, uris):
+    for uri in uris:
+        cursor = session.open_cursor('statistics:' + uri, None,
+            'statistics=(fast)')
+        values = {}
+        while cursor.next() == 0:
+            values[cursor.get_key()] = cursor.get_values()[2]
+        cursor.close()
+
+def snapshot_poll(session, uris):
+    for uri in uris:
+        session.stat_snapshot(uri)
+
+def poll(session, uris, fn):
+    best = None
+    for i in range(3):
+        start = time.time()
+        fn(session, uris)
+        elapsed = time.time() - start
+        if best == None or elapsed < best:
+            best = elapsed
+    return len(uris) / best
+
+if __name__ == '__main__':
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('stat_bench'),
+        'create,statistics=(fast)')
+    session = conn.open_session()
+    uris = ['table:t%d' % i for i in range(ntables)]
+    for uri in uris:
+        session.create(uri, 'key_format=Q,value_format=Q')
+    base = poll(session, uris, cursor_poll)
+    wtbench.report('statistics cursor, tables/s', base)
+    wtbench.report('stat_snapshot, tables/s',
+        poll(session, uris, snapshot_poll), base)
+    conn.close()
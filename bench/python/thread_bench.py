@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# thread_bench.py
+#	Throughput of Python threads sharing one connection, each thread with
+# its own session, as the number of threads grows.
+from __future__ import print_function
+
+import random, threading, time
+import wtbench
+import wiredtiger
+
+nrows = 200000
+duration = 3.0
+thread_counts = (1, 2, 4, 8)
+
+def populate(conn, uri):
+    session = conn.open_session()
+    session.create(uri, 'key_format=Q,value_format=u')
+    cursor = session.open_cursor(uri, None, 'bulk')
+    value = b'\xab' * 200
+    for i in range(nrows):
+        cursor[i] = value
+    cursor.close()
+    session.close()
+
+# Each operation is a scan of 100 rows from a random starting point, the
+# engine calls dominate the time spent in Python.
+def reader(conn, uri, counts, n, stop):
+    session = conn.open_session()
+    cursor = session.open_cursor(uri, None, None)
+    r = random.Random(n)
+    ops = 0
+    while not stop.is_set():
+        cursor.set_key(r.randrange(nrows))
+        if cursor.search() != 0:
+            continue
+        for i in range(100):
+            if cursor.next() != 0:
+                break
+        ops += 1
+    counts[n] = ops
+    session.close()
+
+def run(conn, uri, nthreads, checkpoint=False):
+    counts = [0] * nthreads
+    stop = threading.Event()
+    threads = [threading.Thread(target=reader,
+        args=(conn, uri, counts, n, stop)) for n in range(nthreads)]
+    for t in threads:
+        t.start()
+    if checkpoint:
+        session = conn.open_session()
+        end = time.time() + duration
+        while time.time() < end:
+            session.checkpoint('force')
+        session.close()
+    else:
+        time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(counts) / duration
+
+if __name__ == '__main__':
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('thread_bench'),
+        'create,cache_size=1GB')
+    uri = 'table:bench'
+    populate(conn, uri)
+    base = None
+    for nthreads in thread_counts:
+        rate = run(conn, uri, nthreads)
+        wtbench.report('scan100 %d threads' % nthreads, rate, base)
+        base = base or rate
+    wtbench.report('scan100 %d threads + checkpoints' % thread_counts[-1],
+        run(conn, uri, thread_counts[-1], True), base)
+    conn.close()
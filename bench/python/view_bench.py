@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# view_bench.py
+#	Reading large values: get_value copies each value into a new bytes
+# object, get_value_view returns a memoryview without copying.
+from __future__ import print_function
+
+import wtbench
+import wiredtiger
+
+nrows = 10000
+
+if __name__ == '__main__':
+    conn = wiredtiger.wiredtiger_open(wtbench.bench_home('view_bench'),
+        'create,cache_size=1GB')
+    session = conn.open_session()
+    for size in (1024, 16384, 131072):
+        uri = 'table:bench%d' % size
+        session.create(uri, 'key_format=Q,value_format=u')
+        cursor = session.open_cursor(uri, None, None)
+        value = b'\xab' * size
+        for i in range(nrows):
+            cursor[i] = bytearray(value)
+
+        def scan_copy(n):
+            cursor.reset()
+            while cursor.next() == 0:
+                cursor.get_value()
+        def scan_view(n):
+            cursor.reset()
+            while cursor.next() == 0:
+                cursor.get_value_view()
+
+        base = wtbench.measure(scan_copy, nrows)
+        wtbench.report('get_value %dB' % size, base)
+        wtbench.report('get_value_view %dB' % size,
+            wtbench.measure(scan_view, nrows), base)
+        cursor.close()
+    conn.close()
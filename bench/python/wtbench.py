@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# wtbench.py
+#	Common setup for the Python API micro-benchmarks in this directory.
+#
+# Importing this module makes the wiredtiger package importable from an
+# in-tree build, in the same way the workgen runners do.
+from __future__ import print_function
+
+import os, shutil, sys, time
+
+thisdir = os.path.dirname(os.path.abspath(__file__))
+wt_dir = os.path.dirname(os.path.dirname(thisdir))
+wt_builddir = os.path.join(wt_dir, 'build_posix')
+
+def _prepend_env_path(pathvar, s):
+    last = ''
+    try:
+        last = ':' + os.environ[pathvar]
+    except:
+        pass
+    os.environ[pathvar] = s + last
+
+try:
+    import wiredtiger
+except:
+    sys.path.insert(0, os.path.join(wt_dir, 'lang', 'python'))
+    sys.path.insert(0, os.path.join(wt_builddir, 'lang', 'python'))
+    try:
+        import wiredtiger
+    except:
+        # The dynamic linker caches the library search path, the only way to
+        # add the .libs directory is to restart the Python interpreter.
+        if '_wtbench_init' not in os.environ:
+            os.environ['_wtbench_init'] = 'true'
+            dotlibs = os.path.join(wt_builddir, '.libs')
+            _prepend_env_path('LD_LIBRARY_PATH', dotlibs)
+            _prepend_env_path('DYLD_LIBRARY_PATH', dotlibs)
+            py_args = sys.argv
+            py_args.insert(0, sys.executable)
+            os.execv(sys.executable, py_args)
+        raise
+
+def bench_home(name):
+    '''Return an empty database directory for a benchmark.'''
+    home = os.path.join('WT_BENCH', name)
+    shutil.rmtree(home, True)
+    os.makedirs(home)
+    return home
+
+def measure(fn, count, repeat=3):
+    '''Call fn(count) repeat times, return the best rate in calls/second.'''
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        fn(count)
+        elapsed = time.time() - start
+        if best == None or elapsed < best:
+            best = elapsed
+    return count / best if best > 0 else float('inf')
+
+def report(name, rate, base=None):
+    '''Print one result line, with the speedup relative to a base rate.'''
+    line = '%-40s %14.0f ops/sec' % (name, rate)
+    if base:
+        line += '  %6.2fx' % (rate / base)
+    print(line)
@@ -55,9 +55,15 @@ class Digest:
         self.lat_99 = 0
         self.lat_99_raw = 0
         self.lat_max = 0
+        self.lat_999_raw = 0
+        self.lat_9999_raw = 0
+        self.tail_entries = 0
         self.secs = 0.0
 
-    def entry(self, secs, ops, lat, lat_99, lat_max):
+    # The 99.9% and 99.99% latencies are missing from monitor.json files
+    # written by older versions of workgen.
+    def entry(self, secs, ops, lat, lat_99, lat_max, lat_999=None,
+              lat_9999=None):
         self.secs += secs
         self.ops += ops
         self.lat += lat * ops
@@ -65,6 +71,10 @@ class Digest:
         self.lat_99 += lat_99 * ops
         if lat_max > self.lat_max:
             self.lat_max = lat_max
+        if lat_999 != None and lat_9999 != None:
+            self.lat_999_raw += lat_999
+            self.lat_9999_raw += lat_9999
+            self.tail_entries += 1
         self.entries += 1
 
     def time_secs(self):
@@ -73,6 +83,16 @@ class Digest:
     def latency_99_raw_average(self):
         return float(self.lat_99_raw) / float(self.entries)
 
+    def latency_999_raw_average(self):
+        if self.tail_entries == 0:
+            return float('nan')
+        return float(self.lat_999_raw) / float(self.tail_entries)
+
+    def latency_9999_raw_average(self):
+        if self.tail_entries == 0:
+            return float('nan')
+        return float(self.lat_9999_raw) / float(self.tail_entries)
+
     def latency_max(self):
         return self.lat_max
 
@@ -85,6 +105,9 @@ class Digest:
         print(prefix + 'total latency us: ' + str(self.lat))
         print(prefix + 'latency 99% us, weighted sum: ' + str(self.lat_99))
         print(prefix + 'latency 99% us, raw sum: ' + str(self.lat_99_raw))
+        print(prefix + 'latency 99.9% us, raw sum: ' + str(self.lat_999_raw))
+        print(prefix + 'latency 99.99% us, raw sum: ' +
+              str(self.lat_9999_raw))
         print(prefix + 'latency max us: ' + str(self.lat_max))
         print(prefix + 'elapsed secs: ' + str(self.secs))
 
@@ -143,6 +166,20 @@ class FileMetrics:
             'during checkpoint times vs normal')
         all.append(m)
 
+        # The same ratio for the 99.9 and 99.99 percentile latencies, which
+        # show how checkpoints affect the slowest few operations.  These are
+        # not a number (nan) for files that don't have those percentiles.
+        #
+        # Lower is better (best is 1.0).
+        self.ratio_latency_999 = m = Metric('Checkpoint vs normal 99.9%',
+            'ratio of the average of all 99.9% latency operations, ' +
+            'during checkpoint times vs normal')
+        all.append(m)
+        self.ratio_latency_9999 = m = Metric('Checkpoint vs normal 99.99%',
+            'ratio of the average of all 99.99% latency operations, ' +
+            'during checkpoint times vs normal')
+        all.append(m)
+
         # The proportion of time spent in a checkpoint
         self.proportion_checkpoint_time = m = Metric('Proportion of ckpt time',
             'the proportion of time doing checkpoints')
@@ -192,8 +229,12 @@ class FileMetrics:
                 lat_avg = rentry['average latency']
                 lat_99 = rentry['99% latency']
                 lat_max = rentry['max latency']
-                digest.entry(seconds, ops, lat_avg, lat_99, lat_max)
-                self.read_all.entry(seconds, ops, lat_avg, lat_99, lat_max)
+                lat_999 = rentry.get('99.9% latency')
+                lat_9999 = rentry.get('99.99% latency')
+                digest.entry(seconds, ops, lat_avg, lat_99, lat_max,
+                             lat_999, lat_9999)
+                self.read_all.entry(seconds, ops, lat_avg, lat_99, lat_max,
+                                    lat_999, lat_9999)
             prev_dt = dt
         if self.read_all.time_secs() == 0.0:
             raise(Exception(self.filename +
@@ -216,6 +257,12 @@ class FileMetrics:
         self.ratio_latency_99.set_value(
             self.read_ckpt.latency_99_raw_average() /
             self.read_normal.latency_99_raw_average())
+        self.ratio_latency_999.set_value(
+            self.read_ckpt.latency_999_raw_average() /
+            self.read_normal.latency_999_raw_average())
+        self.ratio_latency_9999.set_value(
+            self.read_ckpt.latency_9999_raw_average() /
+            self.read_normal.latency_9999_raw_average())
         self.proportion_checkpoint_time.set_value(
             self.read_ckpt.time_secs() /
             self.read_all.time_secs())
@@ -239,7 +286,7 @@ for arg in sys.argv[1:]:
         fm.calculate()
         fmlist.append(fm)
 
-leftlen = 25
+leftlen = 27
 collen = 20
 filecount = len(fmlist)
 dashes = '-' * leftlen, []
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# Check the key distributions.  Each check populates the lowest keys of a
+# table, then searches the table's full key range using a distribution.  The
+# fraction of searches that find a key should match the probability that the
+# distribution chooses one of the populated keys.
+
+from runner import *
+from wiredtiger import *
+from workgen import *
+
+def zeta(n, theta):
+    return sum(1.0 / i ** theta for i in range(1, n + 1))
+
+# The probability that the first count of nkeys zipfian ranks are chosen.
+def zipfian_prob(count, nkeys, theta):
+    return zeta(count, theta) / zeta(nkeys, theta)
+
+# Zipfian ranks are scrambled with an FNV-1a hash, see zipfian_scramble.
+def fnv(value):
+    h = 14695981039346656037
+    for i in range(0, 8):
+        h ^= (value >> (i * 8)) & 0xff
+        h = (h * 1099511628211) % (1 << 64)
+    return h
+
+def scrambled_prob(count, nkeys, theta):
+    total = sum(1.0 / (rank + 1) ** theta for rank in range(0, nkeys)
+                if fnv(rank) % nkeys < count)
+    return total / zeta(nkeys, theta)
+
+context = Context()
+conn = wiredtiger_open("WT_TEST", "create,cache_size=1G")
+
+nkeys = 1000
+nops = 20000
+
+def search_table(populated, key):
+    table = Table(populated_table(context, conn, 'keydist', populated))
+    table.options.range = nkeys
+    return Workload(context, Thread(Operation(Operation.OP_SEARCH, table,
+                                              key) * nops))
+
+# The generator is an approximation for a few of the most popular ranks, and
+# the fraction is sampled, so allow some slack.
+def check(name, populated, key, expected, tolerance = 0.03):
+    workload = search_table(populated, key)
+    workload.run(conn)
+    found = workload.stats.read.ops
+    missed = workload.stats.not_found.ops
+    check_ops(name, 'searches', found + missed, nops)
+    fraction = float(found) / nops
+    print('%s: found %.4f, expected %.4f' % (name, fraction, expected))
+    if abs(fraction - expected) > tolerance:
+        raise Exception(name + ': distribution is off')
+
+check('uniform', 100, Key(Key.KEYGEN_UNIFORM, 10), 0.1)
+check('zipfian 0.99', 100, Key(Key.KEYGEN_ZIPFIAN, 10, ZipfianOptions(0.99)),
+      zipfian_prob(100, nkeys, 0.99))
+check('zipfian 0.5', 100, Key(Key.KEYGEN_ZIPFIAN, 10, ZipfianOptions(0.5)),
+      zipfian_prob(100, nkeys, 0.5))
+k = Key(Key.KEYGEN_ZIPFIAN, 10, ZipfianOptions(0.99))
+k._zipfian.scramble = True
+check('zipfian scrambled', 100, k, scrambled_prob(100, nkeys, 0.99))
+check('hotspot', 100, Key(Key.KEYGEN_HOTSPOT, 10, HotspotOptions(0.1, 0.7)),
+      0.7)
+# The most recent keys are the highest, the unpopulated ones.
+check('latest', 900, Key(Key.KEYGEN_LATEST, 10, ZipfianOptions(0.99)),
+      1.0 - zipfian_prob(100, nkeys, 0.99))
+# Sequential keys visit every key the same number of times.
+check('sequential', 100, Key(Key.KEYGEN_SEQUENTIAL, 10), 0.1, 0.0)
+
+print('RUN bad options')
+expectException(lambda: search_table(
+    10, Key(Key.KEYGEN_ZIPFIAN, 10, ZipfianOptions(1.0))).run(conn))
+expectException(lambda: search_table(
+    10, Key(Key.KEYGEN_HOTSPOT, 10, HotspotOptions(0.0, 0.5))).run(conn))
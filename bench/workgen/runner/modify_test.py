@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# Check that modify operations change the expected bytes of each value.
+# Sequential keys make the modified records predictable.
+
+from runner import *
+from wiredtiger import *
+from workgen import *
+
+context = Context()
+conn = wiredtiger_open("WT_TEST", "create,cache_size=1G")
+s = conn.open_session()
+
+nkeys = 1000
+nmodifies = 100
+
+# Values are zero filled record numbers, 19 characters without the nul.
+def expected_value(recno):
+    return str(recno).zfill(19)
+
+# With txn_config set, each modify runs in a transaction begun with it.
+def modify_workload(modify, txn_config = None):
+    tname = populated_table(context, conn, 'modify', nkeys, 20)
+    op = Operation(Operation.OP_MODIFY, Table(tname),
+                   Key(Key.KEYGEN_SEQUENTIAL, 10), Value(20))
+    op._modify = modify
+    if txn_config is not None:
+        op = txn(op, txn_config)
+    return (tname, Workload(context, Thread(op * nmodifies)))
+
+# Run the modifies, then check the unchanged and changed slices of each value.
+def check(name, modify, unchanged, changed, txn_config = None):
+    tname, workload = modify_workload(modify, txn_config)
+    workload.run(conn)
+    check_ops(name, 'modifies', workload.stats.modify.ops, nmodifies)
+    c = s.open_cursor(tname)
+    nchanged = 0
+    for key, value in c:
+        recno = int(key)
+        expect = expected_value(recno)
+        if len(value) != len(expect):
+            raise Exception(name + ': key ' + key + ' value length changed')
+        if value[unchanged] != expect[unchanged]:
+            raise Exception(name + ': key ' + key + ' changed unexpectedly')
+        if value[changed] != expect[changed]:
+            if recno > nmodifies:
+                raise Exception(name + ': key ' + key + ' was modified')
+            nchanged += 1
+    c.close()
+    print('%s: %d values changed' % (name, nchanged))
+    # Random data can occasionally match the original.
+    if nchanged < nmodifies * 0.9:
+        raise Exception(name + ': expected ' + str(nmodifies) +
+                        ' changed values')
+
+# Run random modifies of size bytes, then check that each value changed in at
+# most size consecutive bytes, at offsets that vary from value to value.
+def check_random(name, size):
+    tname, workload = modify_workload(ModifyOptions(1, size))
+    workload.run(conn)
+    check_ops(name, 'modifies', workload.stats.modify.ops, nmodifies)
+    c = s.open_cursor(tname)
+    offsets = set()
+    for key, value in c:
+        recno = int(key)
+        expect = expected_value(recno)
+        if len(value) != len(expect):
+            raise Exception(name + ': key ' + key + ' value length changed')
+        diffs = [i for i in range(len(expect)) if value[i] != expect[i]]
+        if not diffs:
+            continue
+        if recno > nmodifies:
+            raise Exception(name + ': key ' + key + ' was modified')
+        if diffs[-1] - diffs[0] >= size:
+            raise Exception(name + ': key ' + key + ' changed more than ' +
+                            str(size) + ' bytes')
+        offsets.add(diffs[0])
+    c.close()
+    # There are 16 possible offsets, 100 modifies should find most of them.
+    print('%s: %d offsets' % (name, len(offsets)))
+    if len(offsets) < 8:
+        raise Exception(name + ': offsets are not random')
+
+modify = ModifyOptions(2, 5)
+modify.placement = 'start'
+check('start', modify, slice(10, 19), slice(0, 10))
+modify.placement = 'end'
+check('end', modify, slice(0, 9), slice(9, 19))
+check('transaction', modify, slice(0, 9), slice(9, 19), 'isolation=snapshot')
+check_random('random', 4)
+
+print('RUN bad options')
+modify = ModifyOptions(0, 5)
+expectException(lambda: modify_workload(modify)[1].run(conn))
+modify = ModifyOptions(4, 5)
+expectException(lambda: modify_workload(modify)[1].run(conn))
+modify = ModifyOptions(2, 5)
+modify.placement = 'middle'
+expectException(lambda: modify_workload(modify)[1].run(conn))
+# Modifies fail in the session's default read-committed transactions.
+modify = ModifyOptions(2, 5)
+expectException(lambda: modify_workload(modify, '')[1].run(conn))
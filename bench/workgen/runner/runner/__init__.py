@@ -90,3 +90,4 @@ os.mkdir('WT_TEST')
 
 from .core import txn, extensions_config, op_append, op_group_transaction, op_log_like, op_multi_table, op_populate_with_range, sleep, timed
 from .latency import workload_latency
+from .check import check_ops, expectException, populated_table
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# runner/check.py
+#      Utility functions for runners that check workgen's behavior
+from __future__ import print_function
+from workgen import Key, Operation, Table, Thread, Value, Workload
+
+# Raise unless calling expr raises an exception.
+def expectException(expr):
+    gotit = False
+    try:
+        expr()
+    except BaseException as e:
+        print('got expected exception: ' + str(e))
+        gotit = True
+    if not gotit:
+        raise Exception("missing expected exception")
+
+_tablenos = {}
+
+# Create a new table named from prefix, and insert nkeys records with
+# appended keys.  Returns the table's name.
+def populated_table(context, conn, prefix, nkeys, value_size = 10):
+    tableno = _tablenos.get(prefix, 0)
+    _tablenos[prefix] = tableno + 1
+    tname = 'table:%s%03d' % (prefix, tableno)
+    session = conn.open_session()
+    session.create(tname, 'key_format=S,value_format=S')
+    session.close()
+    op = Operation(Operation.OP_INSERT, Table(tname),
+                   Key(Key.KEYGEN_APPEND, 10), Value(value_size))
+    Workload(context, Thread(op * nkeys)).run(conn)
+    return tname
+
+# Raise unless a check ran the expected number of operations.
+def check_ops(name, what, ops, expected):
+    print('%s: %d %s' % (name, ops, what))
+    if ops != expected:
+        raise Exception(name + ': expected ' + str(expected) + ' ' + what +
+                        ', got ' + str(ops))
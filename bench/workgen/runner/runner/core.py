@@ -265,7 +265,7 @@ def _op_log_op(op, log_table):
 
 def _optype_is_write(optype):
     return optype == Operation.OP_INSERT or optype == Operation.OP_UPDATE or \
-        optype == Operation.OP_REMOVE
+        optype == Operation.OP_REMOVE or optype == Operation.OP_MODIFY
 
 # Emulate wtperf's log_like option.  For all operations, add a second
 # insert operation going to a log table.
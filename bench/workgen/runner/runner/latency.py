@@ -31,16 +31,12 @@
 from __future__ import print_function
 import sys
 
-def _show_buckets(fh, title, mult, buckets, n):
-    shown = False
+# Percentiles shown for each operation type.
+_percentiles = [50, 90, 99, 99.9, 99.99]
+
+def _show_histogram(fh, title, histogram):
     s = title + ': '
-    for count in range(0, n):
-        val = buckets[count]
-        if val != 0:
-            if shown:
-                s += ','
-            s += str(count*mult) + '=' + str(val)
-            shown = True
+    s += ','.join(str(us) + '=' + str(count) for us, count in histogram)
     print(s, file=fh)
 
 def _latency_preprocess(arr, merge):
@@ -74,12 +70,25 @@ def _latency_optype(fh, name, ch, t):
         return
     if t.latency_ops == 0:
         print('**** ' + name + ' operations: ' + str(t.ops), file=fh)
+    else:
+        print('**** ' + name + ' operations: ' + str(t.ops) + \
+              ', latency operations: ' + str(t.latency_ops), file=fh)
+    # Scans read several rows per operation.
+    if t.rows != 0:
+        print('  rows: ' + str(t.rows) + ', rows per operation: ' + \
+              str(t.rows // t.ops), file=fh)
+    if t.latency_ops == 0:
         return
-    print('**** ' + name + ' operations: ' + str(t.ops) + \
-          ', latency operations: ' + str(t.latency_ops), file=fh)
     print('  avg: ' + str(t.latency/t.latency_ops) + \
           ', min: ' + str(t.min_latency) + ', max: ' + str(t.max_latency),
           file=fh)
+    # Open-loop threads split latency into time queued and time in service.
+    if t.queue_latency != 0:
+        print('  avg queued: ' + str(t.average_queue_latency()) + \
+              ', avg service: ' + str(t.average_service_latency()) + \
+              ', max queued: ' + str(t.max_queue_latency), file=fh)
+    print('  ' + ', '.join('p' + str(p) + ': ' +
+          str(t.percentile_latency(p)) for p in _percentiles), file=fh)
     us = t.us()
     ms = t.ms()
     sec = t.sec()
@@ -104,9 +113,7 @@ def _latency_optype(fh, name, ch, t):
     print(' 0 - 999 us (40/bucket)     1 - 999 ms (40/bucket)     ' + \
           '1 - 99 sec (4/bucket)', file=fh)
     print('', file=fh)
-    _show_buckets(fh, name + ' us', 1, us, 1000)
-    _show_buckets(fh, name + ' ms', 1000, ms, 1000)
-    _show_buckets(fh, name + ' sec', 1000000, sec, 100)
+    _show_histogram(fh, name + ' us', t.histogram())
     print('', file=fh)
 
 def workload_latency(workload, outfilename = None):
@@ -115,8 +122,10 @@ def workload_latency(workload, outfilename = None):
     else:
         fh = sys.stdout
     _latency_optype(fh, 'insert', 'I', workload.stats.insert)
+    _latency_optype(fh, 'modify', 'M', workload.stats.modify)
     _latency_optype(fh, 'read', 'R', workload.stats.read)
     _latency_optype(fh, 'remove', 'X', workload.stats.remove)
+    _latency_optype(fh, 'scan', 'S', workload.stats.scan)
     _latency_optype(fh, 'update', 'U', workload.stats.update)
     _latency_optype(fh, 'truncate', 'T', workload.stats.truncate)
     _latency_optype(fh, 'not found', 'N', workload.stats.not_found)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# Check that scans read the expected number of rows.  Sequential keys make the
+# start of each scan predictable.
+
+from runner import *
+from wiredtiger import *
+from workgen import *
+
+context = Context()
+conn = wiredtiger_open("WT_TEST", "create,cache_size=1G")
+
+nkeys = 1000
+nscans = 100
+
+def scan_workload(scan):
+    tname = populated_table(context, conn, 'scan', nkeys)
+    op = Operation(Operation.OP_SCAN, Table(tname),
+                   Key(Key.KEYGEN_SEQUENTIAL, 10))
+    op._scan = scan
+    return Workload(context, Thread(op * nscans))
+
+def check(name, scan, low, high):
+    workload = scan_workload(scan)
+    workload.run(conn)
+    stats = workload.stats.scan
+    check_ops(name, 'scans', stats.ops, nscans)
+    print('%s: %d rows' % (name, stats.rows))
+    if stats.rows < low or stats.rows > high:
+        raise Exception(name + ': expected between ' + str(low) + ' and ' +
+                        str(high) + ' rows')
+
+# Scans start at keys 1 through 100, and read 10 rows.
+check('forward', ScanOptions(10), nscans * 10, nscans * 10)
+
+# Reverse scans from the first 9 keys stop at the start of the table.
+scan = ScanOptions(10)
+scan.reverse = True
+check('reverse', scan, 955, 955)
+
+scan = ScanOptions(5)
+scan.length_max = 15
+check('uniform length', scan, nscans * 5, nscans * 15)
+scan.length_distribution = 'zipfian'
+check('zipfian length', scan, nscans * 5, nscans * 15)
+
+print('RUN bad options')
+scan = ScanOptions(0)
+expectException(lambda: scan_workload(scan).run(conn))
+scan = ScanOptions(10)
+scan.length_max = 20
+scan.length_distribution = 'pareto'
+expectException(lambda: scan_workload(scan).run(conn))
@@ -53,6 +53,8 @@ extern "C" {
 #define LATENCY_US_BUCKETS 1000
 #define LATENCY_MS_BUCKETS 1000
 #define LATENCY_SEC_BUCKETS 100
+#define LATENCY_DIGITS_MAX 4
+#define LATENCY_HIST_BITS 40        // histogram range, about 12 days in us
 
 #define THROTTLE_PER_SEC  20     // times per sec we will throttle
 
@@ -102,6 +104,12 @@ extern "C" {
 
 namespace workgen {
 
+// Characters used for the random parts of values.
+static const char alphanum[] =
+  "0123456789"
+  "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+  "abcdefghijklmnopqrstuvwxyz";
+
 // The number of contexts.  Normally there is one context created, but it will
 // be possible to use several eventually.  More than one is not yet
 // implemented, but we must at least guard against the caller creating more
@@ -296,7 +304,16 @@ int Monitor::run() {
             << "insert maximum latency(uS),"
             << "update average latency(uS),"
             << "update min latency(uS),"
-            << "update maximum latency(uS)"
+            << "update maximum latency(uS),"
+            << "scan ops per second,"
+            << "scan rows per second,"
+            << "scan average latency(uS),"
+            << "scan min latency(uS),"
+            << "scan maximum latency(uS),"
+            << "modify ops per second,"
+            << "modify average latency(uS),"
+            << "modify min latency(uS),"
+            << "modify maximum latency(uS)"
             << std::endl;
 
     first = true;
@@ -333,7 +350,8 @@ int Monitor::run() {
         tm = localtime_r(&t.tv_sec, &_tm);
         (void)strftime(time_buf, sizeof(time_buf), "%b %d %H:%M:%S", tm);
 
-        Stats new_totals(true);
+        Stats new_totals;
+        new_totals.track_latency(true, options->latency_digits);
         for (std::vector<ThreadRunner>::iterator tr =
           _wrunner._trunners.begin(); tr != _wrunner._trunners.end(); tr++)
             new_totals.add(tr->_stats, true);
@@ -344,6 +362,11 @@ int Monitor::run() {
         uint64_t cur_reads = (uint64_t)(interval.read.ops / interval_secs);
         uint64_t cur_inserts = (uint64_t)(interval.insert.ops / interval_secs);
         uint64_t cur_updates = (uint64_t)(interval.update.ops / interval_secs);
+        uint64_t cur_scans = (uint64_t)(interval.scan.ops / interval_secs);
+        uint64_t cur_scan_rows =
+          (uint64_t)(interval.scan.rows / interval_secs);
+        uint64_t cur_modifies =
+          (uint64_t)(interval.modify.ops / interval_secs);
         bool checkpointing = new_totals.checkpoint.ops_in_progress > 0 ||
           interval.checkpoint.ops > 0;
 
@@ -363,6 +386,15 @@ int Monitor::run() {
                 << "," << interval.update.average_latency()
                 << "," << interval.update.min_latency
                 << "," << interval.update.max_latency
+                << "," << cur_scans
+                << "," << cur_scan_rows
+                << "," << interval.scan.average_latency()
+                << "," << interval.scan.min_latency
+                << "," << interval.scan.max_latency
+                << "," << cur_modifies
+                << "," << interval.modify.average_latency()
+                << "," << interval.modify.min_latency
+                << "," << interval.modify.max_latency
                 << std::endl;
 
         if (_json != NULL) {
@@ -374,7 +406,7 @@ int Monitor::run() {
               ".%3.3" PRIu64 "Z", (uint64_t)ns_to_ms(t.tv_nsec));
 
             // Note: we could allow this to be configurable.
-            int percentiles[4] = {50, 95, 99, 0};
+            double percentiles[6] = {50, 95, 99, 99.9, 99.99, 0};
 
 #define TRACK_JSON(f, name, t, percentiles, extra)                         \
             do {                                                           \
@@ -385,7 +417,12 @@ int Monitor::run() {
                     << ",\"rollbacks\":" << ((t).rollbacks)                \
                     << ",\"average latency\":" << (t).average_latency()    \
                     << ",\"min latency\":" << (t).min_latency              \
-                    << ",\"max latency\":" << (t).max_latency;             \
+                    << ",\"max latency\":" << (t).max_latency              \
+                    << ",\"average queue latency\":"                       \
+                    << (t).average_queue_latency()                         \
+                    << ",\"max queue latency\":" << (t).max_queue_latency  \
+                    << ",\"average service latency\":"                     \
+                    << (t).average_service_latency();                      \
                 for (_i = 0; (percentiles)[_i] != 0; _i++)                 \
                     (f) << ",\"" << (percentiles)[_i] << "% latency\":"    \
                         << (t).percentile_latency(percentiles[_i]);        \
@@ -405,6 +442,11 @@ int Monitor::run() {
             (*_json) << ",";
             TRACK_JSON(*_json, "update", interval.update, percentiles, "");
             (*_json) << ",";
+            TRACK_JSON(*_json, "scan", interval.scan, percentiles,
+              "\"rows per sec\":" << cur_scan_rows << ",");
+            (*_json) << ",";
+            TRACK_JSON(*_json, "modify", interval.modify, percentiles, "");
+            (*_json) << ",";
             TRACK_JSON(*_json, "checkpoint", interval.checkpoint, percentiles,
               "\"active\":" << (checkpointing ? "1," : "0,"));
             (*_json) << "}}" << std::endl;
@@ -446,14 +488,76 @@ ParetoOptions::ParetoOptions(const ParetoOptions &other) :
     range_high(other.range_high), _options(other._options) {}
 ParetoOptions::~ParetoOptions() {}
 
+ZipfianOptions ZipfianOptions::DEFAULT;
+ZipfianOptions::ZipfianOptions(double theta_arg) : theta(theta_arg),
+    scramble(false), _options() {
+    _options.add_double("theta", theta,
+      "between 0.0 and 1.0 exclusive, the skew of the distribution, "
+      "higher is more skewed");
+    _options.add_bool("scramble", scramble,
+      "spread the popular keys across the key range, rather than making "
+      "the lowest keys the most popular. Not used by KEYGEN_LATEST");
+}
+ZipfianOptions::ZipfianOptions(const ZipfianOptions &other) :
+    theta(other.theta), scramble(other.scramble), _options(other._options) {}
+ZipfianOptions::~ZipfianOptions() {}
+
+HotspotOptions HotspotOptions::DEFAULT;
+HotspotOptions::HotspotOptions(double hot_set_arg, double hot_ops_arg) :
+    hot_set(hot_set_arg), hot_ops(hot_ops_arg), _options() {
+    _options.add_double("hot_set", hot_set,
+      "between 0.0 and 1.0 exclusive, the fraction of the key range that "
+      "is hot, starting at the lowest key");
+    _options.add_double("hot_ops", hot_ops,
+      "between 0.0 and 1.0, the fraction of operations on hot keys");
+}
+HotspotOptions::HotspotOptions(const HotspotOptions &other) :
+    hot_set(other.hot_set), hot_ops(other.hot_ops), _options(other._options) {}
+HotspotOptions::~HotspotOptions() {}
+
+ScanOptions ScanOptions::DEFAULT;
+ScanOptions::ScanOptions(int length_arg) : length(length_arg), length_max(0),
+    length_distribution("uniform"), reverse(false), _options() {
+    _options.add_int("length", length,
+      "the number of records read by each scan");
+    _options.add_int("length_max", length_max,
+      "if larger than length, each scan reads a number of records between "
+      "length and length_max, chosen by length_distribution");
+    _options.add_string("length_distribution", length_distribution,
+      "\"uniform\", or \"zipfian\" to make shorter scans more common");
+    _options.add_bool("reverse", reverse,
+      "scan toward smaller keys, using prev rather than next");
+}
+ScanOptions::ScanOptions(const ScanOptions &other) :
+    length(other.length), length_max(other.length_max),
+    length_distribution(other.length_distribution), reverse(other.reverse),
+    _options(other._options) {}
+ScanOptions::~ScanOptions() {}
+
+ModifyOptions ModifyOptions::DEFAULT;
+ModifyOptions::ModifyOptions(int count_arg, int size_arg) : count(count_arg),
+    size(size_arg), placement("random"), _options() {
+    _options.add_int("count", count,
+      "the number of modifications made to the value by each operation");
+    _options.add_int("size", size,
+      "the number of bytes each modification replaces");
+    _options.add_string("placement", placement,
+      "where modifications land in the value: \"random\", or packed together "
+      "at the \"start\" or the \"end\" of the value");
+}
+ModifyOptions::ModifyOptions(const ModifyOptions &other) :
+    count(other.count), size(other.size), placement(other.placement),
+    _options(other._options) {}
+ModifyOptions::~ModifyOptions() {}
+
 ThreadRunner::ThreadRunner() :
     _errno(0), _exception(), _thread(NULL), _context(NULL), _icontext(NULL),
     _workload(NULL), _wrunner(NULL), _rand_state(NULL),
-    _throttle(NULL), _throttle_ops(0), _throttle_limit(0),
+    _throttle(NULL), _arrivals(NULL), _throttle_ops(0), _throttle_limit(0),
     _in_transaction(false), _start_time_us(0), _op_time_us(0),
     _number(0), _stats(false), _table_usage(),
     _cursors(NULL), _stop(false), _session(NULL), _keybuf(NULL),
-    _valuebuf(NULL), _repeat(false) {
+    _valuebuf(NULL), _modifies(), _repeat(false) {
 }
 
 ThreadRunner::~ThreadRunner() {
@@ -467,16 +571,26 @@ int ThreadRunner::create_all(WT_CONNECTION *conn) {
     ASSERT(_session == NULL);
     if (_thread->options.synchronized)
         _thread->_op.synchronized_check();
+    if (!_thread->options.arrival.empty()) {
+        if (_thread->options.arrival != "constant" &&
+          _thread->options.arrival != "poisson")
+            THROW("Thread.options.arrival must be \"constant\" or "
+              "\"poisson\"");
+        if (_thread->options.throttle <= 0.0)
+            THROW("Thread.options.arrival requires Thread.options.throttle "
+              "to be set to the arrival rate");
+    }
     WT_RET(conn->open_session(conn, NULL, NULL, &_session));
     _table_usage.clear();
-    _stats.track_latency(_workload->options.sample_interval_ms > 0);
+    _stats.track_latency(_workload->options.sample_interval_ms > 0,
+      _workload->options.latency_digits);
     WT_RET(workgen_random_alloc(_session, &_rand_state));
     _throttle_ops = 0;
     _throttle_limit = 0;
     _in_transaction = 0;
     keysize = 1;
     valuesize = 1;
-    op_create_all(&_thread->_op, keysize, valuesize);
+    op_create_all(&_thread->_op, keysize, valuesize, NULL);
     _keybuf = new char[keysize];
     _valuebuf = new char[valuesize];
     _keybuf[keysize - 1] = '\0';
@@ -505,6 +619,10 @@ int ThreadRunner::close_all() {
         delete _throttle;
         _throttle = NULL;
     }
+    if (_arrivals != NULL) {
+        delete _arrivals;
+        _arrivals = NULL;
+    }
     if (_session != NULL) {
         WT_RET(_session->close(_session, NULL));
         _session = NULL;
@@ -571,7 +689,10 @@ int ThreadRunner::run() {
     _op_time_us = _start_time_us;
 
     VERBOSE(*this, "thread " << name << " running");
-    if (options->throttle != 0) {
+    if (!options->arrival.empty())
+        _arrivals = new Arrivals(*this, options->throttle,
+          options->arrival == "poisson");
+    else if (options->throttle != 0) {
         _throttle = new Throttle(*this, options->throttle,
           options->throttle_burst);
     }
@@ -597,18 +718,105 @@ void ThreadRunner::get_static_counts(Stats &stats) {
     _thread->_op.get_static_counts(stats, 1);
 }
 
+// Zipfian keys: the i-th most popular of n keys is chosen with probability
+// proportional to 1/i^theta, using the method from Gray et al., "Quickly
+// Generating Billion-Record Synthetic Databases", as YCSB does.  That needs
+// zeta(n, theta), the sum of 1/i^theta for i in [1, n].  The first
+// ZIPFIAN_ZETA_TERMS partial sums are precomputed for each operation, larger
+// sums add the rest of the terms with the Euler-Maclaurin formula, so
+// choosing a key is O(1) however large the table grows.
+#define    ZIPFIAN_ZETA_TERMS    64
+#define    SCAN_ZIPFIAN_THETA    0.99
+
+static void
+zipfian_zeta_init(double theta, std::vector<double> &zeta) {
+    zeta.resize(ZIPFIAN_ZETA_TERMS + 1);
+    zeta[0] = 0.0;
+    for (int i = 1; i <= ZIPFIAN_ZETA_TERMS; i++)
+        zeta[i] = zeta[i - 1] + pow((double)i, -theta);
+}
+
+static double
+zipfian_zeta(uint64_t n, double theta, const std::vector<double> &zeta) {
+    double a, b;
+
+    if (n <= ZIPFIAN_ZETA_TERMS)
+        return (zeta[n]);
+
+    // The terms from a to b: their integral, plus the end point and first
+    // derivative corrections.  Later corrections are below 1e-9 for a > 64.
+    a = ZIPFIAN_ZETA_TERMS + 1;
+    b = (double)n;
+    return (zeta[ZIPFIAN_ZETA_TERMS] +
+      (pow(b, 1.0 - theta) - pow(a, 1.0 - theta)) / (1.0 - theta) +
+      (pow(a, -theta) + pow(b, -theta)) / 2.0 +
+      theta * (pow(a, -theta - 1.0) - pow(b, -theta - 1.0)) / 12.0);
+}
+
+// The transaction is the one the operation runs in, if any: the operation's
+// own, or one enclosing it.
 void ThreadRunner::op_create_all(Operation *op, size_t &keysize,
-  size_t &valuesize) {
+  size_t &valuesize, const Transaction *transaction) {
     tint_t tint;
 
     op->create_all();
+    if (op->_transaction != NULL)
+        transaction = op->_transaction;
     if (op->is_table_op()) {
         op->kv_compute_max(true, false);
-        if (OP_HAS_VALUE(op))
+        if (OP_HAS_VALUE(op) || op->_optype == Operation::OP_MODIFY)
             op->kv_compute_max(false, op->_table.options.random_value);
         if (op->_key._keytype == Key::KEYGEN_PARETO &&
           op->_key._pareto.param == 0)
             THROW("Key._pareto value must be set if KEYGEN_PARETO specified");
+        if (op->_key._keytype == Key::KEYGEN_ZIPFIAN ||
+          op->_key._keytype == Key::KEYGEN_LATEST) {
+            if (op->_key._zipfian.theta <= 0.0 ||
+              op->_key._zipfian.theta >= 1.0)
+                THROW("Key._zipfian.theta must be between 0.0 and 1.0, "
+                  "exclusive");
+            zipfian_zeta_init(op->_key._zipfian.theta,
+              ((TableOperationInternal *)op->_internal)->_zeta);
+        }
+        if (op->_optype == Operation::OP_SCAN) {
+            if (op->_scan.length <= 0)
+                THROW("Operation._scan.length must be positive");
+            if (op->_scan.length_distribution != "uniform" &&
+              op->_scan.length_distribution != "zipfian")
+                THROW("Operation._scan.length_distribution must be "
+                  "\"uniform\" or \"zipfian\"");
+            if (op->_scan.length_distribution == "zipfian")
+                zipfian_zeta_init(SCAN_ZIPFIAN_THETA,
+                  ((TableOperationInternal *)op->_internal)->_scan_zeta);
+        }
+        if (op->_optype == Operation::OP_MODIFY) {
+            if (op->_modify.count <= 0 || op->_modify.size <= 0)
+                THROW("Operation._modify.count and Operation._modify.size "
+                  "must be positive");
+            // Values are strings, their length doesn't include the nul.
+            if ((uint64_t)op->_modify.count * (uint64_t)op->_modify.size >
+              ((TableOperationInternal *)op->_internal)->_valuesize - 1)
+                THROW("Operation._modify changes more bytes than the value "
+                  "size for table '" << op->_table._uri << "'");
+            if (op->_modify.placement != "random" &&
+              op->_modify.placement != "start" &&
+              op->_modify.placement != "end")
+                THROW("Operation._modify.placement must be \"random\", "
+                  "\"start\" or \"end\"");
+            // WT_CURSOR::modify fails in read-committed transactions, the
+            // session default.
+            if (transaction != NULL &&
+              transaction->_begin_config.find("isolation=snapshot") ==
+              std::string::npos)
+                THROW("OP_MODIFY in a Transaction requires a begin config "
+                  "with isolation=snapshot");
+        }
+        if (op->_key._keytype == Key::KEYGEN_HOTSPOT &&
+          (op->_key._hotspot.hot_set <= 0.0 ||
+          op->_key._hotspot.hot_set >= 1.0 ||
+          op->_key._hotspot.hot_ops < 0.0 || op->_key._hotspot.hot_ops > 1.0))
+            THROW("Key._hotspot.hot_set must be between 0.0 and 1.0 "
+              "exclusive, and Key._hotspot.hot_ops between 0.0 and 1.0");
         op->kv_size_buffer(true, keysize);
         op->kv_size_buffer(false, valuesize);
 
@@ -633,7 +841,8 @@ void ThreadRunner::op_create_all(Operation *op, size_t &keysize,
         }
         uint32_t usage_flags = CONTAINER_VALUE(_table_usage,
           op->_table._internal->_tint, 0);
-        if (op->_optype == Operation::OP_SEARCH)
+        if (op->_optype == Operation::OP_SEARCH ||
+          op->_optype == Operation::OP_SCAN)
             usage_flags |= ThreadRunner::USAGE_READ;
         else
             usage_flags |= ThreadRunner::USAGE_WRITE;
@@ -642,7 +851,7 @@ void ThreadRunner::op_create_all(Operation *op, size_t &keysize,
     if (op->_group != NULL)
         for (std::vector<Operation>::iterator i = op->_group->begin();
             i != op->_group->end(); i++)
-            op_create_all(&*i, keysize, valuesize);
+            op_create_all(&*i, keysize, valuesize, transaction);
 }
 
 
@@ -688,12 +897,64 @@ pareto_calculation(uint32_t randint, uint64_t recno_max,
     return (result);
 }
 
+// Return a value within the interval [ 0, recno_max ), given a value
+// uniformly distributed in [ 0.0, 1.0 ).  Zero is the most popular value.
+static uint64_t
+zipfian_calculation(double u, uint64_t recno_max, double theta,
+  const std::vector<double> &zeta) {
+    double alpha, eta, zetan, uz;
+    uint64_t result;
+
+    if (recno_max <= 1)
+        return (0);
+    zetan = zipfian_zeta(recno_max, theta, zeta);
+    uz = u * zetan;
+    if (uz < 1.0)
+        return (0);
+    if (uz < 1.0 + pow(0.5, theta))
+        return (1);
+    alpha = 1.0 / (1.0 - theta);
+    eta = (1.0 - pow(2.0 / recno_max, 1.0 - theta)) / (1.0 - zeta[2] / zetan);
+    result = (uint64_t)(recno_max * pow(eta * u - eta + 1.0, alpha));
+    return (MIN(result, recno_max - 1));
+}
+
+// Spread a value within the interval [ 0, recno_max ) over that interval
+// using an FNV-1a hash, so popular values aren't neighbors.
+static uint64_t
+zipfian_scramble(uint64_t value, uint64_t recno_max) {
+    uint64_t hash;
+
+    hash = 14695981039346656037ULL;
+    for (int i = 0; i < 8; i++) {
+        hash ^= (value >> (i * 8)) & 0xff;
+        hash *= 1099511628211ULL;
+    }
+    return (hash % recno_max);
+}
+
+// Return a value within the interval [ 0, recno_max ), given two values
+// uniformly distributed in [ 0.0, 1.0 ).  The lowest hot_set fraction of
+// values are chosen for hot_ops of the calls, the rest are chosen otherwise.
+static uint64_t
+hotspot_calculation(double u, double v, uint64_t recno_max,
+  const HotspotOptions &hotspot) {
+    uint64_t hot_max;
+
+    hot_max = (uint64_t)(recno_max * hotspot.hot_set);
+    if (hot_max == 0)
+        hot_max = 1;
+    if (u < hotspot.hot_ops || hot_max >= recno_max)
+        return ((uint64_t)(v * hot_max));
+    return (hot_max + (uint64_t)(v * (recno_max - hot_max)));
+}
+
 uint64_t ThreadRunner::op_get_key_recno(Operation *op, uint64_t range,
   tint_t tint) {
-    uint64_t recno_count;
+    TableOperationInternal *internal;
+    uint64_t recno_count, result;
     uint32_t rval;
 
-    (void)op;
     if (range > 0)
         recno_count = range;
     else
@@ -701,6 +962,32 @@ uint64_t ThreadRunner::op_get_key_recno(Operation *op, uint64_t range,
     if (recno_count == 0)
         // The file has no entries, returning 0 forces a WT_NOTFOUND return.
         return (0);
+
+    internal = (TableOperationInternal *)op->_internal;
+    switch (op->_key._keytype) {
+    case Key::KEYGEN_HOTSPOT:
+        result = hotspot_calculation(random_double(), random_double(),
+          recno_count, op->_key._hotspot);
+        return (result + 1);
+    case Key::KEYGEN_LATEST:
+        // The most recently inserted, highest, recnos are the most popular.
+        result = zipfian_calculation(random_double(), recno_count,
+          op->_key._zipfian.theta, internal->_zeta);
+        return (recno_count - result);
+    case Key::KEYGEN_SEQUENTIAL:
+        // All threads share one position in the table, wrapping at the end.
+        result = workgen_atomic_add64(
+          &_icontext->_table_runtime[tint]._sequential, 1);
+        return ((result - 1) % recno_count + 1);
+    case Key::KEYGEN_ZIPFIAN:
+        result = zipfian_calculation(random_double(), recno_count,
+          op->_key._zipfian.theta, internal->_zeta);
+        if (op->_key._zipfian.scramble)
+            result = zipfian_scramble(result, recno_count);
+        return (result + 1);
+    default:
+        break;
+    }
     rval = random_value();
     if (op->_key._keytype == Key::KEYGEN_PARETO)
         rval = pareto_calculation(rval, recno_count, op->_key._pareto);
@@ -712,14 +999,16 @@ int ThreadRunner::op_run(Operation *op) {
     tint_t tint = op->_table._internal->_tint;
     WT_CURSOR *cursor;
     WT_DECL_RET;
-    uint64_t recno;
-    uint64_t range;
-    bool measure_latency, own_cursor, retry_op;
+    uint64_t intended_us, recno;
+    uint64_t range, rows, scan_length;
+    bool measure_latency, own_cursor, own_transaction, retry_op;
 
     track = NULL;
     cursor = NULL;
+    intended_us = 0;
     recno = 0;
-    own_cursor = false;
+    rows = scan_length = 0;
+    own_cursor = own_transaction = false;
     retry_op = true;
     range = op->_table.options.range;
     if (_throttle != NULL) {
@@ -736,6 +1025,12 @@ int ThreadRunner::op_run(Operation *op) {
         if (op->is_table_op())
             ++_throttle_ops;
     }
+    // With open-loop arrivals, wait for the operation's scheduled start.
+    // Operations inside a transaction are part of the operation that
+    // started it, like throttling, they aren't scheduled separately.
+    if (_arrivals != NULL && op->is_table_op() && !_in_transaction &&
+      !_stop)
+        intended_us = _arrivals->arrive();
 
     // A potential race: thread1 is inserting, and increments
     // Context->_recno[] for fileX.wt. thread2 is doing one of
@@ -764,10 +1059,19 @@ int ThreadRunner::op_run(Operation *op) {
     case Operation::OP_NOOP:
         recno = 0;
         break;
+    case Operation::OP_MODIFY:
+        track = &_stats.modify;
+        recno = op_get_key_recno(op, range, tint);
+        break;
     case Operation::OP_REMOVE:
         track = &_stats.remove;
         recno = op_get_key_recno(op, range, tint);
         break;
+    case Operation::OP_SCAN:
+        track = &_stats.scan;
+        recno = op_get_key_recno(op, range, tint);
+        scan_length = op_scan_length(op);
+        break;
     case Operation::OP_SEARCH:
         track = &_stats.read;
         recno = op_get_key_recno(op, range, tint);
@@ -821,16 +1125,31 @@ int ThreadRunner::op_run(Operation *op) {
               op->_transaction->_begin_config.c_str()));
             _in_transaction = true;
         }
+        // Modify requires a snapshot transaction, when the operation isn't
+        // already part of one, it runs in its own.
+        if (op->_optype == Operation::OP_MODIFY && !_in_transaction) {
+            WT_ERR(_session->begin_transaction(_session,
+              "isolation=snapshot"));
+            _in_transaction = own_transaction = true;
+        }
         if (op->is_table_op()) {
             switch (op->_optype) {
             case Operation::OP_INSERT:
                 ret = cursor->insert(cursor);
                 break;
+            case Operation::OP_MODIFY:
+                ret = op_modify(op, cursor);
+                if (ret == WT_NOTFOUND)
+                    ret = 0;
+                break;
             case Operation::OP_REMOVE:
                 ret = cursor->remove(cursor);
                 if (ret == WT_NOTFOUND)
                     ret = 0;
                 break;
+            case Operation::OP_SCAN:
+                ret = op_scan(op, cursor, scan_length, &rows);
+                break;
             case Operation::OP_SEARCH:
                 ret = cursor->search(cursor);
                 if (ret == WT_NOTFOUND) {
@@ -846,6 +1165,15 @@ int ThreadRunner::op_run(Operation *op) {
             default:
                 ASSERT(false);
             }
+            // A transaction started for this operation is resolved here, if
+            // it's rolled back, the operation is retried in a new one.
+            if (own_transaction) {
+                if (ret == 0)
+                    ret = _session->commit_transaction(_session, NULL);
+                else
+                    WT_TRET(_session->rollback_transaction(_session, NULL));
+                _in_transaction = own_transaction = false;
+            }
             // Assume success and no retry unless ROLLBACK.
             retry_op = false;
             if (ret != 0 && ret != WT_ROLLBACK)
@@ -855,7 +1183,8 @@ int ThreadRunner::op_run(Operation *op) {
             else {
                 retry_op = true;
                 track->rollbacks++;
-                WT_ERR(_session->rollback_transaction(_session, NULL));
+                if (_in_transaction)
+                    WT_ERR(_session->rollback_transaction(_session, NULL));
                 _in_transaction = false;
                 ret = 0;
             }
@@ -867,10 +1196,18 @@ int ThreadRunner::op_run(Operation *op) {
         }
     }
 
+    if (op->_optype == Operation::OP_SCAN)
+        track->rows += rows;
     if (measure_latency) {
         timespec stop;
         workgen_epoch(&stop);
-        track->complete_with_latency(ts_us(stop - start));
+        // An open-loop operation's latency is measured from when it was
+        // scheduled to start, the time it waited to start is queueing delay.
+        if (intended_us != 0 && intended_us < ts_us(start))
+            track->complete_with_latency(ts_us(stop) - intended_us,
+              ts_us(start) - intended_us);
+        else
+            track->complete_with_latency(ts_us(stop - start));
     } else if (track != NULL)
         track->complete();
 
@@ -910,6 +1247,94 @@ err:
     return (ret);
 }
 
+// Make a partial update to the value of the record with the key in _keybuf.
+// The operation's count modifications each replace size bytes of the value
+// with random data, at offsets chosen by the placement.  Offsets are relative
+// to the operation's value size.  The key is set here, so the modify can be
+// retried after a rollback has reset the cursor.
+int ThreadRunner::op_modify(Operation *op, WT_CURSOR *cursor) {
+    TableOperationInternal *internal;
+    WT_MODIFY *entry;
+    size_t count, offset, size, valuesize;
+    char *data;
+
+    internal = (TableOperationInternal *)op->_internal;
+    count = (size_t)op->_modify.count;
+    size = (size_t)op->_modify.size;
+    valuesize = internal->_valuesize - 1;      // without the nul
+    if (_modifies.size() < count)
+        _modifies.resize(count);
+
+    // The new data for all the modifications is generated together.
+    data = _valuebuf;
+    for (size_t i = 0; i < count * size; i++)
+        data[i] = alphanum[random_value() % (sizeof(alphanum) - 1)];
+
+    offset = 0;
+    if (op->_modify.placement == "end")
+        offset = valuesize - count * size;
+    for (size_t i = 0; i < count; i++) {
+        entry = &_modifies[i];
+        entry->data.data = data + i * size;
+        entry->data.size = size;
+        if (op->_modify.placement == "random")
+            entry->offset = random_value() % (valuesize - size + 1);
+        else
+            entry->offset = offset + i * size;
+        entry->size = size;
+    }
+    cursor->set_key(cursor, _keybuf);
+    return (cursor->modify(cursor, &_modifies[0], (int)count));
+}
+
+// Read a scan's records, starting at the record nearest the key in _keybuf,
+// and moving toward larger keys, or smaller ones for a reverse scan.  Reaching
+// the end of the table ends the scan early.  The key is set here, so the scan
+// can be retried after a rollback has reset the cursor.
+int ThreadRunner::op_scan(Operation *op, WT_CURSOR *cursor, uint64_t length,
+  uint64_t *rowsp) {
+    WT_DECL_RET;
+    uint64_t rows;
+    int exact;
+    bool reverse;
+
+    reverse = op->_scan.reverse;
+    *rowsp = 0;
+    cursor->set_key(cursor, _keybuf);
+    if ((ret = cursor->search_near(cursor, &exact)) == 0) {
+        if (exact < 0 && !reverse)
+            ret = cursor->next(cursor);
+        else if (exact > 0 && reverse)
+            ret = cursor->prev(cursor);
+    }
+    for (rows = 0; ret == 0;) {
+        if (++rows >= length)
+            break;
+        ret = reverse ? cursor->prev(cursor) : cursor->next(cursor);
+    }
+    if (ret == WT_NOTFOUND)
+        ret = 0;
+    if (ret == 0)
+        *rowsp = rows;
+    return (ret);
+}
+
+// Return the number of records a scan should read.
+uint64_t ThreadRunner::op_scan_length(Operation *op) {
+    TableOperationInternal *internal;
+    uint64_t span;
+
+    if (op->_scan.length_max <= op->_scan.length)
+        return ((uint64_t)op->_scan.length);
+    span = (uint64_t)(op->_scan.length_max - op->_scan.length) + 1;
+    if (op->_scan.length_distribution == "zipfian") {
+        internal = (TableOperationInternal *)op->_internal;
+        return (op->_scan.length + zipfian_calculation(random_double(), span,
+          SCAN_ZIPFIAN_THETA, internal->_scan_zeta));
+    }
+    return (op->_scan.length + (uint64_t)(random_double() * span));
+}
+
 #ifdef _DEBUG
 std::string ThreadRunner::get_debug() {
     return (_debug_messages.str());
@@ -920,6 +1345,15 @@ uint32_t ThreadRunner::random_value() {
     return (workgen_random(_rand_state));
 }
 
+// Return a double value equally distributed in [ 0.0, 1.0 ), using 53 random
+// bits, as many as a double holds.
+double ThreadRunner::random_double() {
+    uint64_t r;
+
+    r = ((uint64_t)random_value() << 32) | random_value();
+    return ((double)(r >> 11) / (double)(1ULL << 53));
+}
+
 // Generate a random 32-bit value then return a float value equally distributed
 // between -1.0 and 1.0.
 float ThreadRunner::random_signed() {
@@ -1019,9 +1453,60 @@ int Throttle::throttle(uint64_t op_count, uint64_t *op_limit) {
     return (0);
 }
 
-ThreadOptions::ThreadOptions() : name(), throttle(0.0), throttle_burst(1.0),
-    synchronized(false), _options() {
+Arrivals::Arrivals(ThreadRunner &runner, double rate, bool poisson) :
+    _runner(runner), _rate(rate), _poisson(poisson), _next_us(0.0),
+    _started(false) {
+    ASSERT(_rate > 0.0);
+}
+
+Arrivals::~Arrivals() {}
+
+// The schedule is fixed when the first operation arrives: with constant
+// arrivals, operations are 1/rate seconds apart, with Poisson arrivals the
+// gaps are exponentially distributed with a mean of 1/rate seconds.  The
+// schedule never adjusts to how long operations take, if the thread falls
+// behind, operations start as soon as they can and the time they waited
+// shows up in their latency.
+uint64_t Arrivals::arrive() {
+    uint64_t intended_us, now_us;
+    double gap_us, u;
+    timespec now;
+
+    workgen_epoch(&now);
+    now_us = ts_us(now);
+    if (!_started) {
+        _next_us = (double)now_us;
+        _started = true;
+    }
+    intended_us = (uint64_t)_next_us;
+    if (_poisson) {
+        // A uniform value in (0, 1], so the log is finite.
+        u = (_runner.random_value() + 1.0) / ((double)UINT32_MAX + 1.0);
+        gap_us = -log(u) * USEC_PER_SEC / _rate;
+    } else
+        gap_us = USEC_PER_SEC / _rate;
+    _next_us += gap_us;
+
+    // Sleep in short steps, so a stopped thread doesn't linger.
+    while (now_us < intended_us && !_runner._stop) {
+        usleep((useconds_t)MIN(intended_us - now_us, ms_to_us(100)));
+        workgen_epoch(&now);
+        now_us = ts_us(now);
+    }
+    DEBUG_CAPTURE(_runner, "arrive: intended=" << intended_us
+      << ", behind=" << (now_us > intended_us ? now_us - intended_us : 0)
+      << std::endl);
+    return (intended_us);
+}
+
+ThreadOptions::ThreadOptions() : name(), arrival(), throttle(0.0),
+    throttle_burst(1.0), synchronized(false), _options() {
     _options.add_string("name", name, "name of the thread");
+    _options.add_string("arrival", arrival,
+      "run open-loop, starting operations on a fixed schedule of "
+      "Thread.options.throttle operations per second, either \"constant\" "
+      "or \"poisson\".  Latencies include the time an operation waited for "
+      "earlier ones to finish.  The default, empty, runs closed-loop");
     _options.add_double("throttle", throttle,
       "Limit to this number of operations per second");
     _options.add_double("throttle_burst", throttle_burst,
@@ -1029,7 +1514,7 @@ ThreadOptions::ThreadOptions() : name(), throttle(0.0), throttle_burst(1.0),
       "to having large bursts with lulls (10.0 or larger)");
 }
 ThreadOptions::ThreadOptions(const ThreadOptions &other) :
-    name(other.name), throttle(other.throttle),
+    name(other.name), arrival(other.arrival), throttle(other.throttle),
   throttle_burst(other.throttle_burst), synchronized(other.synchronized),
   _options(other._options) {}
 ThreadOptions::~ThreadOptions() {}
@@ -1104,7 +1589,8 @@ Operation::Operation(OpType optype, Table table) :
 
 Operation::Operation(const Operation &other) :
     _optype(other._optype), _internal(NULL), _table(other._table),
-    _key(other._key), _value(other._value), _config(other._config),
+    _key(other._key), _value(other._value), _scan(other._scan),
+    _modify(other._modify), _config(other._config),
     _transaction(other._transaction), _group(other._group),
     _repeatgroup(other._repeatgroup), _timed(other._timed) {
     // Creation and destruction of _group and _transaction is managed
@@ -1129,6 +1615,8 @@ Operation& Operation::operator=(const Operation &other) {
     _table = other._table;
     _key = other._key;
     _value = other._value;
+    _scan = other._scan;
+    _modify = other._modify;
     _transaction = other._transaction;
     _group = other._group;
     _repeatgroup = other._repeatgroup;
@@ -1151,7 +1639,9 @@ void Operation::init_internal(OperationInternal *other) {
               *(CheckpointOperationInternal *)other);
         break;
     case OP_INSERT:
+    case OP_MODIFY:
     case OP_REMOVE:
+    case OP_SCAN:
     case OP_SEARCH:
     case OP_UPDATE:
         if (other == NULL)
@@ -1200,6 +1690,12 @@ void Operation::describe(std::ostream &os) const {
         os << ", ";  _table.describe(os);
         os << ", "; _key.describe(os);
         os << ", "; _value.describe(os);
+        if (_optype == OP_MODIFY) {
+            os << ", Modify: "; _modify.describe(os);
+        }
+        if (_optype == OP_SCAN) {
+            os << ", Scan: "; _scan.describe(os);
+        }
     }
     if (!_config.empty())
         os << ", '" << _config << "'";
@@ -1233,9 +1729,15 @@ void Operation::get_static_counts(Stats &stats, int multiplier) {
         case OP_INSERT:
             stats.insert.ops += multiplier;
             break;
+        case OP_MODIFY:
+            stats.modify.ops += multiplier;
+            break;
         case OP_REMOVE:
             stats.remove.ops += multiplier;
             break;
+        case OP_SCAN:
+            stats.scan.ops += multiplier;
+            break;
         case OP_SEARCH:
             stats.read.ops += multiplier;
             break;
@@ -1255,8 +1757,9 @@ void Operation::get_static_counts(Stats &stats, int multiplier) {
 }
 
 bool Operation::is_table_op() const {
-    return (_optype == OP_INSERT || _optype == OP_REMOVE ||
-      _optype == OP_SEARCH || _optype == OP_UPDATE);
+    return (_optype == OP_INSERT || _optype == OP_MODIFY ||
+      _optype == OP_REMOVE || _optype == OP_SCAN || _optype == OP_SEARCH ||
+      _optype == OP_UPDATE);
 }
 
 void Operation::kv_compute_max(bool iskey, bool has_random) {
@@ -1331,10 +1834,6 @@ void Operation::kv_gen(ThreadRunner *runner, bool iskey,
      * proportion of the value that can't be used for the identifier.
      */
     if (size > 20 && compressibility < 100) {
-        static const char alphanum[] =
-          "0123456789"
-          "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-          "abcdefghijklmnopqrstuvwxyz";
         /*
          * The random length is the proportion of the string that should not
          * be compressible. As an example a compressibility of 25 in a value
@@ -1363,8 +1862,8 @@ void Operation::size_check() const {
     if (is_table_op()) {
         if (_key._size == 0 && _table.options.key_size == 0)
             THROW("operation requires a key size");
-        if (OP_HAS_VALUE(this) && _value._size == 0 &&
-          _table.options.value_size == 0)
+        if ((OP_HAS_VALUE(this) || _optype == OP_MODIFY) &&
+          _value._size == 0 && _table.options.value_size == 0)
             THROW("operation requires a value size");
     }
 }
@@ -1452,33 +1951,71 @@ void TableOperationInternal::parse_config(const std::string &config)
     }
 }
 
+// Latency histograms are log-linear, in the style of HdrHistogram. Latencies
+// are in microseconds.  Magnitude 0 counts latencies below 2^_sub_bits, at 1us
+// each.  Each magnitude m after that counts latencies from 2^(_sub_bits+m-1)
+// up to 2^(_sub_bits+m), in half as many buckets of 2^m us each.  Choosing
+// 2^_sub_bits >= 2 * 10^digits keeps every bucket narrower than 10^-digits of
+// the latencies it holds.
+//
+// A magnitude's buckets are allocated the first time one of its latencies is
+// recorded, and aren't freed until latency tracking is turned off.  Only the
+// owning thread records into a Track, the monitor thread reads it without
+// locking, the same as the other counters.
+static inline uint32_t hist_block_size(int sub_bits, int mag) {
+    return (mag == 0 ? (1U << sub_bits) : (1U << (sub_bits - 1)));
+}
+
+static inline int hist_magnitudes(int sub_bits) {
+    return (LATENCY_HIST_BITS - sub_bits + 1);
+}
+
+static inline void hist_index(int sub_bits, uint64_t usecs, int *magp,
+  uint32_t *idxp) {
+    int mag;
+
+    if (usecs >= ((uint64_t)1 << LATENCY_HIST_BITS))
+        usecs = ((uint64_t)1 << LATENCY_HIST_BITS) - 1;
+    if (usecs < ((uint64_t)1 << sub_bits)) {
+        *magp = 0;
+        *idxp = (uint32_t)usecs;
+    } else {
+        mag = 63 - __builtin_clzll(usecs) - sub_bits + 1;
+        *magp = mag;
+        *idxp = (uint32_t)(usecs >> mag) - (1U << (sub_bits - 1));
+    }
+}
+
+// The lowest latency counted by a bucket.
+static inline uint64_t hist_value(int sub_bits, int mag, uint32_t idx) {
+    if (mag == 0)
+        return (idx);
+    return ((uint64_t)(idx + (1U << (sub_bits - 1))) << mag);
+}
+
 Track::Track(bool latency_tracking) : ops_in_progress(0), ops(0), rollbacks(0),
-    latency_ops(0), latency(0), bucket_ops(0), min_latency(0), max_latency(0),
-    us(NULL), ms(NULL), sec(NULL) {
+    latency_ops(0), latency(0), queue_latency(0), rows(0), bucket_ops(0),
+    min_latency(0), max_latency(0), max_queue_latency(0), _hist(NULL),
+    _digits(0), _sub_bits(0) {
     track_latency(latency_tracking);
 }
 
 Track::Track(const Track &other) : ops_in_progress(other.ops_in_progress),
     ops(other.ops), rollbacks(other.rollbacks),
     latency_ops(other.latency_ops), latency(other.latency),
-    bucket_ops(other.bucket_ops), min_latency(other.min_latency),
-    max_latency(other.max_latency), us(NULL), ms(NULL), sec(NULL) {
-    if (other.us != NULL) {
-        us = new uint32_t[LATENCY_US_BUCKETS];
-        ms = new uint32_t[LATENCY_MS_BUCKETS];
-        sec = new uint32_t[LATENCY_SEC_BUCKETS];
-        memcpy(us, other.us, sizeof(uint32_t) * LATENCY_US_BUCKETS);
-        memcpy(ms, other.ms, sizeof(uint32_t) * LATENCY_MS_BUCKETS);
-        memcpy(sec, other.sec, sizeof(uint32_t) * LATENCY_SEC_BUCKETS);
+    queue_latency(other.queue_latency), rows(other.rows),
+    bucket_ops(other.bucket_ops),
+    min_latency(other.min_latency), max_latency(other.max_latency),
+    max_queue_latency(other.max_queue_latency), _hist(NULL), _digits(0),
+    _sub_bits(0) {
+    if (other._hist != NULL) {
+        _hist_init(other._digits);
+        _hist_merge(other, false);
     }
 }
 
 Track::~Track() {
-    if (us != NULL) {
-        delete us;
-        delete ms;
-        delete sec;
-    }
+    _hist_free();
 }
 
 void Track::add(Track &other, bool reset) {
@@ -1486,6 +2023,8 @@ void Track::add(Track &other, bool reset) {
     ops += other.ops;
     latency_ops += other.latency_ops;
     latency += other.latency;
+    queue_latency += other.queue_latency;
+    rows += other.rows;
 
     min_latency = MIN(min_latency, other.min_latency);
     if (reset)
@@ -1493,15 +2032,12 @@ void Track::add(Track &other, bool reset) {
     max_latency = MAX(max_latency, other.max_latency);
     if (reset)
         other.max_latency = 0;
+    max_queue_latency = MAX(max_queue_latency, other.max_queue_latency);
+    if (reset)
+        other.max_queue_latency = 0;
 
-    if (us != NULL && other.us != NULL) {
-        for (int i = 0; i < LATENCY_US_BUCKETS; i++)
-            us[i] += other.us[i];
-        for (int i = 0; i < LATENCY_MS_BUCKETS; i++)
-            ms[i] += other.ms[i];
-        for (int i = 0; i < LATENCY_SEC_BUCKETS; i++)
-            sec[i] += other.sec[i];
-    }
+    if (_hist != NULL && other._hist != NULL)
+        _hist_merge(other, false);
 }
 
 void Track::assign(const Track &other) {
@@ -1509,26 +2045,24 @@ void Track::assign(const Track &other) {
     ops = other.ops;
     latency_ops = other.latency_ops;
     latency = other.latency;
+    queue_latency = other.queue_latency;
+    rows = other.rows;
     min_latency = other.min_latency;
     max_latency = other.max_latency;
+    max_queue_latency = other.max_queue_latency;
 
-    if (other.us == NULL && us != NULL) {
-        delete us;
-        delete ms;
-        delete sec;
-        us = NULL;
-        ms = NULL;
-        sec = NULL;
-    }
-    else if (other.us != NULL && us == NULL) {
-        us = new uint32_t[LATENCY_US_BUCKETS];
-        ms = new uint32_t[LATENCY_MS_BUCKETS];
-        sec = new uint32_t[LATENCY_SEC_BUCKETS];
-    }
-    if (us != NULL) {
-        memcpy(us, other.us, sizeof(uint32_t) * LATENCY_US_BUCKETS);
-        memcpy(ms, other.ms, sizeof(uint32_t) * LATENCY_MS_BUCKETS);
-        memcpy(sec, other.sec, sizeof(uint32_t) * LATENCY_SEC_BUCKETS);
+    if (other._hist == NULL)
+        _hist_free();
+    else {
+        if (_hist == NULL || _digits != other._digits) {
+            _hist_free();
+            _hist_init(other._digits);
+        } else
+            for (int mag = 0; mag < hist_magnitudes(_sub_bits); mag++)
+                if (_hist[mag] != NULL)
+                    memset(_hist[mag], 0,
+                      sizeof(uint32_t) * hist_block_size(_sub_bits, mag));
+        _hist_merge(other, false);
     }
 }
 
@@ -1539,6 +2073,22 @@ uint64_t Track::average_latency() const {
         return (latency / latency_ops);
 }
 
+// The average time open-loop operations waited for their turn to start.
+uint64_t Track::average_queue_latency() const {
+    if (latency_ops == 0)
+        return (0);
+    else
+        return (queue_latency / latency_ops);
+}
+
+// The average time operations took once they started.
+uint64_t Track::average_service_latency() const {
+    if (latency_ops == 0 || queue_latency > latency)
+        return (0);
+    else
+        return ((latency - queue_latency) / latency_ops);
+}
+
 void Track::begin() {
     ops_in_progress++;
 }
@@ -1549,14 +2099,17 @@ void Track::clear() {
     rollbacks = 0;
     latency_ops = 0;
     latency = 0;
+    queue_latency = 0;
+    rows = 0;
     bucket_ops = 0;
     min_latency = 0;
     max_latency = 0;
-    if (us != NULL) {
-        memset(us, 0, sizeof(uint32_t) * LATENCY_US_BUCKETS);
-        memset(ms, 0, sizeof(uint32_t) * LATENCY_MS_BUCKETS);
-        memset(sec, 0, sizeof(uint32_t) * LATENCY_SEC_BUCKETS);
-    }
+    max_queue_latency = 0;
+    if (_hist != NULL)
+        for (int mag = 0; mag < hist_magnitudes(_sub_bits); mag++)
+            if (_hist[mag] != NULL)
+                memset(_hist[mag], 0,
+                  sizeof(uint32_t) * hist_block_size(_sub_bits, mag));
 }
 
 void Track::complete() {
@@ -1564,73 +2117,69 @@ void Track::complete() {
     ops++;
 }
 
-void Track::complete_with_latency(uint64_t usecs) {
-    ASSERT(us != NULL);
+// Complete an operation that took usecs, of which queue_usecs were spent
+// waiting for its scheduled start.
+void Track::complete_with_latency(uint64_t usecs, uint64_t queue_usecs) {
+    int mag;
+    uint32_t idx;
+
+    ASSERT(_hist != NULL);
 
     --ops_in_progress;
     ops++;
     latency_ops++;
     latency += usecs;
+    queue_latency += queue_usecs;
     if (usecs > max_latency)
         max_latency = (uint32_t)usecs;
+    if (queue_usecs > max_queue_latency)
+        max_queue_latency = (uint32_t)queue_usecs;
     if (usecs < min_latency)
         min_latency = (uint32_t)usecs;
 
-    // Update a latency bucket.
-    // First buckets: usecs from 100us to 1000us at 100us each.
-    if (usecs < LATENCY_US_BUCKETS)
-        us[usecs]++;
-
-    // Second buckets: milliseconds from 1ms to 1000ms, at 1ms each.
-    else if (usecs < ms_to_us(LATENCY_MS_BUCKETS))
-        ms[us_to_ms(usecs)]++;
-
-    // Third buckets are seconds from 1s to 100s, at 1s each.
-    else if (usecs < sec_to_us(LATENCY_SEC_BUCKETS))
-        sec[us_to_sec(usecs)]++;
-
-    // >100 seconds, accumulate in the biggest bucket. */
-    else
-        sec[LATENCY_SEC_BUCKETS - 1]++;
+    // Update a latency bucket, latencies past the histogram's range
+    // accumulate in the biggest bucket.
+    hist_index(_sub_bits, usecs, &mag, &idx);
+    _hist_block(mag)[idx]++;
 }
 
 // Return the latency for which the given percent is lower than it.
-// E.g. for percent == 95, returns the latency for which 95% of latencies
-// are faster (lower), and 5% are slower (higher).
-uint64_t Track::percentile_latency(int percent) const {
+// E.g. for percent == 99.9, returns the latency for which 99.9% of latencies
+// are faster (lower), and 0.1% are slower (higher).  The result is the
+// highest latency in its bucket, so it is never an underestimate.
+uint64_t Track::percentile_latency(double percent) const {
+    if (_hist == NULL)
+        return (0);
+
     // Get the total number of operations in the latency buckets.
     // We can't reliably use latency_ops, because this struct was
     // added up from Track structures that were being copied while
     // being updated.
+    int mags = hist_magnitudes(_sub_bits);
     uint64_t total = 0;
-    for (int i = 0; i < LATENCY_SEC_BUCKETS; i++)
-        total += sec[i];
-    for (int i = 0; i < LATENCY_MS_BUCKETS; i++)
-        total += ms[i];
-    for (int i = 0; i < LATENCY_US_BUCKETS; i++)
-        total += us[i];
+    for (int mag = 0; mag < mags; mag++)
+        if (_hist[mag] != NULL)
+            for (uint32_t i = 0; i < hist_block_size(_sub_bits, mag); i++)
+                total += _hist[mag][i];
     if (total == 0)
         return (0);
 
-    // optimized for percent values over 50, we start counting from above.
+    // The rank of the wanted latency, counting up from the lowest.
+    uint64_t rank = (uint64_t)ceil(percent * total / 100.0);
+    if (rank < 1)
+        rank = 1;
+    else if (rank > total)
+        rank = total;
     uint64_t n = 0;
-    uint64_t k = (100 - percent) * total / 100;
-    if (k == 0)
-        return (0);
-    for (int i = LATENCY_SEC_BUCKETS - 1; i >= 0; --i) {
-        n += sec[i];
-        if (n >= k)
-            return (sec_to_us(i));
-    }
-    for (int i = LATENCY_MS_BUCKETS - 1; i >= 0; --i) {
-        n += ms[i];
-        if (n >= k)
-            return (ms_to_us(i));
-    }
-    for (int i = LATENCY_US_BUCKETS - 1; i >= 0; --i) {
-        n += us[i];
-        if (n >= k)
-            return (100 * i);
+    for (int mag = 0; mag < mags; mag++) {
+        if (_hist[mag] == NULL)
+            continue;
+        for (uint32_t i = 0; i < hist_block_size(_sub_bits, mag); i++) {
+            n += _hist[mag][i];
+            if (n >= rank)
+                return (hist_value(_sub_bits, mag, i) +
+                  ((uint64_t)1 << mag) - 1);
+        }
     }
     // We should have accounted for all the buckets.
     ASSERT(false);
@@ -1642,71 +2191,179 @@ void Track::subtract(const Track &other) {
     ops -= other.ops;
     latency_ops -= other.latency_ops;
     latency -= other.latency;
+    queue_latency -= other.queue_latency;
+    rows -= other.rows;
 
     // There's no sensible thing to be done for min/max_latency.
 
-    if (us != NULL && other.us != NULL) {
-        for (int i = 0; i < LATENCY_US_BUCKETS; i++)
-            us[i] -= other.us[i];
-        for (int i = 0; i < LATENCY_MS_BUCKETS; i++)
-            ms[i] -= other.ms[i];
-        for (int i = 0; i < LATENCY_SEC_BUCKETS; i++)
-            sec[i] -= other.sec[i];
-    }
+    if (_hist != NULL && other._hist != NULL)
+        _hist_merge(other, true);
 }
 
-void Track::track_latency(bool newval) {
+// Turn latency tracking on or off.  Changing the number of significant digits
+// of a histogram that's in use rebuckets the latencies already recorded.
+void Track::track_latency(bool newval, int digits) {
+    if (digits < 1 || digits > LATENCY_DIGITS_MAX)
+        THROW("latency digits must be between 1 and " << LATENCY_DIGITS_MAX);
     if (newval) {
-        if (us == NULL) {
-            us = new uint32_t[LATENCY_US_BUCKETS];
-            ms = new uint32_t[LATENCY_MS_BUCKETS];
-            sec = new uint32_t[LATENCY_SEC_BUCKETS];
-            memset(us, 0, sizeof(uint32_t) * LATENCY_US_BUCKETS);
-            memset(ms, 0, sizeof(uint32_t) * LATENCY_MS_BUCKETS);
-            memset(sec, 0, sizeof(uint32_t) * LATENCY_SEC_BUCKETS);
+        if (_hist == NULL)
+            _hist_init(digits);
+        else if (digits != _digits) {
+            Track old(*this);
+            _hist_free();
+            _hist_init(digits);
+            _hist_merge(old, false);
         }
-    } else {
-        if (us != NULL) {
-            delete us;
-            delete ms;
-            delete sec;
-            us = NULL;
-            ms = NULL;
-            sec = NULL;
+    } else
+        _hist_free();
+}
+
+// Return the buckets of a magnitude, allocating them if needed.  The buckets
+// are cleared before they're published to other threads.
+uint32_t *Track::_hist_block(int mag) {
+    uint32_t *block;
+
+    if ((block = _hist[mag]) == NULL) {
+        block = new uint32_t[hist_block_size(_sub_bits, mag)];
+        memset(block, 0, sizeof(uint32_t) * hist_block_size(_sub_bits, mag));
+        workgen_write_barrier();
+        _hist[mag] = block;
+    }
+    return (block);
+}
+
+void Track::_hist_free() {
+    if (_hist != NULL) {
+        for (int mag = 0; mag < hist_magnitudes(_sub_bits); mag++)
+            delete[] _hist[mag];
+        delete[] _hist;
+        _hist = NULL;
+    }
+}
+
+void Track::_hist_init(int digits) {
+    uint64_t need = 2;
+
+    ASSERT(_hist == NULL);
+    for (int i = 0; i < digits; i++)
+        need *= 10;
+    _digits = digits;
+    for (_sub_bits = 1; ((uint64_t)1 << _sub_bits) < need; _sub_bits++)
+        ;
+    _hist = new uint32_t *[hist_magnitudes(_sub_bits)];
+    memset(_hist, 0, sizeof(uint32_t *) * hist_magnitudes(_sub_bits));
+}
+
+// Add (or subtract) another histogram's buckets into ours.  Histograms with
+// different precision are merged by the lowest latency of each bucket.
+void Track::_hist_merge(const Track &other, bool subtract) {
+    const uint32_t *oblock;
+    uint32_t *block, idx;
+    int mag;
+
+    for (int omag = 0; omag < hist_magnitudes(other._sub_bits); omag++) {
+        if ((oblock = other._hist[omag]) == NULL)
+            continue;
+        uint32_t n = hist_block_size(other._sub_bits, omag);
+        if (other._sub_bits == _sub_bits) {
+            block = _hist_block(omag);
+            if (subtract)
+                for (uint32_t i = 0; i < n; i++)
+                    block[i] -= oblock[i];
+            else
+                for (uint32_t i = 0; i < n; i++)
+                    block[i] += oblock[i];
+        } else
+            for (uint32_t i = 0; i < n; i++) {
+                if (oblock[i] == 0)
+                    continue;
+                hist_index(_sub_bits,
+                  hist_value(other._sub_bits, omag, i), &mag, &idx);
+                if (subtract)
+                    _hist_block(mag)[idx] -= oblock[i];
+                else
+                    _hist_block(mag)[idx] += oblock[i];
+            }
+    }
+}
+
+// The number of non-empty histogram buckets.
+int Track::_hist_count() const {
+    int count = 0;
+
+    if (_hist != NULL)
+        for (int mag = 0; mag < hist_magnitudes(_sub_bits); mag++)
+            if (_hist[mag] != NULL)
+                for (uint32_t i = 0; i < hist_block_size(_sub_bits, mag); i++)
+                    if (_hist[mag][i] != 0)
+                        count++;
+    return (count);
+}
+
+// Get up to n non-empty histogram buckets, as the lowest latency of each
+// bucket and its count.  Unused entries are zeroed.
+void Track::_get_hist(long *values, long *counts, int n) const {
+    int count = 0;
+
+    if (_hist != NULL)
+        for (int mag = 0; mag < hist_magnitudes(_sub_bits); mag++) {
+            if (_hist[mag] == NULL)
+                continue;
+            for (uint32_t i = 0; i < hist_block_size(_sub_bits, mag) &&
+              count < n; i++)
+                if (_hist[mag][i] != 0) {
+                    values[count] = (long)hist_value(_sub_bits, mag, i);
+                    counts[count] = (long)_hist[mag][i];
+                    count++;
+                }
+        }
+    for (; count < n; count++)
+        values[count] = counts[count] = 0;
+}
+
+// The us, ms and sec arrays are views of the histogram with fixed-size
+// buckets, each histogram bucket counted where its lowest latency falls.
+void Track::_get_linear(long *result, uint64_t low, uint64_t high,
+  uint64_t unit, int n) const {
+    uint64_t value, slot;
+
+    memset(result, 0, sizeof(long) * n);
+    if (_hist == NULL)
+        return;
+    for (int mag = 0; mag < hist_magnitudes(_sub_bits); mag++) {
+        if (_hist[mag] == NULL)
+            continue;
+        for (uint32_t i = 0; i < hist_block_size(_sub_bits, mag); i++) {
+            value = hist_value(_sub_bits, mag, i);
+            if (_hist[mag][i] == 0 || value < low || value >= high)
+                continue;
+            slot = MIN(value / unit, (uint64_t)n - 1);
+            result[slot] += (long)_hist[mag][i];
         }
     }
 }
 
 void Track::_get_us(long *result) {
-    if (us != NULL) {
-        for (int i = 0; i < LATENCY_US_BUCKETS; i++)
-            result[i] = (long)us[i];
-    } else
-        memset(result, 0, sizeof(long) * LATENCY_US_BUCKETS);
+    _get_linear(result, 0, LATENCY_US_BUCKETS, 1, LATENCY_US_BUCKETS);
 }
 void Track::_get_ms(long *result) {
-    if (ms != NULL) {
-        for (int i = 0; i < LATENCY_MS_BUCKETS; i++)
-            result[i] = (long)ms[i];
-    } else
-        memset(result, 0, sizeof(long) * LATENCY_MS_BUCKETS);
+    _get_linear(result, ms_to_us(1), ms_to_us(LATENCY_MS_BUCKETS),
+      ms_to_us(1), LATENCY_MS_BUCKETS);
 }
 void Track::_get_sec(long *result) {
-    if (sec != NULL) {
-        for (int i = 0; i < LATENCY_SEC_BUCKETS; i++)
-            result[i] = (long)sec[i];
-    } else
-        memset(result, 0, sizeof(long) * LATENCY_SEC_BUCKETS);
+    _get_linear(result, sec_to_us(1), UINT64_MAX, sec_to_us(1),
+      LATENCY_SEC_BUCKETS);
 }
 
 Stats::Stats(bool latency) : checkpoint(latency), insert(latency),
-    not_found(latency), read(latency), remove(latency), update(latency),
-    truncate(latency) {
+    modify(latency), not_found(latency), read(latency), remove(latency),
+    scan(latency), update(latency), truncate(latency) {
 }
 
 Stats::Stats(const Stats &other) : checkpoint(other.checkpoint),
-    insert(other.insert), not_found(other.not_found), read(other.read),
-    remove(other.remove), update(other.update), truncate(other.truncate) {
+    insert(other.insert), modify(other.modify), not_found(other.not_found),
+    read(other.read), remove(other.remove), scan(other.scan),
+    update(other.update), truncate(other.truncate) {
 }
 
 Stats::~Stats() {}
@@ -1714,9 +2371,11 @@ Stats::~Stats() {}
 void Stats::add(Stats &other, bool reset) {
     checkpoint.add(other.checkpoint, reset);
     insert.add(other.insert, reset);
+    modify.add(other.modify, reset);
     not_found.add(other.not_found, reset);
     read.add(other.read, reset);
     remove.add(other.remove, reset);
+    scan.add(other.scan, reset);
     update.add(other.update, reset);
     truncate.add(other.truncate, reset);
 }
@@ -1724,9 +2383,11 @@ void Stats::add(Stats &other, bool reset) {
 void Stats::assign(const Stats &other) {
     checkpoint.assign(other.checkpoint);
     insert.assign(other.insert);
+    modify.assign(other.modify);
     not_found.assign(other.not_found);
     read.assign(other.read);
     remove.assign(other.remove);
+    scan.assign(other.scan);
     update.assign(other.update);
     truncate.assign(other.truncate);
 }
@@ -1734,9 +2395,11 @@ void Stats::assign(const Stats &other) {
 void Stats::clear() {
     checkpoint.clear();
     insert.clear();
+    modify.clear();
     not_found.clear();
     read.clear();
     remove.clear();
+    scan.clear();
     update.clear();
     truncate.clear();
 }
@@ -1748,8 +2411,10 @@ void Stats::describe(std::ostream &os) const {
     }
     os << ", inserts " << insert.ops;
     os << ", updates " << update.ops;
+    os << ", modifies " << modify.ops;
     os << ", truncates " << truncate.ops;
     os << ", removes " << remove.ops;
+    os << ", scans " << scan.ops;
     os << ", checkpoints " << checkpoint.ops;
 }
 
@@ -1760,8 +2425,10 @@ void Stats::final_report(std::ostream &os, timespec &totalsecs) const {
     ops += not_found.ops;
     ops += insert.ops;
     ops += update.ops;
+    ops += modify.ops;
     ops += truncate.ops;
     ops += remove.ops;
+    ops += scan.ops;
 
 #define FINAL_OUTPUT(os, field, singular, ops, totalsecs)               \
     os << "Executed " << field << " " #singular " operations ("         \
@@ -1772,8 +2439,13 @@ void Stats::final_report(std::ostream &os, timespec &totalsecs) const {
     FINAL_OUTPUT(os, not_found.ops, not found, ops, totalsecs);
     FINAL_OUTPUT(os, insert.ops, insert, ops, totalsecs);
     FINAL_OUTPUT(os, update.ops, update, ops, totalsecs);
+    FINAL_OUTPUT(os, modify.ops, modify, ops, totalsecs);
     FINAL_OUTPUT(os, truncate.ops, truncate, ops, totalsecs);
     FINAL_OUTPUT(os, remove.ops, remove, ops, totalsecs);
+    FINAL_OUTPUT(os, scan.ops, scan, ops, totalsecs);
+    if (scan.ops > 0)
+        os << "Scanned " << scan.rows << " rows, "
+           << OPS_PER_SEC(scan.rows, totalsecs) << " rows/sec" << std::endl;
     FINAL_OUTPUT(os, checkpoint.ops, checkpoint, ops, totalsecs);
 }
 
@@ -1784,29 +2456,35 @@ void Stats::report(std::ostream &os) const {
     }
     os << ", " << insert.ops << " inserts, ";
     os << update.ops << " updates, ";
+    os << modify.ops << " modifies, ";
     os << truncate.ops << " truncates, ";
     os << remove.ops << " removes, ";
+    os << scan.ops << " scans, ";
     os << checkpoint.ops << " checkpoints";
 }
 
 void Stats::subtract(const Stats &other) {
     checkpoint.subtract(other.checkpoint);
     insert.subtract(other.insert);
+    modify.subtract(other.modify);
     not_found.subtract(other.not_found);
     read.subtract(other.read);
     remove.subtract(other.remove);
+    scan.subtract(other.scan);
     update.subtract(other.update);
     truncate.subtract(other.truncate);
 }
 
-void Stats::track_latency(bool latency) {
-    checkpoint.track_latency(latency);
-    insert.track_latency(latency);
-    not_found.track_latency(latency);
-    read.track_latency(latency);
-    remove.track_latency(latency);
-    update.track_latency(latency);
-    truncate.track_latency(latency);
+void Stats::track_latency(bool latency, int digits) {
+    checkpoint.track_latency(latency, digits);
+    insert.track_latency(latency, digits);
+    modify.track_latency(latency, digits);
+    not_found.track_latency(latency, digits);
+    read.track_latency(latency, digits);
+    remove.track_latency(latency, digits);
+    scan.track_latency(latency, digits);
+    update.track_latency(latency, digits);
+    truncate.track_latency(latency, digits);
 }
 
 TableOptions::TableOptions() : key_size(0), value_size(0),
@@ -1854,10 +2532,14 @@ TableInternal::TableInternal(const TableInternal &other) : _tint(other._tint),
     _context_count(other._context_count) {}
 TableInternal::~TableInternal() {}
 
-WorkloadOptions::WorkloadOptions() : max_latency(0),
+WorkloadOptions::WorkloadOptions() : latency_digits(2), max_latency(0),
     report_file("workload.stat"), report_interval(0), run_time(0),
     sample_file("monitor.json"), sample_interval_ms(0), sample_rate(1),
     warmup(0), _options() {
+    _options.add_int("latency_digits", latency_digits,
+      "significant decimal digits kept by latency histograms, from 1 to 4. "
+      "Each extra digit gives percentiles ten times the precision, "
+      "at the cost of more memory per thread.");
     _options.add_int("max_latency", max_latency,
       "prints warning if any latency measured exceeds this number of "
       "milliseconds. Requires sample_interval to be configured.");
@@ -1884,7 +2566,8 @@ WorkloadOptions::WorkloadOptions() : max_latency(0),
 }
 
 WorkloadOptions::WorkloadOptions(const WorkloadOptions &other) :
-    max_latency(other.max_latency), report_interval(other.report_interval),
+    latency_digits(other.latency_digits), max_latency(other.max_latency),
+    report_interval(other.report_interval),
     run_time(other.run_time), sample_interval_ms(other.sample_interval_ms),
     sample_rate(other.sample_rate), _options(other._options) {}
 WorkloadOptions::~WorkloadOptions() {}
@@ -1936,6 +2619,10 @@ int WorkloadRunner::run(WT_CONNECTION *conn) {
     _wt_home = conn->get_home(conn);
     if (options->sample_interval_ms > 0 && options->sample_rate <= 0)
         THROW("Workload.options.sample_rate must be positive");
+    if (options->latency_digits < 1 ||
+      options->latency_digits > LATENCY_DIGITS_MAX)
+        THROW("Workload.options.latency_digits must be between 1 and "
+          << LATENCY_DIGITS_MAX);
     if (!options->report_file.empty()) {
         open_report_file(report_out, options->report_file.c_str(),
           "Workload.options.report_file");
@@ -2008,7 +2695,9 @@ void WorkloadRunner::get_stats(Stats *result) {
 void WorkloadRunner::report(time_t interval, time_t totalsecs,
   Stats *prev_totals) {
     std::ostream &out = *_report_out;
-    Stats new_totals(prev_totals->track_latency());
+    Stats new_totals;
+    new_totals.track_latency(prev_totals->track_latency(),
+      _workload->options.latency_digits);
 
     get_stats(&new_totals);
     Stats diff(new_totals);
@@ -2024,7 +2713,8 @@ void WorkloadRunner::final_report(timespec &totalsecs) {
     Stats *stats = &_workload->stats;
 
     stats->clear();
-    stats->track_latency(_workload->options.sample_interval_ms > 0);
+    stats->track_latency(_workload->options.sample_interval_ms > 0,
+      _workload->options.latency_digits);
 
     get_stats(stats);
     stats->final_report(out, totalsecs);
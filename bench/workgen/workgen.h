@@ -89,6 +89,8 @@ struct Track {
     uint64_t rollbacks;                 // Total operations rolled back */
     uint64_t latency_ops;               // Total ops sampled for latency
     uint64_t latency;                   // Total latency */
+    uint64_t queue_latency;             // Total of latency spent queued
+    uint64_t rows;                      // Total rows read by scans
     uint64_t bucket_ops;                // Computed for percentile_latency
 
     // Minimum/maximum latency, shared with the monitor thread, that is, the
@@ -96,6 +98,7 @@ struct Track {
 
     uint32_t min_latency;                // Minimum latency (uS)
     uint32_t max_latency;                // Maximum latency (uS)
+    uint32_t max_queue_latency;          // Maximum latency spent queued (uS)
 
     Track(bool latency_tracking = false);
     Track(const Track &other);
@@ -104,24 +107,38 @@ struct Track {
     void add(Track&, bool reset = false);
     void assign(const Track&);
     uint64_t average_latency() const;
+    uint64_t average_queue_latency() const;
+    uint64_t average_service_latency() const;
     void begin();
     void clear();
     void complete();
-    void complete_with_latency(uint64_t usecs);
-    uint64_t percentile_latency(int percent) const;
+    void complete_with_latency(uint64_t usecs, uint64_t queue_usecs = 0);
+    uint64_t percentile_latency(double percent) const;
     void subtract(const Track&);
-    void track_latency(bool);
-    bool track_latency() const { return (us != NULL); }
+    void track_latency(bool, int digits = 2);
+    bool track_latency() const { return (_hist != NULL); }
+    int latency_digits() const { return (_digits); }
 
+    int _hist_count() const;
+    void _get_hist(long *values, long *counts, int n) const;
     void _get_us(long *);
     void _get_ms(long *);
     void _get_sec(long *);
 
 private:
-    // Latency buckets. From python, accessed via methods us(), ms(), sec()
-    uint32_t *us;                        // < 1us ... 1000us
-    uint32_t *ms;                        // < 1ms ... 1000ms
-    uint32_t *sec;                       // < 1s 2s ... 100s
+    // Latency histogram, log-linear with _digits significant decimal digits.
+    // Indexed by magnitude, each magnitude's buckets are allocated when first
+    // used. From python, accessed via methods histogram(), us(), ms(), sec()
+    uint32_t **_hist;
+    int _digits;                         // Significant decimal digits
+    int _sub_bits;                       // log2 of magnitude 0 bucket count
+
+    uint32_t *_hist_block(int mag);
+    void _hist_free();
+    void _hist_init(int digits);
+    void _hist_merge(const Track &other, bool subtract);
+    void _get_linear(long *result, uint64_t low, uint64_t high,
+      uint64_t unit, int n) const;
 
     Track & operator=(const Track &other);   // use explicit assign method
 };
@@ -129,9 +146,11 @@ private:
 struct Stats {
     Track checkpoint;
     Track insert;
+    Track modify;
     Track not_found;
     Track read;
     Track remove;
+    Track scan;
     Track update;
     Track truncate;
 
@@ -148,7 +167,7 @@ struct Stats {
     void report(std::ostream &os) const;
 #endif
     void subtract(const Stats&);
-    void track_latency(bool);
+    void track_latency(bool, int digits = 2);
     bool track_latency() const { return (insert.track_latency()); }
 
 private:
@@ -249,20 +268,79 @@ private:
     OptionsList _options;
 };
 
+struct ZipfianOptions {
+    double theta;
+    bool scramble;
+    ZipfianOptions(double theta = 0.99);
+    ZipfianOptions(const ZipfianOptions &other);
+    ~ZipfianOptions();
+
+    void describe(std::ostream &os) const {
+	os << "theta " << theta;
+	if (scramble)
+	    os << ", scrambled";
+    }
+
+    std::string help() const { return _options.help(); }
+    std::string help_description(const char *option_name) const {
+	return _options.help_description(option_name); }
+    std::string help_type(const char *option_name) const {
+	return _options.help_type(option_name); }
+
+    static ZipfianOptions DEFAULT;
+private:
+    OptionsList _options;
+};
+
+struct HotspotOptions {
+    double hot_set;
+    double hot_ops;
+    HotspotOptions(double hot_set = 0.2, double hot_ops = 0.8);
+    HotspotOptions(const HotspotOptions &other);
+    ~HotspotOptions();
+
+    void describe(std::ostream &os) const {
+	os << "hot_set " << hot_set << ", hot_ops " << hot_ops;
+    }
+
+    std::string help() const { return _options.help(); }
+    std::string help_description(const char *option_name) const {
+	return _options.help_description(option_name); }
+    std::string help_type(const char *option_name) const {
+	return _options.help_type(option_name); }
+
+    static HotspotOptions DEFAULT;
+private:
+    OptionsList _options;
+};
+
 struct Key {
     typedef enum {
-	KEYGEN_AUTO, KEYGEN_APPEND, KEYGEN_PARETO, KEYGEN_UNIFORM } KeyType;
+	KEYGEN_AUTO, KEYGEN_APPEND, KEYGEN_PARETO, KEYGEN_UNIFORM,
+	KEYGEN_ZIPFIAN, KEYGEN_HOTSPOT, KEYGEN_LATEST, KEYGEN_SEQUENTIAL
+    } KeyType;
     KeyType _keytype;
     int _size;
     ParetoOptions _pareto;
+    ZipfianOptions _zipfian;		// used by KEYGEN_ZIPFIAN, KEYGEN_LATEST
+    HotspotOptions _hotspot;
 
     /* XXX specify more about key distribution */
-    Key() : _keytype(KEYGEN_AUTO), _size(0), _pareto(ParetoOptions::DEFAULT) {}
+    Key() : _keytype(KEYGEN_AUTO), _size(0), _pareto(ParetoOptions::DEFAULT),
+	_zipfian(ZipfianOptions::DEFAULT), _hotspot(HotspotOptions::DEFAULT) {}
     Key(KeyType keytype, int size=0,
       const ParetoOptions &pareto=ParetoOptions::DEFAULT) :
-	_keytype(keytype), _size(size), _pareto(pareto) {}
+	_keytype(keytype), _size(size), _pareto(pareto),
+	_zipfian(ZipfianOptions::DEFAULT), _hotspot(HotspotOptions::DEFAULT) {}
+    Key(KeyType keytype, int size, const ZipfianOptions &zipfian) :
+	_keytype(keytype), _size(size), _pareto(ParetoOptions::DEFAULT),
+	_zipfian(zipfian), _hotspot(HotspotOptions::DEFAULT) {}
+    Key(KeyType keytype, int size, const HotspotOptions &hotspot) :
+	_keytype(keytype), _size(size), _pareto(ParetoOptions::DEFAULT),
+	_zipfian(ZipfianOptions::DEFAULT), _hotspot(hotspot) {}
     Key(const Key &other) : _keytype(other._keytype), _size(other._size),
-	_pareto(other._pareto) {}
+	_pareto(other._pareto), _zipfian(other._zipfian),
+	_hotspot(other._hotspot) {}
     ~Key() {}
 
     void describe(std::ostream &os) const {
@@ -281,16 +359,70 @@ struct Value {
     void describe(std::ostream &os) const { os << "Value: size " << _size; }
 };
 
+struct ScanOptions {
+    int length;
+    int length_max;
+    std::string length_distribution;
+    bool reverse;
+    ScanOptions(int length = 100);
+    ScanOptions(const ScanOptions &other);
+    ~ScanOptions();
+
+    void describe(std::ostream &os) const {
+	os << "length " << length;
+	if (length_max > length)
+	    os << "-" << length_max << " " << length_distribution;
+	if (reverse)
+	    os << ", reverse";
+    }
+
+    std::string help() const { return _options.help(); }
+    std::string help_description(const char *option_name) const {
+	return _options.help_description(option_name); }
+    std::string help_type(const char *option_name) const {
+	return _options.help_type(option_name); }
+
+    static ScanOptions DEFAULT;
+private:
+    OptionsList _options;
+};
+
+struct ModifyOptions {
+    int count;
+    int size;
+    std::string placement;
+    ModifyOptions(int count = 1, int size = 10);
+    ModifyOptions(const ModifyOptions &other);
+    ~ModifyOptions();
+
+    void describe(std::ostream &os) const {
+	os << "count " << count << ", size " << size << ", placement "
+	   << placement;
+    }
+
+    std::string help() const { return _options.help(); }
+    std::string help_description(const char *option_name) const {
+	return _options.help_description(option_name); }
+    std::string help_type(const char *option_name) const {
+	return _options.help_type(option_name); }
+
+    static ModifyOptions DEFAULT;
+private:
+    OptionsList _options;
+};
+
 struct Operation {
     enum OpType {
-	OP_CHECKPOINT, OP_INSERT, OP_LOG_FLUSH, OP_NONE, OP_NOOP,
-	OP_REMOVE, OP_SEARCH, OP_SLEEP, OP_UPDATE };
+	OP_CHECKPOINT, OP_INSERT, OP_LOG_FLUSH, OP_MODIFY, OP_NONE, OP_NOOP,
+	OP_REMOVE, OP_SCAN, OP_SEARCH, OP_SLEEP, OP_UPDATE };
     OpType _optype;
     OperationInternal *_internal;
 
     Table _table;
     Key _key;
     Value _value;
+    ScanOptions _scan;			// used by OP_SCAN
+    ModifyOptions _modify;		// used by OP_MODIFY
     std::string _config;
     Transaction *_transaction;
     std::vector<Operation> *_group;
@@ -330,6 +462,7 @@ struct Operation {
 //
 struct ThreadOptions {
     std::string name;
+    std::string arrival;
     double throttle;
     double throttle_burst;
     bool synchronized;
@@ -342,6 +475,8 @@ struct ThreadOptions {
 	os << "throttle " << throttle;
 	os << ", throttle_burst " << throttle_burst;
 	os << ", synchronized " << synchronized;
+	if (!arrival.empty())
+	    os << ", arrival " << arrival;
     }
 
     std::string help() const { return _options.help(); }
@@ -406,6 +541,7 @@ struct Transaction {
 // properties are prevented, only existing properties can be set.
 //
 struct WorkloadOptions {
+    int latency_digits;
     int max_latency;
     std::string report_file;
     int report_interval;
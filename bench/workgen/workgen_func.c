@@ -49,6 +49,12 @@ workgen_atomic_add64(uint64_t *vp, uint64_t v)
     return (__wt_atomic_add64(vp, v));
 }
 
+void
+workgen_write_barrier(void)
+{
+    WT_WRITE_BARRIER();
+}
+
 void
 workgen_epoch(struct timespec *tsp)
 {
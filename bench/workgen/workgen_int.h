@@ -87,6 +87,26 @@ struct Throttle {
     int throttle(uint64_t op_count, uint64_t *op_limit);
 };
 
+// Open-loop operation arrivals, used instead of a Throttle when
+// Thread.options.arrival is set.  Operations are scheduled to start at a
+// fixed rate, whether or not earlier operations have finished, so a stalled
+// operation delays the start of later ones, and that delay is part of their
+// latency.
+struct Arrivals {
+    ThreadRunner &_runner;
+    double _rate;                              // operations per second
+    bool _poisson;                             // else constant intervals
+    double _next_us;                           // next intended start time
+    bool _started;
+
+    Arrivals(ThreadRunner &runner, double rate, bool poisson);
+    ~Arrivals();
+
+    // Sleeps until the next operation is scheduled to start, and returns its
+    // intended start time.  Returns immediately if the thread is behind.
+    uint64_t arrive();
+};
+
 // There is one of these per Thread object.  It exists for the duration of a
 // call to Workload::run() method.
 struct ThreadRunner {
@@ -99,6 +119,7 @@ struct ThreadRunner {
     WorkloadRunner *_wrunner;
     workgen_random_state *_rand_state;
     Throttle *_throttle;
+    Arrivals *_arrivals;
     uint64_t _throttle_ops;
     uint64_t _throttle_limit;
     uint64_t _start_time_us;
@@ -115,6 +136,7 @@ struct ThreadRunner {
     WT_SESSION *_session;
     char *_keybuf;
     char *_valuebuf;
+    std::vector<WT_MODIFY> _modifies;              // used by OP_MODIFY
     bool _repeat;
 
     ThreadRunner();
@@ -129,10 +151,15 @@ struct ThreadRunner {
     int open_all();
     int run();
 
-    void op_create_all(Operation *, size_t &keysize, size_t &valuesize);
+    void op_create_all(Operation *, size_t &keysize, size_t &valuesize,
+      const Transaction *);
     uint64_t op_get_key_recno(Operation *, uint64_t range, tint_t tint);
     void op_get_static_counts(Operation *, Stats &, int);
+    int op_modify(Operation *, WT_CURSOR *);
     int op_run(Operation *);
+    int op_scan(Operation *, WT_CURSOR *, uint64_t length, uint64_t *rowsp);
+    uint64_t op_scan_length(Operation *);
+    double random_double();
     float random_signed();
     uint32_t random_value();
 
@@ -161,9 +188,10 @@ struct Monitor {
 
 struct TableRuntime {
     uint64_t _max_recno;                           // highest recno allocated
+    uint64_t _sequential;                          // KEYGEN_SEQUENTIAL count
     bool _disjoint;                                // does key space have holes?
 
-    TableRuntime() : _max_recno(0), _disjoint(0) {}
+    TableRuntime() : _max_recno(0), _sequential(0), _disjoint(0) {}
 };
 
 struct ContextInternal {
@@ -212,13 +240,16 @@ struct TableOperationInternal : OperationInternal {
     uint_t _valuesize;
     uint_t _keymax;
     uint_t _valuemax;
+    std::vector<double> _zeta;  // zipfian partial sums, see zipfian_zeta
+    std::vector<double> _scan_zeta;     // the same, for scan lengths
 
     TableOperationInternal() : OperationInternal(), _keysize(0), _valuesize(0),
-			       _keymax(0),_valuemax(0) {}
+			       _keymax(0),_valuemax(0), _zeta(), _scan_zeta() {}
     TableOperationInternal(const TableOperationInternal &other) :
 	OperationInternal(other),
 	_keysize(other._keysize), _valuesize(other._valuesize),
-	_keymax(other._keymax), _valuemax(other._valuemax) {}
+	_keymax(other._keymax), _valuemax(other._valuemax),
+	_zeta(other._zeta), _scan_zeta(other._scan_zeta) {}
     virtual void parse_config(const std::string &config);
 };
 
@@ -55,6 +55,7 @@ def main():
     print_file_stats(session)
     print_overflow_pages(session)
     print_derived_stats(session)
+    print_snapshot_delta(session)
     conn.close()
 
 def print_database_stats(session):
@@ -92,6 +93,17 @@ def print_derived_stats(session):
         print("Write amplification is " + '{:.2f}'.format(fs_writes / (app_insert + app_remove + app_update)))
     dstatcursor.close()
 
+def print_snapshot_delta(session):
+    # Read every statistic at once, then again after some inserts.
+    before = session.stat_snapshot("table:access")
+    cursor = session.open_cursor('table:access', None)
+    for i in range(100):
+        cursor['key%d' % i] = 'value'
+    cursor.close()
+    after = session.stat_snapshot("table:access")
+    delta = stat.delta(before, after)
+    print("Inserts: " + str(delta[stat.dsrc.cursor_insert]))
+
 def print_cursor(mycursor):
     while mycursor.next() == 0:
         val = mycursor.get_value()
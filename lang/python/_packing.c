@@ -0,0 +1,697 @@
+/*-
+ * Public Domain 2014-2019 MongoDB, Inc.
+ * Public Domain 2008-2014 WiredTiger, Inc.
+ *
+ * This is free and unencumbered software released into the public domain.
+ *
+ * Anyone is free to copy, modify, publish, use, compile, sell, or
+ * distribute this software, either in source code form or as a compiled
+ * binary, for any purpose, commercial or non-commercial, and by any
+ * means.
+ *
+ * In jurisdictions that recognize copyright laws, the author or authors
+ * of this software dedicate any and all copyright interest in the
+ * software to the public domain. We make this dedication for the benefit
+ * of the public at large and to the detriment of our heirs and
+ * successors. We intend this dedication to be an overt act of
+ * relinquishment in perpetuity of all present and future rights to this
+ * software under copyright law.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+ * IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+ * OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ * ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+ * OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+/*
+ * _packing.c
+ *	Optional compiled implementation of the wiredtiger.packing and
+ * wiredtiger.intpacking functions.
+ *
+ * The functions here follow the pure Python versions in packing.py and
+ * intpacking.py step for step, and must produce byte-identical results:
+ * packing.py only uses this module when it has been built.  Integers are
+ * encoded with the engine's own inline variable-length integer routines,
+ * so there's no need to link against the WiredTiger library.
+ */
+#define	PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include "src/include/wt_internal.h"
+
+/*
+ * Python3 unpacks strings to str, Python2 leaves them as bytes; see the
+ * _string_result function in packutil.py.
+ */
+#if PY_MAJOR_VERSION >= 3
+#define	PACK_STRING_RESULT(p, len)					\
+	PyUnicode_DecodeUTF8((const char *)(p), (Py_ssize_t)(len), NULL)
+#define	PACK_BYTES_FORMAT	"y#"
+#else
+#define	PACK_STRING_RESULT(p, len)					\
+	PyBytes_FromStringAndSize((const char *)(p), (Py_ssize_t)(len))
+#define	PACK_BYTES_FORMAT	"s#"
+#define	PyUnicode_GetLength(s)	PyUnicode_GET_SIZE(s)
+#define	PyUnicode_Substring(s, start, end)				\
+	PySequence_GetSlice(s, start, end)
+#endif
+
+/*
+ * PACK_BUF --
+ *	A growable output buffer.
+ */
+typedef struct {
+	uint8_t *mem;
+	size_t len, memsize;
+	uint8_t stackmem[256];
+} PACK_BUF;
+
+/*
+ * buf_init --
+ *	Initialize an output buffer.
+ */
+static void
+buf_init(PACK_BUF *buf)
+{
+	buf->mem = buf->stackmem;
+	buf->len = 0;
+	buf->memsize = sizeof(buf->stackmem);
+}
+
+/*
+ * buf_free --
+ *	Discard an output buffer.
+ */
+static void
+buf_free(PACK_BUF *buf)
+{
+	if (buf->mem != buf->stackmem)
+		PyMem_Free(buf->mem);
+	buf->mem = NULL;
+}
+
+/*
+ * buf_reserve --
+ *	Make sure there is room for another len bytes in the buffer.
+ */
+static int
+buf_reserve(PACK_BUF *buf, size_t len)
+{
+	size_t memsize;
+	uint8_t *mem;
+
+	if (buf->len + len <= buf->memsize)
+		return (0);
+	for (memsize = buf->memsize * 2; memsize < buf->len + len;)
+		memsize *= 2;
+	if ((mem = PyMem_Malloc(memsize)) == NULL) {
+		PyErr_NoMemory();
+		return (-1);
+	}
+	memcpy(mem, buf->mem, buf->len);
+	if (buf->mem != buf->stackmem)
+		PyMem_Free(buf->mem);
+	buf->mem = mem;
+	buf->memsize = memsize;
+	return (0);
+}
+
+/*
+ * buf_append --
+ *	Append bytes to the buffer, NULL data appends zero bytes.
+ */
+static int
+buf_append(PACK_BUF *buf, const void *data, size_t len)
+{
+	if (buf_reserve(buf, len) != 0)
+		return (-1);
+	if (data == NULL)
+		memset(buf->mem + buf->len, 0, len);
+	else if (len != 0)
+		memcpy(buf->mem + buf->len, data, len);
+	buf->len += len;
+	return (0);
+}
+
+/*
+ * pack_int_obj --
+ *	Append the variable-length encoding of a Python integer.
+ */
+static int
+pack_int_obj(PACK_BUF *buf, PyObject *obj)
+{
+	PyObject *index;
+	unsigned long long uval;
+	long long sval;
+	uint8_t *p;
+	int overflow, ret;
+
+	if ((index = PyNumber_Index(obj)) == NULL)
+		return (-1);
+	sval = PyLong_AsLongLongAndOverflow(index, &overflow);
+	uval = 0;
+	if (overflow > 0)
+		uval = PyLong_AsUnsignedLongLong(index);
+	Py_DECREF(index);
+	if (overflow < 0) {
+		PyErr_SetString(PyExc_OverflowError,
+		    "value out of range for integer encoding");
+		return (-1);
+	}
+	if (PyErr_Occurred() != NULL)
+		return (-1);
+
+	if (buf_reserve(buf, WT_INTPACK64_MAXSIZE) != 0)
+		return (-1);
+	p = buf->mem + buf->len;
+	ret = overflow > 0 ?
+	    __wt_vpack_uint(&p, WT_INTPACK64_MAXSIZE, (uint64_t)uval) :
+	    __wt_vpack_int(&p, WT_INTPACK64_MAXSIZE, (int64_t)sval);
+	if (ret != 0) {
+		PyErr_SetString(PyExc_ValueError, "integer encoding failed");
+		return (-1);
+	}
+	buf->len = (size_t)(p - buf->mem);
+	return (0);
+}
+
+/*
+ * unpack_int_obj --
+ *	Decode a variable-length integer into a Python integer.
+ */
+static PyObject *
+unpack_int_obj(const uint8_t **pp, const uint8_t *end)
+{
+	uint64_t uval;
+	int64_t sval;
+	int ret;
+
+	/* A zero length means "unlimited" to the engine's routines. */
+	if (*pp >= end) {
+		PyErr_SetString(PyExc_IndexError, "index out of range");
+		return (NULL);
+	}
+	/*
+	 * Python integers aren't limited to 64 bits: decode the positive
+	 * encodings as unsigned so large unsigned values come back intact.
+	 */
+	if (**pp >= POS_1BYTE_MARKER) {
+		if ((ret = __wt_vunpack_uint(
+		    pp, (size_t)(end - *pp), &uval)) == 0)
+			return (PyLong_FromUnsignedLongLong(uval));
+	} else if ((ret = __wt_vunpack_int(
+	    pp, (size_t)(end - *pp), &sval)) == 0)
+		return (PyLong_FromLongLong(sval));
+
+	PyErr_SetString(PyExc_ValueError,
+	    "invalid or truncated variable-length integer");
+	return (NULL);
+}
+
+/*
+ * slice_len --
+ *	Return the length of s[:size] for a buffer of len bytes, following
+ * Python's slicing rules.
+ */
+static size_t
+slice_len(Py_ssize_t size, size_t len)
+{
+	if (size < 0)
+		size += (Py_ssize_t)len;
+	if (size < 0)
+		return (0);
+	return ((size_t)size > len ? len : (size_t)size);
+}
+
+/*
+ * format_type --
+ *	Strip and check the leading format type character, matching the
+ * Python __get_type function.
+ */
+static int
+format_type(const char **fmtp, Py_ssize_t *lenp)
+{
+	if (*lenp > 0 &&
+	    **fmtp != '\0' && strchr(".@<>", **fmtp) != NULL) {
+		if (**fmtp != '.' && *lenp > 1) {
+			PyErr_SetString(PyExc_ValueError,
+			    "Only variable-length encoding is currently "
+			    "supported");
+			return (-1);
+		}
+		++*fmtp;
+		--*lenp;
+	}
+	return (0);
+}
+
+PyDoc_STRVAR(packing_unpack_doc,
+"unpack(fmt, s) -> list\n\n"
+"Unpack the values in s according to the format string fmt.");
+
+static PyObject *
+packing_unpack(PyObject *self, PyObject *args)
+{
+	Py_buffer view;
+	Py_ssize_t fmtlen, i, size;
+	PyObject *obj, *result, *sobj;
+	size_t len;
+	const uint8_t *end, *p, *nul;
+	const char *fmt;
+	char f;
+	int havesize;
+
+	WT_UNUSED(self);
+
+	if (!PyArg_ParseTuple(args, "s#O:unpack", &fmt, &fmtlen, &sobj))
+		return (NULL);
+	if (format_type(&fmt, &fmtlen) != 0)
+		return (NULL);
+	if (fmtlen == 0)
+		return (PyTuple_New(0));
+
+	/* A WT_ITEM with a NULL data field will appear as None. */
+	if (sobj == Py_None) {
+		view.buf = (void *)"";
+		view.len = 0;
+		view.obj = NULL;
+	} else if (PyObject_GetBuffer(sobj, &view, PyBUF_SIMPLE) != 0)
+		return (NULL);
+	p = view.buf;
+	end = p + view.len;
+
+	if ((result = PyList_New(0)) == NULL)
+		goto err;
+	for (size = 0, havesize = 0, i = 0; i < fmtlen; i++) {
+		f = fmt[i];
+		if (f >= '0' && f <= '9') {
+			size = (size * 10) + (f - '0');
+			havesize = 1;
+			continue;
+		}
+		if (!havesize)
+			size = 1;
+		switch (f) {
+		case 'x':
+			/* Note: no value. */
+			p += slice_len(size, (size_t)(end - p));
+			break;
+		case 'S':
+		case 's':
+		case 'U':
+		case 'u':
+			if (!havesize && f == 'S') {
+				nul = memchr(p, '\0', (size_t)(end - p));
+				size = nul == NULL ? -1 : nul - p;
+			} else if (!havesize && f == 'u' && i == fmtlen - 1)
+				size = end - p;
+			else if (!havesize && f != 's') {
+				/*
+				 * Note: 'U' is used internally, and may be
+				 * exposed to us.  It indicates that the size
+				 * is always stored unless there is a size in
+				 * the format.
+				 */
+				if ((obj = unpack_int_obj(&p, end)) == NULL)
+					goto err;
+				size = PyLong_AsSsize_t(obj);
+				Py_DECREF(obj);
+				if (size == -1 && PyErr_Occurred())
+					goto err;
+			}
+			len = slice_len(size, (size_t)(end - p));
+			if (f == 'S' || f == 's') {
+				obj = PACK_STRING_RESULT(p, len);
+				if (f == 'S' && !havesize)
+					++size;
+			} else
+				obj = PyBytes_FromStringAndSize(
+				    (const char *)p, (Py_ssize_t)len);
+			if (obj == NULL || PyList_Append(result, obj) != 0) {
+				Py_XDECREF(obj);
+				goto err;
+			}
+			Py_DECREF(obj);
+			p += slice_len(size, (size_t)(end - p));
+			break;
+		case 't':
+		case 'B':
+		case 'b':
+			/* Bit type (size is number of bits) and byte types. */
+			if (f == 't')
+				size = 1;
+			for (; size > 0; --size) {
+				if (p >= end) {
+					PyErr_SetString(PyExc_IndexError,
+					    "index out of range");
+					goto err;
+				}
+				obj = PyLong_FromLong(
+				    f == 'b' ? (long)*p - 0x80 : (long)*p);
+				if (obj == NULL ||
+				    PyList_Append(result, obj) != 0) {
+					Py_XDECREF(obj);
+					goto err;
+				}
+				Py_DECREF(obj);
+				++p;
+			}
+			break;
+		default:
+			/* Integral type. */
+			for (; size > 0; --size) {
+				if ((obj = unpack_int_obj(&p, end)) == NULL)
+					goto err;
+				if (PyList_Append(result, obj) != 0) {
+					Py_DECREF(obj);
+					goto err;
+				}
+				Py_DECREF(obj);
+			}
+			break;
+		}
+		size = 0;
+		havesize = 0;
+	}
+
+	if (view.obj != NULL)
+		PyBuffer_Release(&view);
+	return (result);
+
+err:	Py_XDECREF(result);
+	if (view.obj != NULL)
+		PyBuffer_Release(&view);
+	return (NULL);
+}
+
+/*
+ * unicode_find_nul --
+ *	Return the offset of the first NUL character in a str of length len,
+ * or len if there isn't one.
+ */
+static Py_ssize_t
+unicode_find_nul(PyObject *s, Py_ssize_t len)
+{
+#if PY_MAJOR_VERSION >= 3
+	Py_ssize_t l;
+
+	if ((l = PyUnicode_FindChar(s, '\0', 0, len, 1)) == -1)
+		return (len);
+	return (l == -2 ? -1 : l);
+#else
+	Py_UNICODE *p;
+	Py_ssize_t l;
+
+	for (p = PyUnicode_AS_UNICODE(s), l = 0; l < len; ++l)
+		if (p[l] == 0)
+			break;
+	return (l);
+#endif
+}
+
+/*
+ * pack_string --
+ *	Pack a value for one of the 'SsUu' formats.
+ */
+static int
+pack_string(PACK_BUF *buf, PyObject *val, char f, int havesize,
+    Py_ssize_t size, int last)
+{
+	Py_buffer view;
+	PyObject *encoded, *lenobj, *substr;
+	Py_ssize_t l;
+	const char *nul;
+	int ret;
+
+	encoded = NULL;
+	view.obj = NULL;
+	ret = -1;
+
+	if (PyUnicode_Check(val)) {
+		if (f != 'S' && f != 's') {
+			PyErr_Format(PyExc_TypeError,
+			    "'%c' format requires a bytes object", f);
+			return (-1);
+		}
+		/* Lengths are in characters, as they are in Python. */
+		l = PyUnicode_GetLength(val);
+		if (f == 'S' && (l = unicode_find_nul(val, l)) < 0)
+			return (-1);
+	} else {
+		if (PyObject_GetBuffer(val, &view, PyBUF_SIMPLE) != 0)
+			return (-1);
+		l = view.len;
+		if (f == 'S' && (nul = memchr(
+		    view.buf, '\0', (size_t)view.len)) != NULL)
+			l = nul - (const char *)view.buf;
+	}
+
+	if (havesize || f == 's') {
+		if (l > size)
+			l = size;
+	} else if ((f == 'u' && !last) || f == 'U') {
+		if ((lenobj = PyLong_FromSsize_t(l)) == NULL)
+			goto err;
+		ret = pack_int_obj(buf, lenobj);
+		Py_DECREF(lenobj);
+		if (ret != 0)
+			goto err;
+		ret = -1;
+	}
+
+	if (view.obj != NULL) {
+		if (buf_append(buf, view.buf, (size_t)l) != 0)
+			goto err;
+	} else {
+		if ((substr = PyUnicode_Substring(val, 0, l)) == NULL)
+			goto err;
+		encoded = PyUnicode_AsUTF8String(substr);
+		Py_DECREF(substr);
+		if (encoded == NULL || buf_append(buf,
+		    PyBytes_AS_STRING(encoded),
+		    (size_t)PyBytes_GET_SIZE(encoded)) != 0)
+			goto err;
+	}
+
+	if (f == 'S' && !havesize) {
+		if (buf_append(buf, NULL, 1) != 0)
+			goto err;
+	} else if (havesize && size > l)
+		if (buf_append(buf, NULL, (size_t)(size - l)) != 0)
+			goto err;
+	ret = 0;
+
+err:	Py_XDECREF(encoded);
+	if (view.obj != NULL)
+		PyBuffer_Release(&view);
+	return (ret);
+}
+
+/*
+ * pack_byte --
+ *	Pack a value for one of the 'tBb' formats.
+ */
+static int
+pack_byte(PACK_BUF *buf, PyObject *val, char f, Py_ssize_t size)
+{
+	long long v;
+	uint8_t byte;
+	int overflow;
+
+	v = PyLong_AsLongLongAndOverflow(val, &overflow);
+	if (v == -1 && PyErr_Occurred())
+		return (-1);
+	if (f == 't') {
+		/* Bit type, size is number of bits. */
+		if (size > 8) {
+			PyErr_SetString(PyExc_ValueError,
+			    "bit count cannot be greater than 8 for 't' "
+			    "encoding");
+			return (-1);
+		}
+		if (overflow != 0 || (((1LL << size) - 1) & v) != v) {
+			PyErr_SetString(PyExc_ValueError,
+			    "value out of range for 't' encoding");
+			return (-1);
+		}
+	} else {
+		/* Translate to maintain ordering with the sign bit. */
+		if (f == 'b')
+			v += 0x80;
+		if (overflow != 0 || v > 255 || v < 0) {
+			PyErr_SetString(PyExc_ValueError,
+			    "value out of range for 'B' encoding");
+			return (-1);
+		}
+	}
+	byte = (uint8_t)v;
+	return (buf_append(buf, &byte, 1));
+}
+
+PyDoc_STRVAR(packing_pack_doc,
+"pack(fmt, *values) -> bytes\n\n"
+"Pack the values according to the format string fmt.");
+
+static PyObject *
+packing_pack(PyObject *self, PyObject *args)
+{
+	PACK_BUF buf;
+	PyObject *fmtobj, *result, *val;
+	Py_ssize_t fmtlen, i, nvalues, size, vi;
+	const char *fmt;
+	char f;
+	int havesize;
+
+	WT_UNUSED(self);
+
+	if ((nvalues = PyTuple_GET_SIZE(args) - 1) < 0) {
+		PyErr_SetString(PyExc_TypeError,
+		    "pack() missing required argument 'fmt'");
+		return (NULL);
+	}
+	fmtobj = PyTuple_GET_ITEM(args, 0);
+#if PY_MAJOR_VERSION >= 3
+	if ((fmt = PyUnicode_AsUTF8AndSize(fmtobj, &fmtlen)) == NULL)
+		return (NULL);
+#else
+	if (PyString_AsStringAndSize(fmtobj, (char **)&fmt, &fmtlen) != 0)
+		return (NULL);
+#endif
+	if (format_type(&fmt, &fmtlen) != 0)
+		return (NULL);
+	if (fmtlen == 0)
+		return (PyTuple_New(0));
+
+	buf_init(&buf);
+	for (size = 0, havesize = 0, vi = 1, i = 0; i < fmtlen; i++) {
+		f = fmt[i];
+		if (f >= '0' && f <= '9') {
+			size = (size * 10) + (f - '0');
+			havesize = 1;
+			continue;
+		}
+		if (!havesize)
+			size = 1;
+		if (f == 'x') {
+			/* Note: no value, don't increment the value index. */
+			if (buf_append(&buf, NULL, (size_t)size) != 0)
+				goto err;
+		} else if (f == 'S' || f == 's' || f == 'U' || f == 'u' ||
+		    f == 't') {
+			if (vi > nvalues)
+				goto short_values;
+			val = PyTuple_GET_ITEM(args, vi++);
+			if (f == 't') {
+				if (pack_byte(&buf, val, f, size) != 0)
+					goto err;
+			} else if (pack_string(&buf, val, f, havesize, size,
+			    i == fmtlen - 1) != 0)
+				goto err;
+		} else {
+			/* Byte and integral types: a size is a repeat count. */
+			for (; size > 0; --size) {
+				if (vi > nvalues)
+					goto short_values;
+				val = PyTuple_GET_ITEM(args, vi++);
+				if (f == 'B' || f == 'b') {
+					if (pack_byte(&buf, val, f, 1) != 0)
+						goto err;
+				} else if (pack_int_obj(&buf, val) != 0)
+					goto err;
+			}
+		}
+		size = 0;
+		havesize = 0;
+	}
+
+	result = PyBytes_FromStringAndSize(
+	    (const char *)buf.mem, (Py_ssize_t)buf.len);
+	buf_free(&buf);
+	return (result);
+
+short_values:
+	PyErr_SetString(PyExc_IndexError, "tuple index out of range");
+err:	buf_free(&buf);
+	return (NULL);
+}
+
+PyDoc_STRVAR(packing_pack_int_doc,
+"pack_int(x) -> bytes\n\n"
+"Return the variable-length encoding of the integer x.");
+
+static PyObject *
+packing_pack_int(PyObject *self, PyObject *x)
+{
+	PACK_BUF buf;
+	PyObject *result;
+
+	WT_UNUSED(self);
+
+	buf_init(&buf);
+	if (pack_int_obj(&buf, x) != 0)
+		result = NULL;
+	else
+		result = PyBytes_FromStringAndSize(
+		    (const char *)buf.mem, (Py_ssize_t)buf.len);
+	buf_free(&buf);
+	return (result);
+}
+
+PyDoc_STRVAR(packing_unpack_int_doc,
+"unpack_int(b) -> (int, bytes)\n\n"
+"Decode the variable-length integer at the start of b, return the value\n"
+"and the remaining bytes.");
+
+static PyObject *
+packing_unpack_int(PyObject *self, PyObject *b)
+{
+	Py_buffer view;
+	PyObject *result, *value;
+	const uint8_t *end, *p;
+
+	WT_UNUSED(self);
+
+	if (PyObject_GetBuffer(b, &view, PyBUF_SIMPLE) != 0)
+		return (NULL);
+	p = view.buf;
+	end = p + view.len;
+	result = NULL;
+	if ((value = unpack_int_obj(&p, end)) != NULL)
+		result = Py_BuildValue("(N" PACK_BYTES_FORMAT ")", value,
+		    (const char *)p, (Py_ssize_t)(end - p));
+	PyBuffer_Release(&view);
+	return (result);
+}
+
+static PyMethodDef packing_methods[] = {
+	{ "pack", packing_pack, METH_VARARGS, packing_pack_doc },
+	{ "unpack", packing_unpack, METH_VARARGS, packing_unpack_doc },
+	{ "pack_int", packing_pack_int, METH_O, packing_pack_int_doc },
+	{ "unpack_int", packing_unpack_int, METH_O, packing_unpack_int_doc },
+	{ NULL, NULL, 0, NULL }
+};
+
+PyDoc_STRVAR(packing_doc,
+"Compiled implementation of the WiredTiger packing functions.");
+
+#if PY_MAJOR_VERSION >= 3
+static struct PyModuleDef packing_module = {
+	PyModuleDef_HEAD_INIT, "_packing", packing_doc, -1, packing_methods,
+	NULL, NULL, NULL, NULL
+};
+
+PyMODINIT_FUNC
+PyInit__packing(void)
+{
+	return (PyModule_Create(&packing_module));
+}
+#else
+PyMODINIT_FUNC
+init_packing(void)
+{
+	(void)Py_InitModule3("_packing", packing_methods, packing_doc);
+}
+#endif
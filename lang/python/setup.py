@@ -53,6 +53,12 @@ setup(name='wiredtiger', version=wt_ver,
                 [os.path.join(dir, 'wiredtiger_wrap.c')],
         libraries=['wiredtiger'],
         extra_compile_args=extra_cflags,
+    ),
+    # The optional packing accelerator is built into the wiredtiger package,
+    # wiredtiger/packing.py uses it when it can be imported.
+    Extension('wiredtiger._packing',
+                [os.path.join(dir, '_packing.c')],
+        extra_compile_args=extra_cflags,
     )],
     package_dir={'' : dir},
     packages=['wiredtiger'],
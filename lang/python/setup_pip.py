@@ -343,7 +343,13 @@ wt_ext = Extension('_wiredtiger',
     include_dirs = inc_paths,
     library_dirs = lib_paths,
 )
-extensions = [ wt_ext ]
+# The optional packing accelerator, wiredtiger/packing.py uses it if present.
+wt_packing_ext = Extension('_packing',
+    sources = [ os.path.join(python_rel_dir, '_packing.c') ],
+    extra_compile_args = cflags + cppflags,
+    include_dirs = inc_paths,
+)
+extensions = [ wt_ext, wt_packing_ext ]
 env = { "CFLAGS" : ' '.join(cflags),
         "CPPFLAGS" : ' '.join(cppflags),
         "LDFLAGS" : ' '.join(ldflags),
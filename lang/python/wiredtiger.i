@@ -45,12 +45,20 @@ This provides an API similar to the C API, with the following modifications:
 "
 %enddef
 
-%module(docstring=DOCSTRING) wiredtiger
+/*
+ * Python threads: calls into WiredTiger release the global interpreter lock,
+ * so Python threads using their own sessions run engine operations in
+ * parallel, and a long running call such as a checkpoint doesn't stall other
+ * threads.  Callbacks from WiredTiger into Python (the event handler, async
+ * notify and the close handlers) take the lock back before touching Python
+ * objects.  The build also passes -threads to SWIG, this makes it explicit.
+ */
+%module(docstring=DOCSTRING, threads="1") wiredtiger
 
 %feature("autodoc", "0");
 
 %pythoncode %{
-from .packing import pack, unpack
+from .packing import pack, unpack, compile_format
 ## @endcond
 %}
 
@@ -294,8 +302,8 @@ from .packing import pack, unpack
 		'''method(self, config) -> int
 		
 		@copydoc class::method'''
+		self._freecb()
 		try:
-			self._freecb()
 			return $action(self, *args)
 		finally:
 			self.this = None
@@ -305,6 +313,21 @@ DESTRUCTOR(__wt_connection, close)
 DESTRUCTOR(__wt_cursor, close)
 DESTRUCTOR(__wt_session, close)
 
+/*
+ * Attach compiled plans for the key and value formats to new cursors, so
+ * packing and unpacking don't parse the format strings on every call.
+ */
+%feature("shadow") __wt_session::open_cursor %{
+	def open_cursor(self, *args):
+		'''open_cursor(self, uri, to_dup, config) -> Cursor
+
+		@copydoc __wt_session::open_cursor'''
+		cursor = $action(self, *args)
+		cursor._key_plan = compile_format(cursor.key_format)
+		cursor._value_plan = compile_format(cursor.value_format)
+		return cursor
+%}
+
 /*
  * OVERRIDE_METHOD must be used when overriding or extending an existing
  * method in the C interface.  It creates Python method() that calls
@@ -366,6 +389,8 @@ DESTRUCTOR(__wt_session, close)
 typedef struct {
 	PyObject *pyobj;	/* the python Session/Cursor/AsyncOp object */
 	PyObject *pyasynccb;	/* the callback to use for AsyncOp */
+	PyObject *views;	/* Cursor key and value views handed out */
+	int views_closed;	/* Cursor is closing, no more views */
 } PY_CALLBACK;
 
 static PyObject *wtError;
@@ -373,6 +398,36 @@ static PyObject *wtError;
 static int sessionFreeHandler(WT_SESSION *session_arg);
 static int cursorFreeHandler(WT_CURSOR *cursor_arg);
 static int unpackBytesOrString(PyObject *obj, void **data, size_t *size);
+static int appendItem(PyObject *list, WT_ITEM *item);
+#if PY_MAJOR_VERSION >= 3
+static PyTypeObject pyViewType;
+static PyObject *viewNew(const void *data, size_t size);
+static int viewTypeInit(void);
+#endif
+static int checkViews(PY_CALLBACK *pcb);
+static int releaseViews(PY_CALLBACK *pcb);
+static int releaseSessionViews(WT_SESSION *session_arg);
+static void closeSessionViews(WT_SESSION *session_arg);
+static int releaseConnectionViews(WT_CONNECTION *conn_arg);
+static int scanFields(WT_SESSION_IMPL *session, const char *fmt,
+    char *types, size_t *nfieldsp);
+static size_t scanWidth(char type);
+static int scanRecord(WT_SESSION_IMPL *session, const char *fmt,
+    WT_ITEM *item, const int *slots, size_t *fieldp, WT_ITEM *columns);
+
+/*
+ * Views returned by get_key_view and get_value_view reference memory owned by
+ * WiredTiger.  Operations that can move a cursor, or end the transaction its
+ * memory belongs to, release the views first, so later use of a view raises
+ * an exception instead of reading freed memory.  While a view's memory is
+ * exported to another object, such as a memoryview or a slice, the view can't
+ * be released: RELEASE_VIEWS fails with BufferError set, and the operation
+ * must not go ahead.
+ */
+#define	RELEASE_VIEWS(cursor)						\
+	((cursor)->lang_private == NULL ||				\
+	    ((PY_CALLBACK *)(cursor)->lang_private)->views == NULL ? 0 :	\
+	    releaseViews((PY_CALLBACK *)(cursor)->lang_private))
 
 #define WT_GETATTR(var, parent, name)					\
 	do if ((var = PyObject_GetAttrString(parent, name)) == NULL) {	\
@@ -393,13 +448,19 @@ static int unpackBytesOrString(PyObject *obj, void **data, size_t *size);
 	wtError = PyErr_NewException("_wiredtiger.WiredTigerError", NULL, NULL);
 	Py_INCREF(wtError);
 	PyModule_AddObject(m, "WiredTigerError", wtError);
+#if PY_MAJOR_VERSION >= 3
+	if (viewTypeInit() != 0)
+		return (NULL);
+	Py_INCREF(&pyViewType);
+	PyModule_AddObject(m, "View", (PyObject *)&pyViewType);
+#endif
 %}
 
 %pythoncode %{
 WiredTigerError = _wiredtiger.WiredTigerError
 
 # Python3 has no explicit long type, recnos work as ints
-import sys
+import os, random, sys, time
 if sys.version_info >= (3, 0, 0):
 	def _wt_recno(i):
 		return i
@@ -407,6 +468,102 @@ else:
 	def _wt_recno(i):
 		return long(i)
 
+## @cond DISABLE
+# Escape a configuration string for a JSON dump, as wt dump does: the
+# string is escaped byte by byte in its UTF-8 encoding.
+def _json_config(s):
+	if not isinstance(s, bytes):
+		s = s.encode('utf-8')
+	result = []
+	for b in bytearray(s):
+		c = chr(b)
+		if c == '\\' or c == '"':
+			result.append('\\' + c)
+		elif ' ' <= c <= '~':
+			result.append(c)
+		elif c in '\f\n\r\t':
+			result.append('\\' + {'\f': 'f', '\n': 'n', '\r': 'r',
+			    '\t': 't'}[c])
+		else:
+			result.append('\\u%04x' % b)
+	return ''.join(result)
+
+# The configuration of a table's column groups or indices in a dump header,
+# given a metadata cursor.
+def _dump_parts(cursor, name, entry, json):
+	if json:
+		result = ['            "%s" : [' %
+		    ('colgroups' if entry == 'colgroup:' else 'indices')]
+	else:
+		result = []
+	multiple = False
+	cursor.set_key(entry + name)
+	exact = cursor.search_near()
+	# An exact match is an implicit column group, which is part of the
+	# table's configuration, and means there are no others.
+	if exact != WT_NOTFOUND and exact != 0:
+		if exact < 0:
+			exact = cursor.next()
+		while exact != WT_NOTFOUND:
+			key = cursor.get_key()
+			if not key.startswith(entry + name):
+				break
+			if json:
+				result.append('%s\n                {\n'
+				    '                    "uri" : "%s",\n'
+				    '                    "config" : "%s"\n'
+				    '                }' % (',' if multiple else '', key,
+				    _json_config(cursor.get_value())))
+			else:
+				result.append('%s\n%s\n' % (key, cursor.get_value()))
+			multiple = True
+			exact = cursor.next()
+	if json:
+		result.append('%s]%s\n' % ('\n            ' if multiple else '',
+		    ',' if entry == 'colgroup:' else ''))
+	return ''.join(result)
+
+# Write all of a buffer to a file descriptor.
+def _write_fd(fd, data):
+	while data:
+		data = data[os.write(fd, data):]
+
+# Whether an error is a conflict that retrying the transaction can resolve.
+def _txn_conflict(e):
+	return str(e) in (wiredtiger_strerror(WT_ROLLBACK),
+	    wiredtiger_strerror(WT_PREPARE_CONFLICT))
+
+# The number of values described by a format string: pad bytes have none,
+# and integral types with a repeat count have one per repetition.
+def _format_count(fmt):
+	count = 0
+	digits = ''
+	for c in fmt.lstrip('.@<>'):
+		if c.isdigit():
+			digits += c
+			continue
+		if c in 'sSuUt':
+			count += 1
+		elif c != 'x':
+			count += int(digits) if digits else 1
+		digits = ''
+	return count
+
+# Wrap the native column data built by Cursor._scan_columns.
+def _scan_array(typecode, data):
+	try:
+		import numpy
+	except ImportError:
+		import array
+		a = array.array(typecode)
+		if sys.version_info >= (3, 0, 0):
+			a.frombytes(bytes(data))
+		else:
+			a.fromstring(bytes(data))
+		return a
+	return numpy.frombuffer(data, dtype=typecode)
+## @endcond
+
 ## @cond DISABLE
 # Implements the iterable contract
 class IterableCursor:
@@ -416,10 +573,22 @@ class IterableCursor:
 	def __iter__(self):
 		return self
 
+	# Each step moves the cursor and fetches the record in one call, the
+	# cursor stays positioned on the record returned.
 	def __next__(self):
-		if self.cursor.next() == WT_NOTFOUND:
+		cursor = self.cursor
+		if cursor.is_json:
+			if cursor.next() == WT_NOTFOUND:
+				raise StopIteration
+			return cursor.get_keys() + cursor.get_values()
+		items = cursor._batch(1, 0)
+		if not items:
 			raise StopIteration
-		return self.cursor.get_keys() + self.cursor.get_values()
+		if cursor.lazy_rows:
+			return cursor._value_plan.row(items[1],
+			    cursor._key_plan.unpack(items[0]))
+		return cursor._key_plan.unpack(items[0]) + \
+		    cursor._value_plan.unpack(items[1])
 
 	def next(self):
 		return self.__next__()
@@ -527,6 +696,16 @@ retry:
 }
 %enddef
 
+/*
+ * The asyncio adapter can't wait for an op: EBUSY returns None instead, see
+ * wiredtiger/aio.py.
+ */
+%exception __wt_connection::_async_new_op_nowait {
+	$action
+	if (result != 0 && result != EBUSY)
+		SWIG_ERROR_IF_NOT_SET(result);
+}
+
 /* An API that returns a value that shouldn't be checked uses this. */
 %define ANY_OK(m)
 %exception m {
@@ -537,6 +716,8 @@ retry:
 /* Cursor positioning methods can also return WT_NOTFOUND. */
 %define NOTFOUND_OK(m)
 %exception m {
+	if (RELEASE_VIEWS(arg1) != 0)
+		SWIG_fail;
 	$action
 	if (result != 0 && result != WT_NOTFOUND)
 		SWIG_ERROR_IF_NOT_SET(result);
@@ -555,6 +736,8 @@ retry:
 /* Cursor compare can return any of -1, 0, 1 or WT_NOTFOUND. */
 %define COMPARE_NOTFOUND_OK(m)
 %exception m {
+	if (RELEASE_VIEWS(arg1) != 0)
+		SWIG_fail;
 	$action
 	if ((result < -1 || result > 1) && result != WT_NOTFOUND)
 		SWIG_ERROR_IF_NOT_SET(result);
@@ -571,6 +754,60 @@ NOTFOUND_OK(__wt_cursor::update)
 NOTFOUND_OK(__wt_cursor::_modify)
 ANY_OK(__wt_modify::__wt_modify)
 ANY_OK(__wt_modify::~__wt_modify)
+ANY_OK(__wt_session::_transaction_running)
+ANY_OK(__wt_cursor::_colgroups)
+ANY_OK(__wt_cursor::_custom_collation)
+
+/* Other cursor methods that invalidate views, see RELEASE_VIEWS. */
+%define VIEWS_RELEASED(m)
+%exception m {
+	if (RELEASE_VIEWS(arg1) != 0)
+		SWIG_fail;
+	$action
+	if (result != 0)
+		SWIG_ERROR_IF_NOT_SET(result);
+}
+%enddef
+
+/* Ending a transaction or resetting a session resets its cursors. */
+%define SESSION_VIEWS_RELEASED(m)
+%exception m {
+	if (releaseSessionViews(arg1) != 0)
+		SWIG_fail;
+	$action
+	if (result != 0)
+		SWIG_ERROR_IF_NOT_SET(result);
+}
+%enddef
+
+/* Batches return a new object, or NULL with the Python error set. */
+%define BATCH_OK(m)
+%exception m {
+	$action
+	if (result == NULL)
+		SWIG_fail;
+}
+%enddef
+BATCH_OK(__wt_cursor::_batch)
+BATCH_OK(__wt_cursor::_range_batch)
+BATCH_OK(__wt_cursor::_apply)
+BATCH_OK(__wt_cursor::_get_view)
+BATCH_OK(__wt_cursor::_scan_columns)
+BATCH_OK(__wt_cursor::_search_many)
+BATCH_OK(__wt_cursor::_modify_many)
+BATCH_OK(__wt_session::_stat_snapshot)
+BATCH_OK(__wt_session::_dump_records)
+BATCH_OK(__wt_session::_load_config)
+BATCH_OK(__wt_session::_load_records)
+BATCH_OK(_event_drain)
+BATCH_OK(_event_stats)
+VIEWS_RELEASED(__wt_cursor::insert)
+VIEWS_RELEASED(__wt_cursor::reserve)
+VIEWS_RELEASED(__wt_cursor::reset)
+SESSION_VIEWS_RELEASED(__wt_session::commit_transaction)
+SESSION_VIEWS_RELEASED(__wt_session::prepare_transaction)
+SESSION_VIEWS_RELEASED(__wt_session::reset)
+SESSION_VIEWS_RELEASED(__wt_session::rollback_transaction)
 
 COMPARE_OK(__wt_cursor::_compare)
 COMPARE_OK(__wt_cursor::_equals)
@@ -589,6 +826,49 @@ COMPARE_NOTFOUND_OK(__wt_cursor::_search_near)
 %exception wiredtiger_strerror;
 %exception wiredtiger_version;
 %exception diagnostic_build;
+%nothreadallow _event_buffer;
+%nothreadallow _event_drain;
+%nothreadallow _event_stats;
+
+/*
+ * Getting and setting keys and values only copies memory, releasing and
+ * re-acquiring the interpreter lock around them costs more than the call,
+ * and causes lock churn when several threads are running.  Keep the lock.
+ */
+%nothreadallow __wt_async_op::_set_key;
+%nothreadallow __wt_async_op::_set_recno;
+%nothreadallow __wt_async_op::_set_value;
+%nothreadallow __wt_async_op::_get_key;
+%nothreadallow __wt_async_op::_get_recno;
+%nothreadallow __wt_async_op::_get_value;
+%nothreadallow __wt_async_op::get_type;
+%nothreadallow __wt_cursor::_set_key;
+%nothreadallow __wt_cursor::_set_key_str;
+%nothreadallow __wt_cursor::_set_recno;
+%nothreadallow __wt_cursor::_set_value;
+%nothreadallow __wt_cursor::_set_value_str;
+%nothreadallow __wt_cursor::_get_key;
+%nothreadallow __wt_cursor::_get_json_key;
+%nothreadallow __wt_cursor::_get_recno;
+%nothreadallow __wt_cursor::_get_value;
+%nothreadallow __wt_cursor::_get_json_value;
+
+/* Batches build Python objects, they release the lock themselves. */
+%nothreadallow __wt_cursor::_batch;
+%nothreadallow __wt_cursor::_range_batch;
+%nothreadallow __wt_cursor::_apply;
+%nothreadallow __wt_cursor::_get_view;
+%nothreadallow __wt_cursor::_scan_columns;
+%nothreadallow __wt_cursor::_search_many;
+%nothreadallow __wt_cursor::_modify_many;
+%nothreadallow __wt_session::_stat_snapshot;
+%nothreadallow __wt_session::_dump_records;
+%nothreadallow __wt_session::_load_config;
+%nothreadallow __wt_session::_load_records;
+%nothreadallow __wt_cursor::_set_value_buffer;
+%nothreadallow __wt_cursor::_freecb;
+%nothreadallow __wt_session::_freecb;
+%nothreadallow __wt_connection::_freecb;
 
 /* WT_ASYNC_OP customization. */
 /* First, replace the varargs get / set methods with Python equivalents. */
@@ -946,7 +1226,624 @@ typedef int int_void;
 		return ((ret != 0) ? ret : (cmp < 0) ? -1 : (cmp == 0) ? 0 : 1);
 	}
 
+	/*
+	 * Move the cursor up to n times, returning the raw keys and values as
+	 * a flat list [key0, value0, key1, value1, ...].  Stops early at the
+	 * end of the data, where, as when next or prev return WT_NOTFOUND, the
+	 * cursor is reset.  The interpreter lock is only held while copying
+	 * the records into Python objects.
+	 */
+	PyObject *_batch(int n, int prev) {
+		PyObject *list;
+		WT_ITEM k, v;
+		int i, ret;
+
+		if (RELEASE_VIEWS($self) != 0)
+			return (NULL);
+		if ((list = PyList_New(0)) == NULL)
+			return (NULL);
+		for (ret = 0, i = 0; i < n; i++) {
+			{
+			SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+			if ((ret = prev ?
+			    $self->prev($self) : $self->next($self)) == 0 &&
+			    (ret = $self->get_key($self, &k)) == 0)
+				ret = $self->get_value($self, &v);
+			SWIG_PYTHON_THREAD_END_ALLOW;
+			}
+			if (ret != 0)
+				break;
+			if (appendItem(list, &k) != 0 ||
+			    appendItem(list, &v) != 0) {
+				Py_DECREF(list);
+				return (NULL);
+			}
+		}
+		if (ret != 0 && ret != WT_NOTFOUND) {
+			Py_DECREF(list);
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			return (NULL);
+		}
+		return (list);
+	}
+
+	/*
+	 * Return the number of column groups of a table cursor, 0 for other
+	 * cursors.  A table cursor with more than one column group can't be
+	 * positioned by search_near.
+	 */
+	int _colgroups() {
+		if ($self->internal_uri == NULL ||
+		    !WT_PREFIX_MATCH($self->internal_uri, "table:"))
+			return (0);
+		return ((int)((WT_CURSOR_TABLE *)$self)->table->ncolgroups);
+	}
+
+	/*
+	 * Return whether the cursor's keys are ordered by a custom collator
+	 * rather than the default collation.
+	 */
+	int _custom_collation() {
+		WT_CURSOR *c;
+
+		c = $self;
+		if (F_ISSET(c, WT_CURSTD_DUMP_HEX |
+		    WT_CURSTD_DUMP_JSON | WT_CURSTD_DUMP_PRINT))
+			c = ((WT_CURSOR_DUMP *)c)->child;
+		if (c->internal_uri == NULL)
+			return (0);
+		if (WT_PREFIX_MATCH(c->internal_uri, "index:"))
+			return (((WT_CURSOR_INDEX *)c)->index->collator != NULL);
+		if (WT_PREFIX_MATCH(c->internal_uri, "table:"))
+			c = WT_CURSOR_PRIMARY(c);
+		if (WT_PREFIX_MATCH(c->internal_uri, "file:"))
+			return (((WT_CURSOR_BTREE *)c)->btree->collator != NULL);
+		if (WT_PREFIX_MATCH(c->internal_uri, "lsm:"))
+			return (((WT_CURSOR_LSM *)c)->lsm_tree->collator != NULL);
+		return (0);
+	}
+
+	/*
+	 * As _batch, but stop at the first raw key past bound, compared with
+	 * the default collation: above it moving forward, below it moving
+	 * backward, or equal to it unless inclusive is set.  With here set,
+	 * the first record is the one the cursor is already positioned on.
+	 * With skip set, records before that raw key in scan order, or equal
+	 * to it unless skip_inclusive is set, are passed over.  With
+	 * keys_only set, values aren't retrieved and the list holds only
+	 * keys.  Returns fewer than n records when the scan is done.
+	 */
+	PyObject *_range_batch(int n, int prev, int here, PyObject *skip,
+	    int skip_inclusive, PyObject *bound, int inclusive, int keys_only) {
+		PyObject *list;
+		WT_ITEM b, k, s, v;
+		Py_ssize_t len;
+		char *data;
+		int cmp, i, ret, skipped;
+
+		WT_CLEAR(b);
+		WT_CLEAR(s);
+		if (bound != Py_None) {
+			if (PyBytes_AsStringAndSize(bound, &data, &len) != 0)
+				return (NULL);
+			b.data = data;
+			b.size = (size_t)len;
+		}
+		if (skip != Py_None) {
+			if (PyBytes_AsStringAndSize(skip, &data, &len) != 0)
+				return (NULL);
+			s.data = data;
+			s.size = (size_t)len;
+		}
+		if (RELEASE_VIEWS($self) != 0)
+			return (NULL);
+		if ((list = PyList_New(0)) == NULL)
+			return (NULL);
+		for (ret = 0, i = 0; i < n;) {
+			skipped = 0;
+			{
+			SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+			if (here)
+				here = 0;
+			else
+				ret = prev ?
+				    $self->prev($self) : $self->next($self);
+			if (ret == 0)
+				ret = $self->get_key($self, &k);
+			if (ret == 0 && skip != Py_None) {
+				cmp = __wt_lex_compare(&k, &s);
+				skipped = (prev ? cmp > 0 : cmp < 0) ||
+				    (cmp == 0 && !skip_inclusive);
+			}
+			if (ret == 0 && !skipped && bound != Py_None) {
+				cmp = __wt_lex_compare(&k, &b);
+				if ((prev ? cmp < 0 : cmp > 0) ||
+				    (cmp == 0 && !inclusive))
+					ret = WT_NOTFOUND;
+			}
+			if (ret == 0 && !skipped && !keys_only)
+				ret = $self->get_value($self, &v);
+			SWIG_PYTHON_THREAD_END_ALLOW;
+			}
+			if (ret != 0)
+				break;
+			if (skipped)
+				continue;
+			/* Records past the skip key are all in scan order. */
+			skip = Py_None;
+			++i;
+			if (appendItem(list, &k) != 0 ||
+			    (!keys_only && appendItem(list, &v) != 0)) {
+				Py_DECREF(list);
+				return (NULL);
+			}
+		}
+		if (ret != 0 && ret != WT_NOTFOUND) {
+			Py_DECREF(list);
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			return (NULL);
+		}
+		return (list);
+	}
+
+	/*
+	 * Insert, update or remove a batch of records, given lists of raw keys
+	 * and values (values is None for remove).  Stops at the first failure,
+	 * returning a tuple of the number of records applied and the error.
+	 * The engine calls run without the interpreter lock: the caller keeps
+	 * the lists and their contents alive for the duration.
+	 */
+	PyObject *_apply(int op, PyObject *keys, PyObject *values) {
+		WT_ITEM *items;
+		Py_ssize_t i, len, n;
+		char *data;
+		int count, ret;
+
+		if (!PyList_Check(keys) ||
+		    (values != Py_None && (!PyList_Check(values) ||
+		    PyList_GET_SIZE(values) != PyList_GET_SIZE(keys)))) {
+			PyErr_SetString(PyExc_TypeError,
+			    "keys and values must be lists of equal length");
+			return (NULL);
+		}
+		n = PyList_GET_SIZE(keys);
+		if (__wt_calloc_def(NULL, (size_t)n * 2 + 1, &items) != 0)
+			return (PyErr_NoMemory());
+		for (i = 0; i < n; i++) {
+			if (PyBytes_AsStringAndSize(
+			    PyList_GET_ITEM(keys, i), &data, &len) != 0)
+				goto err;
+			items[2 * i].data = data;
+			items[2 * i].size = (size_t)len;
+			if (values == Py_None)
+				continue;
+			if (PyBytes_AsStringAndSize(
+			    PyList_GET_ITEM(values, i), &data, &len) != 0)
+				goto err;
+			items[2 * i + 1].data = data;
+			items[2 * i + 1].size = (size_t)len;
+		}
+
+		if (RELEASE_VIEWS($self) != 0)
+			goto err;
+		{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		for (ret = 0, count = 0; count < n; count++) {
+			$self->set_key($self, &items[2 * count]);
+			if (values != Py_None)
+				$self->set_value($self, &items[2 * count + 1]);
+			if ((ret = op == 0 ? $self->insert($self) :
+			    op == 1 ? $self->update($self) :
+			    $self->remove($self)) != 0)
+				break;
+		}
+		SWIG_PYTHON_THREAD_END_ALLOW;
+		}
+		__wt_free(NULL, items);
+		return (Py_BuildValue("(ii)", count, ret));
+
+err:		__wt_free(NULL, items);
+		return (NULL);
+	}
+
+	/*
+	 * For each raw key, with old and new raw values, compute the changes
+	 * with wiredtiger_calc_modify and apply them with WT_CURSOR::modify,
+	 * or if the values differ by too much, update the whole value.  With
+	 * keys None, there is one pair of values for the key already set.
+	 * Returns a tuple of the number of keys done, the error that stopped
+	 * the batch or 0, and the number of whole values updated.  The engine
+	 * calls run without the interpreter lock.
+	 */
+	PyObject *_modify_many(PyObject *keys,
+	    PyObject *olds, PyObject *news, size_t maxdiff, int nmod) {
+		WT_ITEM *items, newv, oldv;
+		WT_MODIFY *entries;
+		Py_ssize_t i, len, n;
+		size_t trim;
+		char *data;
+		int count, nentries, nfull, ret;
+
+		if (!PyList_Check(olds) || !PyList_Check(news) ||
+		    PyList_GET_SIZE(news) != PyList_GET_SIZE(olds) ||
+		    (keys != Py_None && (!PyList_Check(keys) ||
+		    PyList_GET_SIZE(keys) != PyList_GET_SIZE(olds)))) {
+			PyErr_SetString(PyExc_TypeError,
+			    "keys and values must be lists of equal length");
+			return (NULL);
+		}
+		if (nmod <= 0) {
+			PyErr_SetString(PyExc_ValueError, "nmod must be positive");
+			return (NULL);
+		}
+		n = PyList_GET_SIZE(olds);
+		items = NULL;
+		entries = NULL;
+		if (__wt_calloc_def(NULL, (size_t)n * 3 + 1, &items) != 0 ||
+		    __wt_calloc_def(NULL, (size_t)nmod, &entries) != 0) {
+			PyErr_NoMemory();
+			goto err;
+		}
+		for (i = 0; i < n; i++) {
+			if ((keys != Py_None && PyBytes_AsStringAndSize(
+			    PyList_GET_ITEM(keys, i), &data, &len) != 0))
+				goto err;
+			if (keys != Py_None) {
+				items[3 * i].data = data;
+				items[3 * i].size = (size_t)len;
+			}
+			if (PyBytes_AsStringAndSize(
+			    PyList_GET_ITEM(olds, i), &data, &len) != 0)
+				goto err;
+			items[3 * i + 1].data = data;
+			items[3 * i + 1].size = (size_t)len;
+			if (PyBytes_AsStringAndSize(
+			    PyList_GET_ITEM(news, i), &data, &len) != 0)
+				goto err;
+			items[3 * i + 2].data = data;
+			items[3 * i + 2].size = (size_t)len;
+		}
+
+		/* Modify offsets in strings don't include the trailing nul. */
+		trim = strcmp($self->value_format, "S") == 0 ? 1 : 0;
+		if (RELEASE_VIEWS($self) != 0)
+			goto err;
+		{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		for (ret = 0, count = 0, nfull = 0; count < n; count++) {
+			if (keys != Py_None)
+				$self->set_key($self, &items[3 * count]);
+			oldv = items[3 * count + 1];
+			newv = items[3 * count + 2];
+			if (oldv.size >= trim && newv.size >= trim) {
+				oldv.size -= trim;
+				newv.size -= trim;
+			}
+			nentries = nmod;
+			if ((ret = wiredtiger_calc_modify($self->session,
+			    &oldv, &newv, maxdiff, entries, &nentries)) == 0)
+				/*
+				 * There's nothing to change for identical
+				 * values, but a missing record is still
+				 * reported.
+				 */
+				ret = nentries == 0 ? $self->search($self) :
+				    $self->modify($self, entries, nentries);
+			/*
+			 * Update the whole value.  Update would create a missing
+			 * record, search first so it's reported as by modify.
+			 */
+			else if (ret == WT_NOTFOUND &&
+			    (ret = $self->search($self)) == 0) {
+				$self->set_value($self, &items[3 * count + 2]);
+				ret = $self->update($self);
+				++nfull;
+			}
+			if (ret != 0)
+				break;
+		}
+		SWIG_PYTHON_THREAD_END_ALLOW;
+		}
+		__wt_free(NULL, items);
+		__wt_free(NULL, entries);
+		return (Py_BuildValue("(iii)", count, ret, nfull));
+
+err:		__wt_free(NULL, items);
+		__wt_free(NULL, entries);
+		return (NULL);
+	}
+
+	/*
+	 * Search for a list of raw keys, returning a list of the raw values,
+	 * with None for keys that aren't found.  The searches run without the
+	 * interpreter lock, copying the values into a single buffer.
+	 */
+	PyObject *_search_many(PyObject *keys) {
+		PyObject *list, *value;
+		WT_ITEM buf, *items, v;
+		Py_ssize_t i, len, n;
+		size_t *offsets;
+		char *data;
+		int ret;
+
+		if (!PyList_Check(keys)) {
+			PyErr_SetString(PyExc_TypeError, "keys must be a list");
+			return (NULL);
+		}
+		n = PyList_GET_SIZE(keys);
+		list = NULL;
+		items = NULL;
+		offsets = NULL;
+		WT_CLEAR(buf);
+		if (__wt_calloc_def(NULL, (size_t)n + 1, &items) != 0 ||
+		    __wt_calloc_def(NULL, (size_t)n + 1, &offsets) != 0) {
+			PyErr_NoMemory();
+			goto err;
+		}
+		for (i = 0; i < n; i++) {
+			if (PyBytes_AsStringAndSize(
+			    PyList_GET_ITEM(keys, i), &data, &len) != 0)
+				goto err;
+			items[i].data = data;
+			items[i].size = (size_t)len;
+		}
+
+		/*
+		 * Each value's size replaces its key's size once found, offsets
+		 * hold the position of the value in the buffer, or SIZE_MAX.
+		 */
+		if (RELEASE_VIEWS($self) != 0)
+			goto err;
+		{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		for (ret = 0, i = 0; i < n; i++) {
+			$self->set_key($self, &items[i]);
+			if ((ret = $self->search($self)) == WT_NOTFOUND) {
+				offsets[i] = SIZE_MAX;
+				continue;
+			}
+			if (ret != 0 || (ret = $self->get_value($self, &v)) != 0 ||
+			    (ret = __wt_buf_extend(
+			    NULL, &buf, buf.size + v.size)) != 0)
+				break;
+			offsets[i] = buf.size;
+			items[i].size = v.size;
+			if (v.size != 0)
+				memcpy((uint8_t *)buf.mem + buf.size, v.data, v.size);
+			buf.size += v.size;
+		}
+		SWIG_PYTHON_THREAD_END_ALLOW;
+		}
+		if (ret == WT_NOTFOUND)
+			ret = 0;
+		if (ret != 0) {
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			goto err;
+		}
+
+		if ((list = PyList_New(n)) == NULL)
+			goto err;
+		for (i = 0; i < n; i++) {
+			if (offsets[i] == SIZE_MAX) {
+				Py_INCREF(Py_None);
+				value = Py_None;
+			} else if ((value = PyBytes_FromStringAndSize(
+			    (const char *)buf.mem + offsets[i],
+			    (Py_ssize_t)items[i].size)) == NULL) {
+				Py_DECREF(list);
+				list = NULL;
+				goto err;
+			}
+			PyList_SET_ITEM(list, i, value);
+		}
+
+err:		__wt_buf_free(NULL, &buf);
+		__wt_free(NULL, items);
+		__wt_free(NULL, offsets);
+		return (list);
+	}
+
+	/*
+	 * Return a read-only view of the raw key or value, referencing
+	 * WiredTiger's memory.  The view is remembered so it can be released
+	 * when the memory becomes invalid, see RELEASE_VIEWS.
+	 */
+	PyObject *_get_view(int value) {
+		PY_CALLBACK *pcb;
+		PyObject *view;
+		WT_ITEM item;
+		int ret;
+
+		pcb = (PY_CALLBACK *)$self->lang_private;
+		if (pcb == NULL || pcb->views_closed) {
+			PyErr_SetString(PyExc_ValueError,
+			    "the cursor is being closed, it has no views");
+			return (NULL);
+		}
+		if ((ret = value ? $self->get_value($self, &item) :
+		    $self->get_key($self, &item)) != 0) {
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			return (NULL);
+		}
+#if PY_MAJOR_VERSION >= 3
+		if ((view = viewNew(item.data, item.size)) == NULL)
+			return (NULL);
+		if (pcb->views == NULL && (pcb->views = PyList_New(0)) == NULL) {
+			Py_DECREF(view);
+			return (NULL);
+		}
+		if (PyList_Append(pcb->views, view) != 0) {
+			Py_DECREF(view);
+			return (NULL);
+		}
+		return (view);
+#else
+		/* Python2 can't wrap memory in a memoryview, return a copy. */
+		WT_UNUSED(view);
+		return (PyBytes_FromStringAndSize(
+		    (const char *)item.data, (Py_ssize_t)item.size));
+#endif
+	}
+
+	/*
+	 * Set the value from any object supporting the buffer protocol, without
+	 * copying.  The caller keeps the object pinned, and its memory fixed,
+	 * until the value is no longer needed.
+	 */
+	int_void _set_value_buffer(PyObject *obj) {
+		Py_buffer view;
+		WT_ITEM v;
+
+		if (PyObject_GetBuffer(obj, &view, PyBUF_SIMPLE) != 0)
+			return (EINVAL);
+		v.data = view.buf;
+		v.size = (size_t)view.len;
+		$self->set_value($self, &v);
+		PyBuffer_Release(&view);
+		return (0);
+	}
+
+	/*
+	 * Scan forward, decoding the selected integral columns of the records
+	 * into one native array per column.  The columns list holds positions
+	 * in the record, key columns first.  The scan stops before the packed
+	 * key stop unless it's None, or after limit records.  If positioned is
+	 * set, the scan starts with the current record.  Returns a list of
+	 * (type, bytearray) pairs, one per column, where type is the format
+	 * character as an integer.  The engine calls and the decoding run
+	 * without the interpreter lock.
+	 */
+	PyObject *_scan_columns(PyObject *columns,
+	    PyObject *stop, uint64_t limit, int positioned) {
+		PyObject *list, *pair;
+		WT_ITEM *bufs, k, stopkey, v;
+		WT_SESSION_IMPL *session;
+		Py_ssize_t col, i, ncols;
+		size_t field, nfields, nkey;
+		uint64_t count;
+		int *slots, ret;
+		char *types;
+
+		session = (WT_SESSION_IMPL *)$self->session;
+		list = NULL;
+		bufs = NULL;
+		slots = NULL;
+		types = NULL;
+		ncols = 0;
+		if (!PyList_Check(columns) ||
+		    (stop != Py_None && !PyBytes_Check(stop))) {
+			PyErr_SetString(PyExc_TypeError,
+			    "columns must be a list and stop a packed key");
+			return (NULL);
+		}
+		if (stop != Py_None) {
+			stopkey.data = PyBytes_AS_STRING(stop);
+			stopkey.size = (size_t)PyBytes_GET_SIZE(stop);
+		}
+
+		/* Find the type of each field, then the columns to keep. */
+		nkey = nfields = 0;
+		if ((ret = scanFields(session,
+		    $self->key_format, NULL, &nkey)) != 0 ||
+		    (ret = scanFields(session,
+		    $self->value_format, NULL, &nfields)) != 0)
+			goto err;
+		nfields += nkey;
+		ncols = PyList_GET_SIZE(columns);
+		if ((ret = __wt_calloc_def(session, nfields + 1, &types)) != 0 ||
+		    (ret = __wt_calloc_def(session, nfields + 1, &slots)) != 0 ||
+		    (ret = __wt_calloc_def(
+		    session, (size_t)ncols + 1, &bufs)) != 0)
+			goto err;
+		field = 0;
+		if ((ret = scanFields(
+		    session, $self->key_format, types, &field)) != 0 ||
+		    (ret = scanFields(session,
+		    $self->value_format, types + field, &field)) != 0)
+			goto err;
+		for (field = 0; field < nfields; field++)
+			slots[field] = -1;
+		for (col = 0; col < ncols; col++) {
+			i = PyLong_AsSsize_t(PyList_GET_ITEM(columns, col));
+			if (i == -1 && PyErr_Occurred())
+				goto err;
+			if (i < 0 || (size_t)i >= nfields || slots[i] != -1) {
+				PyErr_Format(PyExc_ValueError,
+				    "column %zd is out of range or repeated", i);
+				goto err;
+			}
+			if (scanWidth(types[i]) == 0) {
+				PyErr_Format(PyExc_ValueError,
+				    "column %zd has format '%c', only integral "
+				    "columns can be scanned to arrays",
+				    i, types[i]);
+				goto err;
+			}
+			slots[i] = (int)col;
+			if ((ret = __wt_buf_init(session, &bufs[col], 1024)) != 0)
+				goto err;
+		}
+
+		if (RELEASE_VIEWS($self) != 0)
+			goto err;
+		{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		for (count = 0; count < limit; count++) {
+			if (positioned)
+				positioned = 0;
+			else if ((ret = $self->next($self)) != 0)
+				break;
+			if ((ret = $self->get_key($self, &k)) != 0 ||
+			    (ret = $self->get_value($self, &v)) != 0)
+				break;
+			if (stop != Py_None && __wt_lex_compare(&k, &stopkey) >= 0)
+				break;
+			field = 0;
+			if ((ret = scanRecord(session, $self->key_format,
+			    &k, slots, &field, bufs)) != 0 ||
+			    (ret = scanRecord(session, $self->value_format,
+			    &v, slots, &field, bufs)) != 0)
+				break;
+		}
+		SWIG_PYTHON_THREAD_END_ALLOW;
+		}
+		if (ret == WT_NOTFOUND)
+			ret = 0;
+		if (ret != 0)
+			goto err;
+
+		if ((list = PyList_New(ncols)) == NULL)
+			goto err;
+		for (field = 0; field < nfields; field++) {
+			if (slots[field] == -1)
+				continue;
+			col = slots[field];
+			if ((pair = Py_BuildValue("(iN)", (int)types[field],
+			    PyByteArray_FromStringAndSize(bufs[col].data,
+			    (Py_ssize_t)bufs[col].size))) == NULL)
+				goto err;
+			PyList_SET_ITEM(list, col, pair);
+		}
+
+		if (0) {
+err:			if (ret != 0 && !PyErr_Occurred())
+				SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			Py_XDECREF(list);
+			list = NULL;
+		}
+		if (bufs != NULL)
+			for (col = 0; col < ncols; col++)
+				__wt_buf_free(session, &bufs[col]);
+		__wt_free(session, bufs);
+		__wt_free(session, slots);
+		__wt_free(session, types);
+		return (list);
+	}
+
 	int _freecb() {
+		/* Closing the cursor frees the memory of its views. */
+		if (RELEASE_VIEWS($self) != 0)
+			return (EBUSY);
 		return (cursorFreeHandler($self));
 	}
 
@@ -960,6 +1857,11 @@ typedef int int_void;
 	}
 
 %pythoncode %{
+	# Set lazy_rows on a cursor to have get_values, iteration and the
+	# batch methods return wiredtiger.packing.Row objects, which unpack a
+	# value column only when it is read.  Key columns are still unpacked.
+	lazy_rows = False
+
 	def get_key(self):
 		'''get_key(self) -> object
 		
@@ -979,7 +1881,7 @@ typedef int int_void;
 		elif self.is_column:
 			return [self._get_recno(),]
 		else:
-			return unpack(self.key_format, self._get_key())
+			return self._key_plan.unpack(self._get_key())
 
 	def get_value(self):
 		'''get_value(self) -> object
@@ -997,8 +1899,10 @@ typedef int int_void;
 		@copydoc WT_CURSOR::get_value'''
 		if self.is_json:
 			return [self._get_json_value()]
+		elif self.lazy_rows:
+			return self._value_plan.row(self._get_value())
 		else:
-			return unpack(self.value_format, self._get_value())
+			return self._value_plan.unpack(self._get_value())
 
 	def set_key(self, *args):
 		'''set_key(self) -> None
@@ -1012,22 +1916,454 @@ typedef int int_void;
 			self._set_key_str(args[0])
 		else:
 			# Keep the Python string pinned
-			self._key = pack(self.key_format, *args)
+			self._key = self._key_plan.pack(*args)
 			self._set_key(self._key)
 
 	def set_value(self, *args):
 		'''set_value(self) -> None
 		
-		@copydoc WT_CURSOR::set_value'''
+		@copydoc WT_CURSOR::set_value
+		For a value_format of "u", the value can be any object supporting
+		the buffer protocol, it is copied: see set_value_buffer to set a
+		value without copying.'''
 		if self.is_json:
 			self._set_value_str(args[0])
+			return
+		if len(args) == 1 and type(args[0]) == tuple:
+			args = args[0]
+		if self.value_format == 'u' and len(args) == 1:
+			value = args[0]
+			if type(value) != bytes:
+				value = memoryview(value).tobytes()
+			# Keep the Python string pinned
+			self._value = value
+			self._set_value_buffer(value)
 		else:
-			if len(args) == 1 and type(args[0]) == tuple:
-				args = args[0]
 			# Keep the Python string pinned
-			self._value = pack(self.value_format, *args)
+			self._value = self._value_plan.pack(*args)
 			self._set_value(self._value)
 
+	def set_value_buffer(self, value):
+		'''set_value_buffer(self, value) -> None
+		
+		Set a value_format "u" value from any object supporting the
+		buffer protocol, without copying it.  The object is pinned, so
+		it can't be resized, until the next set_value or
+		set_value_buffer, and changing it before the value is stored
+		changes what is stored.'''
+		if self.value_format != 'u':
+			raise ValueError(
+			    'set_value_buffer needs a value_format of "u"')
+		# Keep the buffer pinned: while the memoryview exists, the
+		# object's memory can't be resized.
+		self._value = memoryview(value)
+		self._set_value_buffer(self._value)
+
+	## @cond DISABLE
+	def _unpack_batch(self, items, raw):
+		if raw:
+			return list(zip(items[0::2], items[1::2]))
+		kunpack = self._key_plan.unpack
+		if self.lazy_rows:
+			vrow = self._value_plan.row
+			return [vrow(items[i + 1], kunpack(items[i]))
+			    for i in range(0, len(items), 2)]
+		vunpack = self._value_plan.unpack
+		return [kunpack(items[i]) + vunpack(items[i + 1])
+		    for i in range(0, len(items), 2)]
+
+	def _range(self, prev, first, first_inclusive, bound, inclusive,
+	    keys_only, batch):
+		pack = self._key_plan.pack
+		if bound is not None:
+			bound = pack(*bound) if type(bound) == tuple else pack(bound)
+		here = 0
+		skip = None
+		try:
+			if first is not None and self._colgroups() > 1:
+				# Table cursors with column groups can't be positioned
+				# by search_near: scan from the beginning or end of the
+				# table, passing over the records before the first key.
+				skip = pack(*first) if type(first) == tuple \
+				    else pack(first)
+				self.reset()
+			elif first is not None:
+				self.set_key(first)
+				exact = self.search_near()
+				if exact == WT_NOTFOUND:
+					return
+				# Start on the record found unless it's before the
+				# first key in scan order.
+				if (exact < 0 if prev else exact > 0) or \
+				    (exact == 0 and first_inclusive):
+					here = 1
+			else:
+				# Start at the beginning or end of the table, not
+				# wherever the cursor was left.
+				self.reset()
+			kunpack = self._key_plan.unpack
+			while True:
+				items = self._range_batch(batch, prev, here, skip,
+				    first_inclusive, bound, inclusive, keys_only)
+				here = 0
+				if items:
+					skip = None
+				if keys_only:
+					for k in items:
+						yield kunpack(k)
+					count = len(items)
+				else:
+					for record in self._unpack_batch(items, False):
+						yield record
+					count = len(items) // 2
+				if count < batch:
+					return
+		finally:
+			self.reset()
+
+	def _json_batch(self, n, move):
+		result = []
+		while len(result) < n and move() == 0:
+			result.append(self.get_keys() + self.get_values())
+		return result
+	## @endcond
+
+	def search_many(self, keys, sort=True, default=None):
+		'''search_many(self, keys, sort=True, default=None) -> [value, ...]
+		
+		Search for each of a list of keys, returning their values in
+		the same order as the keys, with default for keys that aren't
+		found.  Values are returned as by get_value.  Unless sort is
+		false, the searches are done in key order, which visits each
+		page of the tree once.  Sorting uses the default collation.
+		Equivalent to calling WT_CURSOR::search repeatedly, in a single
+		call through the Python binding.  The cursor is reset when the
+		searches finish.'''
+		keys = list(keys)
+		result = [default] * len(keys)
+		if self.is_json:
+			for i in range(len(keys)):
+				self.set_key(keys[i])
+				if self.search() == 0:
+					result[i] = self.get_value()
+			self.reset()
+			return result
+		packed = self._pack_keys(keys)
+		order = list(range(len(packed)))
+		if sort:
+			order.sort(key=packed.__getitem__)
+			packed = [packed[i] for i in order]
+		try:
+			values = self._search_many(packed)
+		finally:
+			self.reset()
+		vunpack = self._value_plan.unpack
+		for i, v in zip(order, values):
+			if v is not None:
+				v = vunpack(v)
+				result[i] = v[0] if len(v) == 1 else v
+		return result
+
+	def next_batch(self, n, raw=False):
+		'''next_batch(self, n, raw=False) -> [record, ...]
+		
+		Move the cursor forward up to n times, returning the records.
+		Equivalent to calling WT_CURSOR::next and getting the key and
+		value repeatedly, in a single call through the Python binding.
+		Each record is a list of the key and value columns, as returned
+		when iterating over the cursor, or with raw set, a tuple of
+		the packed key and value.  A batch shorter than n means the
+		end was reached: as when WT_CURSOR::next returns ::WT_NOTFOUND,
+		the cursor has been reset.'''
+		if self.is_json:
+			return self._json_batch(n, self.next)
+		return self._unpack_batch(self._batch(n, 0), raw)
+
+	def prev_batch(self, n, raw=False):
+		'''prev_batch(self, n, raw=False) -> [record, ...]
+		
+		Move the cursor backward up to n times, returning the records,
+		see next_batch.'''
+		if self.is_json:
+			return self._json_batch(n, self.prev)
+		return self._unpack_batch(self._batch(n, 1), raw)
+
+	def range(self, start=None, stop=None, inclusive=False, reverse=False,
+	    keys_only=False, batch=100):
+		'''range(self, start=None, stop=None, inclusive=False, reverse=False, keys_only=False, batch=100) -> iterator
+		
+		Iterate over the records with keys from start up to stop, as
+		returned by iterating the cursor, or key columns alone with
+		keys_only set, in which case values aren't retrieved.  Keys are
+		given as to set_key, a tuple for composite keys; either end may be
+		None for no bound.  The start key is included, and the stop key
+		is included if inclusive is set.  With reverse set, records are
+		returned from stop down to start.
+		
+		Records are read batch at a time in a single call through the
+		Python binding, which compares the raw keys against the end
+		bound and stops the scan there, without unpacking keys that
+		are out of range.  Bounds use the default collation, cursors on
+		objects with a custom collator raise ValueError.  The cursor is
+		reset when the iteration finishes.'''
+		if self.is_json:
+			raise ValueError('JSON cursors cannot be scanned by range')
+		if self._custom_collation():
+			raise ValueError(
+			    'cursors with a custom collator cannot be scanned by range')
+		if reverse:
+			return self._range(1, stop, inclusive, start, True, keys_only,
+			    batch)
+		return self._range(0, start, True, stop, inclusive, keys_only,
+		    batch)
+
+	## @cond DISABLE
+	def _pack_keys(self, keys):
+		pack = self._key_plan.pack
+		return [pack(*k) if type(k) == tuple else pack(k) for k in keys]
+
+	def _pack_values(self, values):
+		pack = self._value_plan.pack
+		return [pack(*v) if type(v) == tuple else pack(v) for v in values]
+
+	def _apply_many(self, op, method, records, transaction):
+		if op == 2:
+			keys, values = list(records), None
+		else:
+			pairs = list(records)
+			keys = [k for k, v in pairs]
+			values = [v for k, v in pairs]
+		if transaction:
+			self.session.begin_transaction()
+		try:
+			if self.is_json:
+				count, ret = 0, 0
+				for i in range(len(keys)):
+					self.set_key(keys[i])
+					if values != None:
+						self.set_value(values[i])
+					ret = method()
+					if ret != 0:
+						break
+					count += 1
+			else:
+				# Keep the Python strings pinned, the cursor may still
+				# reference the last key.
+				self._key = self._pack_keys(keys)
+				self._value = None if values == None else \
+				    self._pack_values(values)
+				count, ret = self._apply(op, self._key, self._value)
+		except:
+			if transaction:
+				self.session.rollback_transaction()
+			raise
+		if ret != 0:
+			if transaction:
+				self.session.rollback_transaction()
+			err = WiredTigerError(wiredtiger_strerror(ret))
+			err.applied = 0 if transaction else count
+			err.index = count
+			raise err
+		if transaction:
+			self.session.commit_transaction()
+		return count
+	## @endcond
+
+	def insert_many(self, records, transaction=False):
+		'''insert_many(self, records, transaction=False) -> int
+		
+		Insert a sequence of (key, value) pairs, equivalent to calling
+		WT_CURSOR::insert for each, with keys and values given as they
+		are to set_key and set_value.  Records are packed up front and
+		applied in a single call through the Python binding; bulk cursors
+		support this method.  Returns the number of records inserted.
+		
+		With transaction set, the batch is applied in a transaction of
+		its own, and any failure rolls the whole batch back.  Otherwise a
+		failure stops the batch, leaving the records before it applied.
+		A failure raises WiredTigerError with two extra attributes:
+		applied, the number of records left applied, and index,
+		the position of the record that failed.'''
+		return self._apply_many(0, self.insert, records, transaction)
+
+	def update_many(self, records, transaction=False):
+		'''update_many(self, records, transaction=False) -> int
+		
+		Update a sequence of (key, value) pairs, equivalent to calling
+		WT_CURSOR::update for each, see insert_many.  A record that
+		doesn't exist for an update fails the batch with ::WT_NOTFOUND
+		when the cursor was opened with overwrite=false.'''
+		return self._apply_many(1, self.update, records, transaction)
+
+	def modify_from(self, old, new, maxdiff, nmod):
+		'''modify_from(self, old, new, maxdiff, nmod) -> int
+		
+		Change the value of the record with the current key from old to
+		new, as given to set_value, by computing the changes with
+		wiredtiger_calc_modify and applying them with WT_CURSOR::modify,
+		in a single call through the Python binding.  When the values
+		differ by more than maxdiff bytes or nmod changes, the whole new
+		value is written with WT_CURSOR::update instead.  Returns 0, or
+		::WT_NOTFOUND if the record doesn't exist.  As with
+		WT_CURSOR::modify, the cursor must be in a snapshot isolation
+		transaction.'''
+		# Keep the new value pinned, an update may still reference it.
+		self._value = self._pack_values([new])
+		count, ret, nfull = self._modify_many(None,
+		    self._pack_values([old]), self._value, maxdiff, nmod)
+		if ret != 0 and ret != WT_NOTFOUND:
+			raise WiredTigerError(wiredtiger_strerror(ret))
+		return ret
+
+	def modify_many(self, records, maxdiff, nmod, transaction=False):
+		'''modify_many(self, records, maxdiff, nmod, transaction=False) -> int
+		
+		Change a sequence of (key, old, new) records, equivalent to
+		calling modify_from for each, see insert_many.  A key that doesn't
+		exist fails the batch with ::WT_NOTFOUND.  With transaction set,
+		the batch runs in a snapshot isolation transaction of its own.
+		Returns the number of records changed.'''
+		records = list(records)
+		if transaction:
+			self.session.begin_transaction('isolation=snapshot')
+		try:
+			# Keep the Python strings pinned, the cursor may still
+			# reference the last key.
+			self._key = self._pack_keys([r[0] for r in records])
+			self._value = self._pack_values([r[2] for r in records])
+			count, ret, nfull = self._modify_many(self._key,
+			    self._pack_values([r[1] for r in records]), self._value,
+			    maxdiff, nmod)
+		except:
+			if transaction:
+				self.session.rollback_transaction()
+			raise
+		if ret != 0:
+			if transaction:
+				self.session.rollback_transaction()
+			err = WiredTigerError(wiredtiger_strerror(ret))
+			err.applied = 0 if transaction else count
+			err.index = count
+			raise err
+		if transaction:
+			self.session.commit_transaction()
+		return count
+
+	def remove_many(self, keys, transaction=False):
+		'''remove_many(self, keys, transaction=False) -> int
+		
+		Remove a sequence of keys, equivalent to calling
+		WT_CURSOR::remove for each, see insert_many.  A key that doesn't
+		exist fails the batch with ::WT_NOTFOUND.'''
+		return self._apply_many(2, self.remove, keys, transaction)
+
+	## @cond DISABLE
+	# Array type codes for the integral format types, see _scan_columns.
+	_scan_typecodes = {
+		'b' : 'b', 'B' : 'B', 't' : 'B', 'h' : 'h', 'H' : 'H',
+		'i' : 'i', 'I' : 'I', 'l' : 'i', 'L' : 'I',
+		'q' : 'q', 'Q' : 'Q', 'r' : 'Q', 'R' : 'Q',
+	}
+
+	def _column_position(self, name, nkey):
+		import re
+		uri = self.uri
+		projection = None
+		if '(' in uri:
+			projection = uri[uri.index('(') + 1:-1].split(',')
+			uri = uri[:uri.index('(')]
+		names = []
+		if uri.startswith('table:'):
+			meta = self.session.open_cursor('metadata:', None, None)
+			meta.set_key(uri)
+			if meta.search() == 0:
+				m = re.search(r'columns=\(([^)]*)\)', meta.get_value())
+				if m:
+					names = m.group(1).split(',')
+			meta.close()
+		if names and projection:
+			names = names[:nkey] + projection
+		if name not in names:
+			raise ValueError('%s: unknown column %r' % (self.uri, name))
+		return names.index(name)
+	## @endcond
+
+	def scan_to_arrays(self, columns=None, start=None, stop=None,
+	    limit=None):
+		'''scan_to_arrays(self, columns=None, start=None, stop=None,
+		    limit=None) -> [array, ...]
+		
+		Scan forward through the records from key start, or from the
+		beginning, up to but not including key stop, or to the end,
+		reading at most limit records.  Returns one array per column,
+		filled without creating Python objects for each value.
+		
+		Columns are numbered from zero, key columns first, or named for
+		tables created with column names; None selects every column.
+		Only integral columns can be selected.  The arrays are NumPy
+		arrays when NumPy is installed, otherwise array.array objects.
+		The stop key is compared using the default collation.  The
+		cursor is reset when the scan finishes.'''
+		if self.is_json:
+			raise ValueError('JSON cursors cannot be scanned to arrays')
+		nkey = _format_count(self.key_format)
+		if columns is None:
+			columns = range(nkey + _format_count(self.value_format))
+		positions = []
+		for c in columns:
+			if isinstance(c, str):
+				c = self._column_position(c, nkey)
+			positions.append(int(c))
+		if limit is None:
+			limit = 0xffffffffffffffff
+		if stop is not None:
+			if not isinstance(stop, tuple):
+				stop = (stop,)
+			stop = self._key_plan.pack(*stop)
+		try:
+			positioned = 0
+			if start is None:
+				# Scan from the beginning, not the current position.
+				self.reset()
+			elif limit > 0:
+				self.set_key(start)
+				exact = self.search_near()
+				if exact == WT_NOTFOUND:
+					limit = 0
+				elif exact >= 0:
+					positioned = 1
+			arrays = self._scan_columns(positions, stop, limit, positioned)
+		finally:
+			self.reset()
+		return [_scan_array(self._scan_typecodes[chr(t)], data)
+		    for t, data in arrays]
+
+	def get_key_view(self):
+		'''get_key_view(self) -> View
+		
+		Return a read-only view of the packed key, referencing
+		WiredTiger's memory rather than copying it.  The view supports
+		the buffer protocol, len, indexing and slicing.  It is only
+		valid while the cursor stays where it is: it is released when
+		the cursor is moved, reset, closed or used to change data, or
+		when the session's transaction ends, after which using it raises
+		ValueError.  While a memoryview, slice or other buffer of the
+		view exists, those operations raise BufferError instead, release
+		such objects before the cursor's memory can change.'''
+		if self.is_json:
+			raise ValueError('views are not supported by JSON cursors')
+		return self._get_view(0)
+
+	def get_value_view(self):
+		'''get_value_view(self) -> View
+		
+		Return a read-only view of the packed value, see
+		get_key_view.  For a value_format of "u", that is the value
+		itself.'''
+		if self.is_json:
+			raise ValueError('views are not supported by JSON cursors')
+		return self._get_view(1)
+
 	def __iter__(self):
 		'''Cursor objects support iteration, equivalent to calling
 		WT_CURSOR::next until it returns ::WT_NOTFOUND.'''
@@ -1081,12 +2417,477 @@ typedef int int_void;
 	}
 
 	int _freecb() {
+		/* Closing the session closes its cursors. */
+		if (releaseSessionViews(self) != 0)
+			return (EBUSY);
+		closeSessionViews(self);
 		return (sessionFreeHandler(self));
 	}
+
+	/* Return whether a transaction is running in the session. */
+	int _transaction_running() {
+		return (F_ISSET(&((WT_SESSION_IMPL *)self)->txn,
+		    WT_TXN_RUNNING) ? 1 : 0);
+	}
+
+	/*
+	 * Read every value from a statistics cursor, returning a tuple of the
+	 * first key and a bytearray of int64_t values indexed from that key.
+	 * The cursor is read without the interpreter lock.
+	 */
+	PyObject *_stat_snapshot(const char *uri, const char *config) {
+		WT_CURSOR *cursor;
+		WT_ITEM buf;
+		PyObject *data, *result;
+		size_t size;
+		uint64_t value;
+		int base, key, ret, t_ret;
+
+		WT_CLEAR(buf);
+		base = -1;
+		{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		if ((ret = $self->open_cursor(
+		    $self, uri, NULL, config, &cursor)) == 0) {
+			while ((ret = cursor->next(cursor)) == 0) {
+				if ((ret = cursor->get_key(cursor, &key)) != 0 ||
+				    (ret = cursor->get_value(
+				    cursor, NULL, NULL, &value)) != 0)
+					break;
+				if (base < 0)
+					base = key;
+				if (key < base) {
+					ret = EINVAL;
+					break;
+				}
+				size = (size_t)(key - base + 1) * sizeof(int64_t);
+				if (size > buf.size) {
+					if ((ret = __wt_buf_extend(
+					    NULL, &buf, size)) != 0)
+						break;
+					memset((uint8_t *)buf.mem + buf.size,
+					    0, size - buf.size);
+					buf.size = size;
+				}
+				((int64_t *)buf.mem)[key - base] = (int64_t)value;
+			}
+			if (ret == WT_NOTFOUND)
+				ret = 0;
+			if ((t_ret = cursor->close(cursor)) != 0 && ret == 0)
+				ret = t_ret;
+		}
+		SWIG_PYTHON_THREAD_END_ALLOW;
+		}
+
+		result = NULL;
+		if (ret != 0)
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+		else if ((data = PyByteArray_FromStringAndSize(
+		    buf.mem, (Py_ssize_t)buf.size)) != NULL)
+			result = Py_BuildValue("(iN)", base < 0 ? 0 : base, data);
+		__wt_buf_free(NULL, &buf);
+		return (result);
+	}
+
+	/*
+	 * Write the records of uri through a dump cursor opened with config,
+	 * formatted as by wt dump, to out, either a file descriptor or an
+	 * object with a write method, about chunk_size bytes at a time.
+	 * Returns the number of records written.  Records are formatted,
+	 * and written to a file descriptor, without the interpreter lock.
+	 */
+	PyObject *_dump_records(const char *uri, const char *config,
+	    PyObject *out, size_t chunk_size, int json, int reverse) {
+		WT_CURSOR *cursor;
+		WT_ITEM buf;
+		PyObject *chunk, *result, *write_method;
+		uint64_t count;
+		size_t off;
+		ssize_t n;
+		int done, fd, ret, t_ret, werr;
+		const char *k, *v;
+
+		fd = -1;
+		write_method = NULL;
+		if (PyInt_Check(out)) {
+			if ((fd = (int)PyInt_AsLong(out)) < 0) {
+				if (!PyErr_Occurred())
+					PyErr_SetString(PyExc_ValueError,
+					    "negative file descriptor");
+				return (NULL);
+			}
+		} else if ((write_method =
+		    PyObject_GetAttrString(out, "write")) == NULL)
+			return (NULL);
+
+		WT_CLEAR(buf);
+		cursor = NULL;
+		count = 0;
+		werr = 0;
+		{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		ret = $self->open_cursor($self, uri, NULL, config, &cursor);
+		SWIG_PYTHON_THREAD_END_ALLOW;
+		}
+		for (done = ret != 0; !done;) {
+			{
+			SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+			for (buf.size = 0; buf.size < chunk_size;) {
+				if ((ret = reverse ? cursor->prev(cursor) :
+				    cursor->next(cursor)) != 0)
+					break;
+				if ((ret = cursor->get_key(cursor, &k)) != 0 ||
+				    (ret = cursor->get_value(cursor, &v)) != 0)
+					break;
+				if ((ret = json ? __wt_buf_catfmt(NULL, &buf,
+				    "%s\n{\n%s,\n%s\n}",
+				    count == 0 ? "" : ",", k, v) :
+				    __wt_buf_catfmt(NULL, &buf,
+				    "%s\n%s\n", k, v)) != 0)
+					break;
+				++count;
+			}
+			if (ret != 0)
+				done = 1;
+			if (ret == WT_NOTFOUND) {
+				ret = 0;
+				if (json && count != 0)
+					ret = __wt_buf_catfmt(NULL, &buf, "\n");
+			}
+			for (off = 0; ret == 0 && fd >= 0 && off < buf.size;)
+				if ((n = write(fd,
+				    (uint8_t *)buf.mem + off, buf.size - off)) >= 0)
+					off += (size_t)n;
+				else if (errno != EINTR) {
+					werr = errno;
+					done = 1;
+					break;
+				}
+			SWIG_PYTHON_THREAD_END_ALLOW;
+			}
+			if (ret != 0 || werr != 0)
+				break;
+			if (write_method != NULL && buf.size != 0) {
+				if ((chunk = PyBytes_FromStringAndSize(
+				    buf.mem, (Py_ssize_t)buf.size)) == NULL)
+					break;
+				result = PyObject_CallFunctionObjArgs(
+				    write_method, chunk, NULL);
+				Py_DECREF(chunk);
+				if (result == NULL)
+					break;
+				Py_DECREF(result);
+			}
+		}
+		if (cursor != NULL && (t_ret = cursor->close(cursor)) != 0 &&
+		    ret == 0)
+			ret = t_ret;
+		__wt_buf_free(NULL, &buf);
+		Py_XDECREF(write_method);
+
+		if (PyErr_Occurred())
+			return (NULL);
+		if (werr != 0) {
+			errno = werr;
+			return (PyErr_SetFromErrno(PyExc_OSError));
+		}
+		if (ret != 0) {
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			return (NULL);
+		}
+		return (PyLong_FromUnsignedLongLong(count));
+	}
+
+	/*
+	 * Return the configuration of an object from a dump header, without
+	 * the settings that would stop it loading into another database, as
+	 * the wt load utility does.
+	 */
+	PyObject *_load_config(const char *config) {
+		PyObject *result;
+		int ret;
+		const char *cfg[2], *p;
+
+		cfg[0] = config;
+		cfg[1] = NULL;
+		if ((ret = __wt_config_merge((WT_SESSION_IMPL *)$self, cfg,
+		    "filename=,id=,checkpoint=,checkpoint_lsn=,version=,source=,",
+		    &p)) != 0) {
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			return (NULL);
+		}
+		result = PyString_FromString(p);
+		__wt_free((WT_SESSION_IMPL *)$self, p);
+		return (result);
+	}
+
+	/*
+	 * Insert the records read from the file descriptor fd, as lines of
+	 * alternating keys and values in a print or hex dump, through a dump
+	 * cursor opened on uri with config.  Returns the number of records
+	 * inserted.  The file is read and the records are inserted without
+	 * the interpreter lock.
+	 */
+	PyObject *_load_records(const char *uri, const char *config, int fd,
+	    size_t chunk_size) {
+		WT_CURSOR *cursor;
+		WT_ITEM buf;
+		uint64_t count;
+		size_t have, keyoff, keep, start;
+		ssize_t n;
+		int eof, haskey, ret, t_ret, werr;
+		char *mem, *nl;
+
+		WT_CLEAR(buf);
+		cursor = NULL;
+		count = 0;
+		have = keyoff = start = 0;
+		eof = haskey = werr = 0;
+		{
+		SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+		if ((ret = $self->open_cursor(
+		    $self, uri, NULL, config, &cursor)) == 0)
+			ret = __wt_buf_extend(NULL, &buf, chunk_size);
+		while (ret == 0 && !eof) {
+			if (have == buf.memsize && (ret = __wt_buf_extend(
+			    NULL, &buf, buf.memsize * 2)) != 0)
+				break;
+			mem = buf.mem;
+			if ((n = read(fd, mem + have, buf.memsize - have)) < 0) {
+				if (errno == EINTR)
+					continue;
+				werr = errno;
+				break;
+			}
+			if (n == 0)
+				eof = 1;
+			have += (size_t)n;
+
+			/* Each complete line is a key or a value. */
+			while (start < have && (nl =
+			    memchr(mem + start, '\n', have - start)) != NULL) {
+				*nl = '\0';
+				if (!haskey) {
+					keyoff = start;
+					haskey = 1;
+				} else {
+					cursor->set_key(cursor, mem + keyoff);
+					cursor->set_value(cursor, mem + start);
+					if ((ret = cursor->insert(cursor)) != 0)
+						break;
+					++count;
+					haskey = 0;
+				}
+				start = (size_t)(nl - mem) + 1;
+			}
+
+			/* Move any partial record to the start of the buffer. */
+			keep = haskey ? keyoff : start;
+			if (keep != 0) {
+				memmove(mem, mem + keep, have - keep);
+				have -= keep;
+				start -= keep;
+				keyoff = 0;
+			}
+		}
+		/* A key without a value, or a line without a newline. */
+		if (ret == 0 && werr == 0 && (haskey || have != 0))
+			ret = EINVAL;
+		if (cursor != NULL &&
+		    (t_ret = cursor->close(cursor)) != 0 && ret == 0)
+			ret = t_ret;
+		SWIG_PYTHON_THREAD_END_ALLOW;
+		}
+		__wt_buf_free(NULL, &buf);
+
+		if (werr != 0) {
+			errno = werr;
+			return (PyErr_SetFromErrno(PyExc_OSError));
+		}
+		if (ret != 0) {
+			SWIG_SetErrorMsg(wtError, wiredtiger_strerror(ret));
+			return (NULL);
+		}
+		return (PyLong_FromUnsignedLongLong(count));
+	}
+
+%pythoncode %{
+	# Counts of the transactions Session.transaction retried after a
+	# conflict, and the seconds spent waiting before retrying them.
+	txn_retries = 0
+	txn_retry_wait = 0.0
+
+	def transaction(self, retries=10, backoff=0.001, max_backoff=1.0,
+	    config=None, commit_config=None):
+		'''transaction(self, retries=10, backoff=0.001, max_backoff=1.0, config=None, commit_config=None) -> decorator
+		
+		Return a decorator that runs a function in a transaction, begun
+		with config and committed with commit_config, returning the
+		function's result.  Transactions use snapshot isolation unless
+		config sets another isolation level: with the session default of
+		read-committed, conflicts aren't detected.  When the function or the commit fails with
+		::WT_ROLLBACK or ::WT_PREPARE_CONFLICT, the transaction is rolled
+		back and the function is run again, up to retries times, after
+		waiting a random time of up to backoff seconds, doubling with
+		each retry to at most max_backoff.  Any other exception rolls the
+		transaction back and is raised, as is the last conflict.
+		
+		The session's txn_retries and txn_retry_wait attributes count
+		the retries and the seconds spent waiting before them.'''
+		# Later settings override earlier ones, the caller's config wins.
+		begin_config = 'isolation=snapshot' + \
+		    (',' + config if config else '')
+		def decorator(fn):
+			def run(*args, **kwargs):
+				return self._run_transaction(retries, backoff,
+				    max_backoff, begin_config, commit_config, fn, args,
+				    kwargs)
+			run.__name__ = fn.__name__
+			run.__doc__ = fn.__doc__
+			return run
+		return decorator
+
+	## @cond DISABLE
+	def _run_transaction(self, retries, backoff, max_backoff, config,
+	    commit_config, fn, args, kwargs):
+		attempt = 0
+		while True:
+			self.begin_transaction(config)
+			try:
+				result = fn(*args, **kwargs)
+			except WiredTigerError as e:
+				self.rollback_transaction()
+				if attempt >= retries or not _txn_conflict(e):
+					raise
+			except:
+				self.rollback_transaction()
+				raise
+			else:
+				# A commit that fails rolls the transaction back.
+				try:
+					self.commit_transaction(commit_config)
+					return result
+				except WiredTigerError as e:
+					if attempt >= retries or not _txn_conflict(e):
+						raise
+			wait = random.uniform(0, min(max_backoff, backoff * 2 ** attempt))
+			time.sleep(wait)
+			attempt += 1
+			self.txn_retries += 1
+			self.txn_retry_wait += wait
+	## @endcond
+
+	def stat_snapshot(self, uri='statistics:', fast=True):
+		'''stat_snapshot(self, uri='statistics:', fast=True) -> StatSnapshot
+		
+		Read every statistic for uri in a single call, instead of
+		iterating over a statistics cursor.  The "statistics:" prefix
+		is added to uri if it is missing, so an empty uri reads the
+		connection statistics.  The statistics are gathered as by the
+		cursor configuration statistics=(fast), or statistics=(all)
+		if fast is false.'''
+		if not uri.startswith('statistics:'):
+			uri = 'statistics:' + uri
+		base, data = self._stat_snapshot(uri,
+		    'statistics=(fast)' if fast else 'statistics=(all)')
+		return StatSnapshot(base, _scan_array('q', data), time.time())
+
+	def get_many(self, uri, keys, sort=True, default=None):
+		'''get_many(self, uri, keys, sort=True, default=None) -> [value, ...]
+		
+		Look up a list of keys in the object named by uri, see
+		Cursor.search_many.'''
+		cursor = self.open_cursor(uri, None, None)
+		try:
+			return cursor.search_many(keys, sort, default)
+		finally:
+			cursor.close()
+
+	def export(self, uri, out, format='print', chunk_size=1 << 20,
+	    reverse=False, checkpoint=None):
+		'''export(self, uri, out, format='print', chunk_size=1 << 20, reverse=False, checkpoint=None) -> int
+		
+		Write the object named by uri to out, a file descriptor or a
+		binary file object, as written by the wt dump utility, which
+		wt load reads back.  The format is "print", "hex" (wt dump -x)
+		or "json" (wt dump -j).  Records are read from a dump cursor and
+		formatted in a single call through the Python binding, and
+		written about chunk_size bytes at a time.  With reverse set,
+		records are written in reverse order (wt dump -r); checkpoint
+		names a checkpoint to dump (wt dump -c).  Returns the number of
+		records written.'''
+		if format not in ('print', 'hex', 'json'):
+			raise ValueError('unknown export format %r' % format)
+		if ':' not in uri:
+			uri = 'table:' + uri
+		if '(' in uri:
+			raise ValueError('projections cannot be exported')
+		json = format == 'json'
+		write = (lambda b: _write_fd(out, b)) if type(out) == int \
+		    else out.write
+
+		ver = wiredtiger_version()
+		if json:
+			write(('{\n    "WiredTiger Dump Version" : '
+			    '"1 (%d.%d.%d)",\n' % tuple(ver[1:])).encode())
+		write(self._dump_header(uri, json, format, ver).encode())
+		config = 'dump=' + format
+		if checkpoint is not None:
+			config = 'checkpoint=' + checkpoint + ',' + config
+		count = self._dump_records(uri, config, out, chunk_size, json,
+		    reverse)
+		if json:
+			write(b'            ]\n        }\n    ]\n}\n')
+		return count
+
+	## @cond DISABLE
+	# The header wt dump writes before the records: the object's
+	# configuration, then its column groups and indices.
+	def _dump_header(self, uri, json, format, ver):
+		cursor = self.open_cursor('metadata:create', None, None)
+		try:
+			cursor.set_key(uri)
+			if cursor.search() != 0:
+				raise WiredTigerError(uri + ': No such object exists')
+			if json:
+				header = '    "%s" : [\n        {\n            ' \
+				    '"config" : "%s",\n' % \
+				    (uri, _json_config(cursor.get_value()))
+			else:
+				header = 'WiredTiger Dump (WiredTiger Version ' \
+				    '%d.%d.%d)\nFormat=%s\nHeader\n%s\n%s\n' % \
+				    (tuple(ver[1:]) + (format, uri, cursor.get_value()))
+			name = uri[uri.index(':') + 1:]
+			for entry in ('colgroup:', 'index:'):
+				header += _dump_parts(cursor, name, entry, json)
+		finally:
+			cursor.close()
+		if json:
+			header += '        },\n        {\n            "data" : ['
+		else:
+			header += 'Data\n'
+		return header
+	## @endcond
+%}
 };
 
 %extend __wt_connection {
+	/*
+	 * WT_CONNECTION::async_new_op, without retrying when all of the ops
+	 * are in use.  The connection argument keeps the arguments numbered as
+	 * they are for async_new_op, the WT_ASYNC_OP ** typemap relies on it.
+	 */
+	int _async_new_op_nowait(WT_CONNECTION *connection, const char *uri,
+	    const char *config, WT_ASYNC_CALLBACK *callback,
+	    WT_ASYNC_OP **asyncopp) {
+		return (connection->async_new_op(
+		    connection, uri, config, callback, asyncopp));
+	}
+
 	int _freecb() {
+		/* Closing the connection closes its sessions and cursors. */
+		if (releaseConnectionViews(self) != 0)
+			return (EBUSY);
 		return (0);
 	}
 };
@@ -1103,6 +2904,11 @@ int diagnostic_build() {
 
 int diagnostic_build();
 
+/* The event buffer, see wiredtiger.events. */
+int _event_buffer(int size);
+PyObject *_event_drain(int max);
+PyObject *_event_stats();
+
 /* Remove / rename parts of the C API that we don't want in Python. */
 %immutable __wt_cursor::session;
 %immutable __wt_cursor::uri;
@@ -1217,6 +3023,20 @@ static int unpackBytesOrString(PyObject *obj, void **datap, size_t *sizep)
 	return (0);
 }
 
+/* Append a copy of the item's data to a list as a bytes object. */
+static int appendItem(PyObject *list, WT_ITEM *item)
+{
+	PyObject *obj;
+	int ret;
+
+	if ((obj = PyBytes_FromStringAndSize(
+	    (const char *)item->data, (Py_ssize_t)item->size)) == NULL)
+		return (-1);
+	ret = PyList_Append(list, obj);
+	Py_DECREF(obj);
+	return (ret);
+}
+
 /* Write to and flush the stream. */
 static int
 writeToPythonStream(const char *streamname, const char *message)
@@ -1273,10 +3093,179 @@ err:	Py_XDECREF(arglist2);
 	return (ret);
 }
 
+/*
+ * When an event buffer is installed, the error and message callbacks queue a
+ * copy of each message in a ring buffer rather than taking the interpreter
+ * lock, and a Python thread drains the buffer in batches.  Each slot has a
+ * sequence number: producers claim a slot by swapping the head, then publish
+ * it; the consumer, which holds the interpreter lock, takes published slots
+ * and advances the tail.  Events arriving when the buffer is full are counted
+ * and dropped.  The buffer is shared by every connection, and once allocated
+ * is never freed, a callback could be running in any thread.  Producers are
+ * counted while they use the buffer, so removing it can wait for events that
+ * are being queued.
+ */
+typedef struct {
+	volatile uint64_t seq;		/* Slot sequence number */
+	uint32_t session_id;		/* Session ID + 1, 0 for none */
+	int is_error;			/* An error, not a message */
+	int error;			/* The error */
+	char *message;			/* The message */
+} PY_EVENT;
+
+static PY_EVENT *pyEvents;
+static uint64_t pyEventsMask;
+static volatile uint64_t pyEventsHead, pyEventsTail, pyEventsDropped;
+static volatile uint32_t pyEventsProducers;
+static volatile int pyEventsEnabled;
+
+/*
+ * Queue an event, without blocking.  Returns ENOTSUP if the event buffer
+ * isn't installed, the event must be written to the Python streams.
+ */
+static int
+queuePythonEvent(
+    WT_SESSION *session, int is_error, int error, const char *message)
+{
+	PY_EVENT *ev;
+	uint64_t pos, seq;
+	int ret;
+	char *copy;
+
+	ret = 0;
+	copy = NULL;
+	(void)__wt_atomic_addv32(&pyEventsProducers, 1);
+	if (!pyEventsEnabled) {
+		ret = ENOTSUP;
+		goto done;
+	}
+	if (__wt_strdup(NULL, message, &copy) != 0) {
+		(void)__wt_atomic_addv64(&pyEventsDropped, 1);
+		goto done;
+	}
+	for (pos = pyEventsHead;; pos = pyEventsHead) {
+		ev = &pyEvents[pos & pyEventsMask];
+		WT_ORDERED_READ(seq, ev->seq);
+		if (seq == pos) {
+			if (__wt_atomic_casv64(&pyEventsHead, pos, pos + 1))
+				break;
+		} else if (seq < pos) {
+			/* The slot hasn't been drained since the last lap. */
+			(void)__wt_atomic_addv64(&pyEventsDropped, 1);
+			__wt_free(NULL, copy);
+			goto done;
+		}
+	}
+	ev->session_id = session == NULL ?
+	    0 : ((WT_SESSION_IMPL *)session)->id + 1;
+	ev->is_error = is_error;
+	ev->error = error;
+	ev->message = copy;
+	WT_PUBLISH(ev->seq, pos + 1);
+
+done:	(void)__wt_atomic_subv32(&pyEventsProducers, 1);
+	return (ret);
+}
+
+/*
+ * Install an event buffer with room for at least size events, or with size
+ * zero, go back to writing events to the Python streams.  Going back waits
+ * for events that are being queued, so a drain afterward finds every event
+ * queued.  The buffer can't be resized once it is allocated.
+ */
+int
+_event_buffer(int size)
+{
+	PY_EVENT *events;
+	uint64_t i, slots;
+
+	if (size <= 0) {
+		pyEventsEnabled = 0;
+		WT_FULL_BARRIER();
+		while (pyEventsProducers != 0)
+			__wt_yield();
+		return (0);
+	}
+	for (slots = 1; slots < (uint64_t)size; slots <<= 1)
+		;
+	if (pyEvents != NULL) {
+		if (slots != pyEventsMask + 1)
+			return (EINVAL);
+	} else {
+		if (__wt_calloc_def(NULL, slots, &events) != 0)
+			return (ENOMEM);
+		for (i = 0; i < slots; i++)
+			events[i].seq = i;
+		pyEventsMask = slots - 1;
+		WT_PUBLISH(pyEvents, events);
+	}
+	WT_PUBLISH(pyEventsEnabled, 1);
+	return (0);
+}
+
+/*
+ * Take up to max events from the buffer, returning a list of tuples of the
+ * session ID or None, the error or None for a message, and the message.
+ */
+PyObject *
+_event_drain(int max)
+{
+	PY_EVENT *ev;
+	PyObject *event, *list;
+	uint64_t pos, seq;
+	int i, ret;
+
+	if ((list = PyList_New(0)) == NULL)
+		return (NULL);
+	for (i = 0; pyEvents != NULL && i < max; i++) {
+		pos = pyEventsTail;
+		ev = &pyEvents[pos & pyEventsMask];
+		WT_ORDERED_READ(seq, ev->seq);
+		if (seq != pos + 1)
+			break;
+		if (ev->session_id == 0)
+			event = ev->is_error ?
+			    Py_BuildValue("(Ois)", Py_None, ev->error, ev->message) :
+			    Py_BuildValue("(OOs)", Py_None, Py_None, ev->message);
+		else
+			event = ev->is_error ?
+			    Py_BuildValue("(Iis)",
+			    ev->session_id - 1, ev->error, ev->message) :
+			    Py_BuildValue("(IOs)",
+			    ev->session_id - 1, Py_None, ev->message);
+		__wt_free(NULL, ev->message);
+		WT_PUBLISH(ev->seq, pos + pyEventsMask + 1);
+		pyEventsTail = pos + 1;
+
+		ret = event == NULL ? -1 : PyList_Append(list, event);
+		Py_XDECREF(event);
+		if (ret != 0) {
+			Py_DECREF(list);
+			return (NULL);
+		}
+	}
+	return (list);
+}
+
+/*
+ * Return a tuple of whether the event buffer is installed, its size, the
+ * number of events waiting in it, and the number of events dropped.
+ */
+PyObject *
+_event_stats()
+{
+	return (Py_BuildValue("(iKKK)", pyEventsEnabled,
+	    (unsigned long long)(pyEvents == NULL ? 0 : pyEventsMask + 1),
+	    (unsigned long long)(pyEventsHead - pyEventsTail),
+	    (unsigned long long)pyEventsDropped));
+}
+
 static int
 pythonErrorCallback(WT_EVENT_HANDLER *handler, WT_SESSION *session, int err,
     const char *message)
 {
+	if (pyEventsEnabled && queuePythonEvent(session, 1, err, message) == 0)
+		return (0);
 	return writeToPythonStream("stderr", message);
 }
 
@@ -1284,9 +3273,467 @@ static int
 pythonMessageCallback(WT_EVENT_HANDLER *handler, WT_SESSION *session,
     const char *message)
 {
+	if (pyEventsEnabled && queuePythonEvent(session, 0, 0, message) == 0)
+		return (0);
 	return writeToPythonStream("stdout", message);
 }
 
+#if PY_MAJOR_VERSION >= 3
+/*
+ * A read-only view of a cursor's key or value, referencing WiredTiger's
+ * memory.  The view exports the memory through the buffer protocol, and
+ * counts the buffers it has exported: memoryviews, slices of them, and other
+ * objects holding a buffer all reference the memory directly, so the view
+ * can't be released while any of them exist.  Once the view is released,
+ * exporting the memory raises ValueError.
+ */
+typedef struct {
+	PyObject_HEAD
+	void *data;		/* WiredTiger's memory, NULL once released */
+	Py_ssize_t size;
+	Py_ssize_t exports;	/* Exported buffers not yet released */
+} PY_VIEW;
+
+static PyTypeObject pyViewType = { PyVarObject_HEAD_INIT(NULL, 0) };
+static PyBufferProcs pyViewBuffer;
+static PyMappingMethods pyViewMapping;
+static PySequenceMethods pyViewSequence;
+
+static PyObject *
+viewNew(const void *data, size_t size)
+{
+	PY_VIEW *view;
+
+	if ((view = PyObject_New(PY_VIEW, &pyViewType)) == NULL)
+		return (NULL);
+	view->data = size == 0 ? (void *)"" : (void *)data;
+	view->size = (Py_ssize_t)size;
+	view->exports = 0;
+	return ((PyObject *)view);
+}
+
+/* Set the exception for using a released view, as memoryview does. */
+static int
+viewCheck(PY_VIEW *view)
+{
+	if (view->data != NULL)
+		return (0);
+	PyErr_SetString(PyExc_ValueError,
+	    "operation forbidden on released view, the cursor's memory may "
+	    "have changed");
+	return (-1);
+}
+
+static int
+viewGetBuffer(PyObject *self, Py_buffer *buf, int flags)
+{
+	PY_VIEW *view;
+
+	view = (PY_VIEW *)self;
+	buf->obj = NULL;
+	if (viewCheck(view) != 0 || PyBuffer_FillInfo(
+	    buf, self, view->data, view->size, 1, flags) != 0)
+		return (-1);
+	++view->exports;
+	return (0);
+}
+
+static void
+viewReleaseBuffer(PyObject *self, Py_buffer *buf)
+{
+	WT_UNUSED(buf);
+	--((PY_VIEW *)self)->exports;
+}
+
+static Py_ssize_t
+viewLength(PyObject *self)
+{
+	if (viewCheck((PY_VIEW *)self) != 0)
+		return (-1);
+	return (((PY_VIEW *)self)->size);
+}
+
+/*
+ * Index or slice the view through a memoryview of it.  A slice is itself a
+ * memoryview of the view's memory, and counts as an export until released.
+ */
+static PyObject *
+viewSubscript(PyObject *self, PyObject *key)
+{
+	PyObject *memory, *result;
+
+	if ((memory = PyMemoryView_FromObject(self)) == NULL)
+		return (NULL);
+	result = PyObject_GetItem(memory, key);
+	Py_DECREF(memory);
+	return (result);
+}
+
+static PyObject *
+viewItem(PyObject *self, Py_ssize_t i)
+{
+	PyObject *index, *result;
+
+	if ((index = PyLong_FromSsize_t(i)) == NULL)
+		return (NULL);
+	result = viewSubscript(self, index);
+	Py_DECREF(index);
+	return (result);
+}
+
+static PyObject *
+viewRichCompare(PyObject *self, PyObject *other, int op)
+{
+	PyObject *memory, *result;
+
+	if (op != Py_EQ && op != Py_NE)
+		Py_RETURN_NOTIMPLEMENTED;
+	/* Like a memoryview, a released view only equals itself. */
+	if (((PY_VIEW *)self)->data == NULL)
+		return (PyBool_FromLong((self == other) == (op == Py_EQ)));
+	if ((memory = PyMemoryView_FromObject(self)) == NULL)
+		return (NULL);
+	result = PyObject_RichCompare(memory, other, op);
+	Py_DECREF(memory);
+	return (result);
+}
+
+static PyObject *
+viewRepr(PyObject *self)
+{
+	PY_VIEW *view;
+
+	view = (PY_VIEW *)self;
+	if (view->data == NULL)
+		return (PyUnicode_FromString("<released wiredtiger view>"));
+	return (PyUnicode_FromFormat(
+	    "<wiredtiger view of %zd bytes>", view->size));
+}
+
+static PyObject *
+viewToBytes(PyObject *self, PyObject *unused)
+{
+	PY_VIEW *view;
+
+	WT_UNUSED(unused);
+	view = (PY_VIEW *)self;
+	if (viewCheck(view) != 0)
+		return (NULL);
+	return (PyBytes_FromStringAndSize((const char *)view->data, view->size));
+}
+
+static PyObject *
+viewRelease(PyObject *self, PyObject *unused)
+{
+	PY_VIEW *view;
+
+	WT_UNUSED(unused);
+	view = (PY_VIEW *)self;
+	if (view->exports != 0) {
+		PyErr_Format(PyExc_BufferError,
+		    "view has %zd exported buffers", view->exports);
+		return (NULL);
+	}
+	view->data = NULL;
+	Py_RETURN_NONE;
+}
+
+static PyObject *
+viewReadonly(PyObject *self, void *closure)
+{
+	WT_UNUSED(self);
+	WT_UNUSED(closure);
+	Py_RETURN_TRUE;
+}
+
+static PyObject *
+viewReleased(PyObject *self, void *closure)
+{
+	WT_UNUSED(closure);
+	return (PyBool_FromLong(((PY_VIEW *)self)->data == NULL));
+}
+
+static PyMethodDef pyViewMethods[] = {
+	{ "tobytes", viewToBytes, METH_NOARGS,
+	    "Return a copy of the view's memory as bytes." },
+	{ "release", viewRelease, METH_NOARGS,
+	    "Release the view, later use raises ValueError." },
+	{ NULL, NULL, 0, NULL }
+};
+
+static PyGetSetDef pyViewGetSet[] = {
+	{ (char *)"readonly", viewReadonly, NULL, NULL, NULL },
+	{ (char *)"released", viewReleased, NULL, NULL, NULL },
+	{ NULL, NULL, NULL, NULL, NULL }
+};
+
+/* Fill in and ready the view type, called when the module is loaded. */
+static int
+viewTypeInit(void)
+{
+	pyViewBuffer.bf_getbuffer = viewGetBuffer;
+	pyViewBuffer.bf_releasebuffer = viewReleaseBuffer;
+	pyViewMapping.mp_length = viewLength;
+	pyViewMapping.mp_subscript = viewSubscript;
+	pyViewSequence.sq_length = viewLength;
+	pyViewSequence.sq_item = viewItem;
+
+	pyViewType.tp_name = "_wiredtiger.View";
+	pyViewType.tp_basicsize = sizeof(PY_VIEW);
+	pyViewType.tp_flags = Py_TPFLAGS_DEFAULT;
+	pyViewType.tp_doc =
+	    "A read-only view of a cursor's key or value, see get_key_view.";
+	pyViewType.tp_repr = viewRepr;
+	pyViewType.tp_richcompare = viewRichCompare;
+	pyViewType.tp_as_buffer = &pyViewBuffer;
+	pyViewType.tp_as_mapping = &pyViewMapping;
+	pyViewType.tp_as_sequence = &pyViewSequence;
+	pyViewType.tp_methods = pyViewMethods;
+	pyViewType.tp_getset = pyViewGetSet;
+	return (PyType_Ready(&pyViewType));
+}
+#endif
+
+/*
+ * Check a cursor's views can be released: fail with BufferError set if any of
+ * them has exported buffers still referencing the cursor's memory.
+ */
+static int
+checkViews(PY_CALLBACK *pcb)
+{
+#if PY_MAJOR_VERSION >= 3
+	PY_VIEW *view;
+	Py_ssize_t i;
+
+	if (pcb->views == NULL)
+		return (0);
+	for (i = 0; i < PyList_GET_SIZE(pcb->views); i++) {
+		view = (PY_VIEW *)PyList_GET_ITEM(pcb->views, i);
+		if (view->exports != 0) {
+			PyErr_SetString(PyExc_BufferError,
+			    "a cursor view has exported buffers, release "
+			    "memoryviews and slices of it before the cursor's "
+			    "memory can change");
+			return (-1);
+		}
+	}
+#else
+	WT_UNUSED(pcb);
+#endif
+	return (0);
+}
+
+/*
+ * Release the views handed out by a cursor: using a view after this raises
+ * ValueError.  Fails, releasing nothing, if a view has exported buffers.  The
+ * interpreter lock must be held.
+ */
+static int
+releaseViews(PY_CALLBACK *pcb)
+{
+	PyObject *views;
+	Py_ssize_t i;
+
+	if (checkViews(pcb) != 0)
+		return (-1);
+	views = pcb->views;
+	pcb->views = NULL;
+#if PY_MAJOR_VERSION >= 3
+	for (i = 0; i < PyList_GET_SIZE(views); i++)
+		((PY_VIEW *)PyList_GET_ITEM(views, i))->data = NULL;
+#else
+	WT_UNUSED(i);
+#endif
+	Py_DECREF(views);
+	return (0);
+}
+
+/*
+ * Count the value fields of a format, appending their types to the types
+ * array unless it's NULL.  Integral types with a repeat count appear once
+ * per value.
+ */
+static int
+scanFields(WT_SESSION_IMPL *session, const char *fmt,
+    char *types, size_t *nfieldsp)
+{
+	WT_PACK pack;
+	WT_PACK_VALUE pv;
+	int ret;
+
+	WT_RET(__pack_init(session, &pack, fmt));
+	while ((ret = __pack_next(&pack, &pv)) == 0) {
+		if (pv.type == 'x')
+			continue;
+		if (types != NULL)
+			*types++ = pv.type;
+		++*nfieldsp;
+	}
+	return (ret == WT_NOTFOUND ? 0 : ret);
+}
+
+/*
+ * Return the width of a native array element for a format type, or zero
+ * if the type isn't integral.
+ */
+static size_t
+scanWidth(char type)
+{
+	switch (type) {
+	case 'b':
+	case 'B':
+	case 't':
+		return (1);
+	case 'h':
+	case 'H':
+		return (2);
+	case 'i':
+	case 'I':
+	case 'l':
+	case 'L':
+		return (4);
+	case 'q':
+	case 'Q':
+	case 'r':
+	case 'R':
+		return (8);
+	}
+	return (0);
+}
+
+/*
+ * Decode a packed key or value, appending the fields selected by the slots
+ * array to their column buffers.  The field count continues across calls, so
+ * value fields follow key fields.
+ */
+static int
+scanRecord(WT_SESSION_IMPL *session, const char *fmt,
+    WT_ITEM *item, const int *slots, size_t *fieldp, WT_ITEM *columns)
+{
+	WT_ITEM *buf;
+	WT_PACK pack;
+	WT_PACK_VALUE pv;
+	size_t width;
+	uint64_t u64;
+	uint32_t u32;
+	uint16_t u16;
+	uint8_t u8;
+	const uint8_t *p, *end;
+	const void *src;
+	int ret;
+
+	p = item->data;
+	end = p + item->size;
+	WT_RET(__pack_init(session, &pack, fmt));
+	while ((ret = __pack_next(&pack, &pv)) == 0) {
+		/* A zero length means "unlimited" to the unpacking code. */
+		if (p == end && pv.type != 'u')
+			return (EINVAL);
+		WT_RET(__unpack_read(session, &pv, &p, (size_t)(end - p)));
+		if (pv.type == 'x')
+			continue;
+		if (slots[*fieldp] != -1) {
+			buf = &columns[slots[*fieldp]];
+			/*
+			 * Signed values are stored in the same union, so
+			 * truncating the unsigned value gives either.
+			 */
+			switch (width = scanWidth(pv.type)) {
+			case 1:
+				u8 = (uint8_t)pv.u.u;
+				src = &u8;
+				break;
+			case 2:
+				u16 = (uint16_t)pv.u.u;
+				src = &u16;
+				break;
+			case 4:
+				u32 = (uint32_t)pv.u.u;
+				src = &u32;
+				break;
+			default:
+				u64 = pv.u.u;
+				src = &u64;
+				break;
+			}
+			WT_RET(__wt_buf_extend(session, buf, buf->size + width));
+			memcpy((uint8_t *)buf->mem + buf->size, src, width);
+			buf->size += width;
+		}
+		++*fieldp;
+	}
+	return (ret == WT_NOTFOUND ? 0 : ret);
+}
+
+/* Check the views handed out by all of a session's cursors, see checkViews. */
+static int
+checkSessionViews(WT_SESSION_IMPL *session)
+{
+	WT_CURSOR *cursor;
+
+	TAILQ_FOREACH(cursor, &session->cursors, q)
+		if (cursor->lang_private != NULL &&
+		    checkViews((PY_CALLBACK *)cursor->lang_private) != 0)
+			return (-1);
+	return (0);
+}
+
+/*
+ * Release the views handed out by all of a session's cursors, or none of
+ * them if any can't be released.
+ */
+static int
+releaseSessionViews(WT_SESSION *session_arg)
+{
+	WT_CURSOR *cursor;
+	WT_SESSION_IMPL *session;
+
+	session = (WT_SESSION_IMPL *)session_arg;
+	if (checkSessionViews(session) != 0)
+		return (-1);
+	TAILQ_FOREACH(cursor, &session->cursors, q)
+		(void)RELEASE_VIEWS(cursor);
+	return (0);
+}
+
+/*
+ * Stop a session's cursors handing out views, once their views are released
+ * before the session is closed.  The engine closes the cursors and frees their
+ * memory without the interpreter lock, no view may reference it by then.
+ */
+static void
+closeSessionViews(WT_SESSION *session_arg)
+{
+	WT_CURSOR *cursor;
+	WT_SESSION_IMPL *session;
+
+	session = (WT_SESSION_IMPL *)session_arg;
+	TAILQ_FOREACH(cursor, &session->cursors, q)
+		if (cursor->lang_private != NULL)
+			((PY_CALLBACK *)cursor->lang_private)->views_closed = 1;
+}
+
+/* Release the views handed out by all of a connection's cursors, or none. */
+static int
+releaseConnectionViews(WT_CONNECTION *conn_arg)
+{
+	WT_CONNECTION_IMPL *conn;
+	uint32_t i;
+
+	conn = (WT_CONNECTION_IMPL *)conn_arg;
+	for (i = 0; i < conn->session_cnt; i++)
+		if (conn->sessions[i].active &&
+		    checkSessionViews(&conn->sessions[i]) != 0)
+			return (-1);
+	for (i = 0; i < conn->session_cnt; i++)
+		if (conn->sessions[i].active) {
+			(void)releaseSessionViews(
+			    (WT_SESSION *)&conn->sessions[i]);
+			closeSessionViews((WT_SESSION *)&conn->sessions[i]);
+		}
+	return (0);
+}
+
 /* Zero out SWIG's pointer to the C object,
  * equivalent to 'pyobj.this = None' in Python.
  */
@@ -1306,6 +3753,12 @@ pythonClose(PY_CALLBACK *pcb)
 		SWIG_Error(SWIG_RuntimeError, "WT SetAttr failed");
 		ret = EINVAL;  /* any non-zero value will do. */
 	}
+	/*
+	 * The engine only closes cursors when their session or connection is
+	 * closed, once the cursors' views are released and no more can be
+	 * handed out, see closeSessionViews.
+	 */
+	Py_XDECREF(pcb->views);
 	Py_XDECREF(pcb->pyobj);
 	Py_XDECREF(pcb->pyasynccb);
 
@@ -1372,6 +3825,9 @@ cursorFreeHandler(WT_CURSOR *cursor)
 
 	pcb = (PY_CALLBACK *)cursor->lang_private;
 	cursor->lang_private = NULL;
+	/* The cursor's views have been released, see Cursor._freecb. */
+	if (pcb != NULL)
+		Py_XDECREF(pcb->views);
 	__wt_free((WT_SESSION_IMPL *)cursor->session, pcb);
 	return (0);
 }
@@ -1472,6 +3928,50 @@ class stat:
 		'''keys for cursors on data source statistics'''
 		pass
 
+	@staticmethod
+	def delta(prev, cur, elapsed=None):
+		'''Return the change in every statistic from snapshot prev to
+		snapshot cur, divided by elapsed seconds if elapsed is given.
+		Every statistic is subtracted, including those that aren't
+		counters.'''
+		if prev.base != cur.base or len(prev.values) != len(cur.values):
+			raise ValueError('snapshots of different statistics')
+		try:
+			values = cur.values - prev.values
+			if elapsed is not None:
+				values = values / float(elapsed)
+		except TypeError:
+			import array, operator
+			values = array.array('q',
+			    map(operator.sub, cur.values, prev.values))
+			if elapsed is not None:
+				values = array.array('d',
+				    [v / float(elapsed) for v in values])
+		return StatSnapshot(cur.base, values, cur.time)
+
+class StatSnapshot(object):
+	'''
+	Every statistic from a statistics cursor, returned by
+	Session.stat_snapshot.  snapshot[key] is the value for a key from
+	stat.conn or stat.dsrc.  values is an array of the values starting with
+	key base, a NumPy array if NumPy is installed, otherwise an array.array.
+	time is when the snapshot was taken, from time.time().
+	'''
+	__slots__ = ('base', 'values', 'time')
+
+	def __init__(self, base, values, time):
+		self.base = base
+		self.values = values
+		self.time = time
+
+	def __getitem__(self, key):
+		if key < self.base:
+			raise IndexError('statistics key out of range')
+		return self.values[key - self.base]
+
+	def __len__(self):
+		return len(self.values)
+
 ## @}
 
 import sys
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# WiredTiger asyncio adapter for async operations
+
+"""asyncio adapter for WiredTiger async operations
+AsyncConnection wraps a connection opened with async=(enabled=true), its
+search, insert, update and remove methods return asyncio futures, so one event
+loop can keep many operations in flight:
+
+    aconn = AsyncConnection(conn, ops_max=1024)
+    await aconn.insert('table:t', key, value)
+    value = await aconn.search('table:t', key)
+
+Operations run on the async worker threads and complete on the event loop.
+At most ops_max operations are given to WiredTiger at once, later operations
+wait in a queue.  The operations that don't find their key raise KeyError.
+"""
+
+import asyncio
+from collections import deque
+
+from wiredtiger import AsyncCallback, WiredTigerError, WT_AOP_INSERT, \
+    WT_AOP_REMOVE, WT_AOP_SEARCH, WT_AOP_UPDATE, WT_NOTFOUND, \
+    wiredtiger_strerror
+
+class _Request(object):
+    '''An operation waiting for, or holding, an async op handle.'''
+    __slots__ = ('future', 'uri', 'config', 'optype', 'key', 'value')
+
+    def __init__(self, future, uri, config, optype, key, value):
+        self.future = future
+        self.uri = uri
+        self.config = config
+        self.optype = optype
+        self.key = key
+        self.value = value
+
+class _Notify(AsyncCallback):
+    '''The callback for one operation, called on an async worker thread.'''
+    def __init__(self, aconn, request, value_plan):
+        self.aconn = aconn
+        self.request = request
+        self.value_plan = value_plan
+
+    def notify(self, op, op_ret, flags):
+        # Exceptions can't be raised into the worker thread, they are passed
+        # to the future instead.  The op is only valid during the callback,
+        # so the value is copied here and unpacked on the event loop.
+        try:
+            value = None
+            if op_ret == 0 and self.request.optype == WT_AOP_SEARCH:
+                value = op._get_value()
+            result = (op_ret, value, None)
+        except Exception as e:
+            result = (0, None, e)
+        try:
+            self.aconn.loop.call_soon_threadsafe(self.aconn._complete,
+                self.request, self.value_plan, *result)
+        except RuntimeError:
+            # The event loop is closed, no one is waiting.
+            pass
+        return 0
+
+class AsyncConnection(object):
+    '''
+    Awaitable operations on a connection.  The AsyncConnection must only be
+    used from its event loop's thread, by default the loop running when it
+    is first used.  ops_max should be no more than the connection's
+    async=(ops_max) setting.
+    '''
+    # How long to wait before retrying when the connection has no free ops.
+    retry_delay = 0.001
+
+    def __init__(self, conn, ops_max=1024, loop=None):
+        self.conn = conn
+        self.ops_max = ops_max
+        self._loop = loop
+        self.in_flight = 0
+        self._queue = deque()
+        self._retry = None
+        self._session = None
+        self._formats = {}
+
+    @property
+    def loop(self):
+        '''The event loop operations complete on.'''
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    def close(self):
+        '''Close the session used to look up formats, operations that are
+        in flight are not affected.'''
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def search(self, uri, key, config=None):
+        '''Return a future for the value of key in the object named by
+        uri.'''
+        return self._submit(uri, config, WT_AOP_SEARCH, key, None)
+
+    def insert(self, uri, key, value, config=None):
+        '''Return a future that completes when the record is inserted.'''
+        return self._submit(uri, config, WT_AOP_INSERT, key, value)
+
+    def update(self, uri, key, value, config=None):
+        '''Return a future that completes when the record is updated.'''
+        return self._submit(uri, config, WT_AOP_UPDATE, key, value)
+
+    def remove(self, uri, key, config=None):
+        '''Return a future that completes when the record is removed.'''
+        return self._submit(uri, config, WT_AOP_REMOVE, key, None)
+
+    # Return the key and value plans for a uri.  An op that is allocated
+    # can't be given back, so keys and values are packed before allocating
+    # one, the formats come from a cursor.
+    def _plans(self, uri):
+        plans = self._formats.get(uri)
+        if plans is None:
+            if self._session is None:
+                self._session = self.conn.open_session()
+            cursor = self._session.open_cursor(uri, None, None)
+            plans = (cursor._key_plan, cursor._value_plan,
+                cursor.key_format == 'r')
+            cursor.close()
+            self._formats[uri] = plans
+        return plans
+
+    def _submit(self, uri, config, optype, key, value):
+        future = self.loop.create_future()
+        try:
+            key_plan, value_plan, is_column = self._plans(uri)
+            if type(key) != tuple:
+                key = (key,)
+            if not is_column:
+                key = key_plan.pack(*key)
+            elif len(key) != 1:
+                raise ValueError('record number keys have one column')
+            if value is not None:
+                if type(value) != tuple:
+                    value = (value,)
+                value = value_plan.pack(*value)
+        except Exception as e:
+            future.set_exception(e)
+            return future
+        self._queue.append(
+            _Request(future, uri, config, optype, key, value))
+        self._start()
+        return future
+
+    # Give queued requests to WiredTiger while there are ops to spare.
+    def _start(self):
+        while self._queue and self.in_flight < self.ops_max:
+            request = self._queue[0]
+            if request.future.done():
+                # Cancelled while it was queued.
+                self._queue.popleft()
+                continue
+            key_plan, value_plan, is_column = self._formats[request.uri]
+            op = self.conn._async_new_op_nowait(request.uri,
+                request.config, _Notify(self, request, value_plan))
+            if op is None:
+                # Other users of the connection hold the remaining ops, or
+                # a completed op hasn't been freed yet.
+                if self._retry is None:
+                    self._retry = self.loop.call_later(
+                        self.retry_delay, self._retry_start)
+                return
+            self._queue.popleft()
+            # Keep the packed strings pinned until the op completes.
+            if is_column:
+                op._set_recno(request.key[0])
+            else:
+                op._key = request.key
+                op._set_key(request.key)
+            if request.value is not None:
+                op._value = request.value
+                op._set_value(request.value)
+            try:
+                if request.optype == WT_AOP_SEARCH:
+                    op.search()
+                elif request.optype == WT_AOP_INSERT:
+                    op.insert()
+                elif request.optype == WT_AOP_UPDATE:
+                    op.update()
+                else:
+                    op.remove()
+            except WiredTigerError as e:
+                if not request.future.done():
+                    request.future.set_exception(e)
+                continue
+            self.in_flight += 1
+
+    def _retry_start(self):
+        self._retry = None
+        self._start()
+
+    # Called on the event loop when an op's callback has run.
+    def _complete(self, request, value_plan, op_ret, value, error):
+        self.in_flight -= 1
+        future = request.future
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            elif op_ret == WT_NOTFOUND:
+                future.set_exception(KeyError())
+            elif op_ret != 0:
+                future.set_exception(
+                    WiredTigerError(wiredtiger_strerror(op_ret)))
+            elif value is not None:
+                v = value_plan.unpack(value)
+                future.set_result(v[0] if len(v) == 1 else v)
+            else:
+                future.set_result(None)
+        self._start()
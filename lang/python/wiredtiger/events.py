@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+#
+# WiredTiger buffered event handling
+
+"""Buffered event handling
+By default, each error or message from WiredTiger is written and flushed to
+sys.stderr or sys.stdout as it happens, with the calling thread holding the
+interpreter lock.  An EventHandler instead has the engine queue events in a
+fixed-size buffer, without the interpreter lock, and drains the buffer in
+batches from a thread of its own:
+
+    handler = EventHandler(size=4096)
+    handler.start()
+    conn = wiredtiger_open(home, 'create,verbose=[checkpoint]')
+    ...
+    conn.close()
+    handler.stop()
+
+Subclass EventHandler and override handle to process the events, which are
+tuples of (session, error, message): session is the ID of the session that
+reported the event, or None, and error is the error for an error, or None for
+a message.  Events arriving while the buffer is full are dropped and counted.
+
+The buffer is shared by every connection in the process, so only one handler
+can be running at a time, and the buffer keeps its size once allocated.
+"""
+
+import sys, threading
+
+from wiredtiger import WiredTigerError, \
+    _event_buffer, _event_drain, _event_stats
+
+class EventHandler(object):
+    '''
+    Drain WiredTiger events from the event buffer, batch events at a time,
+    waiting interval seconds when the buffer is empty.
+    '''
+    _running = None
+    _running_lock = threading.Lock()
+
+    def __init__(self, size=4096, batch=256, interval=0.05):
+        self.size = size
+        self.batch = batch
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def handle(self, events):
+        '''
+        Process a list of events.  By default errors are written to
+        sys.stderr and messages to sys.stdout, flushing each once per batch.
+        '''
+        streams = set()
+        for session, error, message in events:
+            stream = sys.stdout if error is None else sys.stderr
+            stream.write(message + '\n')
+            streams.add(stream)
+        for stream in streams:
+            stream.flush()
+
+    def drain(self):
+        '''
+        Process the events waiting in the buffer, returning their number.
+        '''
+        count = 0
+        while True:
+            events = _event_drain(self.batch)
+            if events:
+                count += len(events)
+                self.handle(events)
+            if len(events) < self.batch:
+                return count
+
+    def stats(self):
+        '''
+        Return a dictionary of the buffer size, the number of events waiting
+        in it, and the number of events dropped since it was allocated.
+        '''
+        enabled, size, queued, dropped = _event_stats()
+        return dict(size=size, queued=queued, dropped=dropped)
+
+    @property
+    def dropped(self):
+        '''The number of events dropped while the buffer was full.'''
+        return _event_stats()[3]
+
+    def start(self):
+        '''
+        Install the event buffer and start draining it.
+        '''
+        with EventHandler._running_lock:
+            if EventHandler._running is not None:
+                raise WiredTigerError('an event handler is already running')
+            _event_buffer(self.size)
+            EventHandler._running = self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+            name='wiredtiger-events')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        '''
+        Go back to writing events to the Python streams, process the events
+        left in the buffer and stop the draining thread.  Events that other
+        threads are queueing when the handler stops are processed too.
+        '''
+        with EventHandler._running_lock:
+            if EventHandler._running is not self:
+                return
+            _event_buffer(0)
+            EventHandler._running = None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.drain()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self.drain() == 0:
+                self._stop.wait(self.interval)
@@ -29,7 +29,8 @@
 # WiredTiger fixed-size packing and unpacking functions, using the Python
 # struct library.
 
-import struct
+import struct, threading
+from collections import OrderedDict
 from wiredtiger.packing import empty_pack
 
 def __wt2struct(fmt):
@@ -43,7 +44,79 @@ def __wt2struct(fmt):
         tfmt = '>'
     return tfmt, fmt.replace('r', 'Q')
 
+# Translate a format where every field has a fixed width, where strings have
+# sizes, to a struct format.  Return None for any other format.
+def __fixed_format(fmt):
+    tfmt, fmt = __wt2struct(fmt)
+    if not fmt:
+        return None
+    pfmt = tfmt
+    sized = False
+    for f in fmt:
+        if f.isdigit():
+            sized = True
+        elif f in 'Su':
+            if not sized:
+                return None
+            f = 's'
+            sized = False
+        elif f in 'xbBhHiIlLqQs':
+            sized = False
+        else:
+            return None
+        pfmt += f
+    return pfmt
+
+# Structs for fixed-width formats are kept in a small LRU cache keyed by the
+# format string, None marks a format that isn't fixed-width.
+struct_cache_size = 128
+_struct_cache = OrderedDict()
+_struct_lock = threading.Lock()
+
+def compile_format(fmt):
+    '''
+    Return a cached struct.Struct for a fixed-width format, or None if the
+    format has a field without a fixed width: an S or u with no size, or t.
+    '''
+    with _struct_lock:
+        try:
+            compiled = _struct_cache.pop(fmt)
+        except KeyError:
+            pfmt = __fixed_format(fmt)
+            compiled = None if pfmt is None else struct.Struct(pfmt)
+            while len(_struct_cache) >= struct_cache_size:
+                _struct_cache.popitem(last=False)
+        _struct_cache[fmt] = compiled
+    return compiled
+
+def __fixed(fmt):
+    compiled = compile_format(fmt)
+    if compiled is None:
+        raise ValueError('format %r is not fixed-width' % fmt)
+    return compiled
+
+def calcsize(fmt):
+    '''Return the packed size of a fixed-width format.'''
+    return __fixed(fmt).size
+
+def pack_into(fmt, buffer, offset, *values):
+    '''
+    Pack values with a fixed-width format into a writable buffer, such as a
+    bytearray, starting at offset.
+    '''
+    __fixed(fmt).pack_into(buffer, offset, *values)
+
+def unpack_from(fmt, buffer, offset=0):
+    '''
+    Unpack a fixed-width format from a buffer starting at offset, the buffer
+    may hold more data after it.
+    '''
+    return __fixed(fmt).unpack_from(buffer, offset)
+
 def unpack(fmt, s):
+    compiled = compile_format(fmt)
+    if compiled is not None:
+        return compiled.unpack(s)
     tfmt, fmt = __wt2struct(fmt)
     if not fmt:
         return ()
@@ -87,6 +160,9 @@ def unpack(fmt, s):
     return result
 
 def pack(fmt, *values):
+    compiled = compile_format(fmt)
+    if compiled is not None:
+        return compiled.pack(*values)
     pfmt, fmt = __wt2struct(fmt)
     if not fmt:
         return empty_pack
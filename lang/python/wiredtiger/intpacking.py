@@ -124,6 +124,13 @@ def unpack_int(b):
         sz = getbits(marker, 4)
         return (POS_2BYTE_MAX + 1 + get_int(b[1:], sz), b[sz+1:])
 
+# Use the compiled accelerator if it was built, see packing.py.
+_pack_int_python, _unpack_int_python = pack_int, unpack_int
+try:
+    from wiredtiger._packing import pack_int, unpack_int
+except ImportError:
+    pass
+
 # Sanity testing
 if __name__ == '__main__':
     import random
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+#
+# WiredTiger parallel dump and load
+
+"""Parallel dump and load
+dump writes objects to a directory, one file per object, as the wt dump utility
+writes them, and load loads the files in a directory into a database, both in a
+pool of threads with a session per object:
+
+    dump(conn, 'dump.dir', workers=8)
+    load(conn2, 'dump.dir', workers=8, progress=print)
+
+The files can also be loaded by wt load.  Records are written by Session.export
+and loaded through a dump cursor without holding the interpreter lock, so the
+objects are processed in parallel.  Loads use bulk cursors, and create a
+table's indices after its records are loaded, building each index once.
+
+Both can be resumed: dump writes each file under a temporary name, renaming it
+when the file is complete, and load marks each file when its object is loaded
+into a database, keeping the marks for each target database apart.  With resume
+set, objects already done are skipped, and objects an earlier, interrupted load
+created and left partially loaded are dropped and loaded again.  Resuming is
+off by default: a dump can only be resumed if its source hasn't changed since,
+and load never drops objects it didn't create.
+
+progress is called with a TableProgress as each object is done.
+
+The module needs concurrent.futures: Python 3, or on Python 2, the futures
+package.
+"""
+
+import hashlib, os, time
+from collections import namedtuple
+try:
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+except ImportError:
+    raise ImportError('wiredtiger.migrate needs concurrent.futures: '
+        'use Python 3, or install the futures package on Python 2')
+try:
+    from urllib.parse import quote
+except ImportError:
+    from urllib import quote
+
+class TableProgress(namedtuple('TableProgress',
+    'uri path records bytes seconds skipped')):
+    '''
+    The result of dumping or loading an object: its uri, the path of its
+    dump file, the number of records, the size of the file, the seconds
+    taken, and whether it was skipped because it was already done.
+    '''
+    __slots__ = ()
+
+    @property
+    def records_per_second(self):
+        return self.records / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+# Header lines are bytes, the API takes native strings.
+def _str(b):
+    return b if str is bytes else b.decode()
+
+def _path(directory, uri):
+    return os.path.join(directory, quote(uri, safe='') + '.dump')
+
+# The directory of load's marks for a target database, inside the dump
+# directory.
+def _markers(conn, directory):
+    home = os.path.abspath(conn.get_home())
+    return os.path.join(directory,
+        'load.' + hashlib.sha1(home.encode()).hexdigest()[:16])
+
+def _tables(conn):
+    session = conn.open_session()
+    try:
+        cursor = session.open_cursor('metadata:', None, None)
+        return [k for k, v in cursor if k.startswith('table:')]
+    finally:
+        session.close()
+
+def _exists(session, uri):
+    cursor = session.open_cursor('metadata:', None, None)
+    try:
+        cursor.set_key(uri)
+        return cursor.search() == 0
+    finally:
+        cursor.close()
+
+# Run the jobs in a pool of threads, reporting each result as it finishes,
+# and return the results in uri order.
+def _run(workers, progress, fn, jobs):
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(fn, *args) for args in jobs]
+        for f in as_completed(futures):
+            result = f.result()
+            if progress is not None:
+                progress(result)
+            results.append(result)
+    return sorted(results)
+
+def _dump_one(conn, uri, directory, format, resume, chunk_size):
+    path = _path(directory, uri)
+    if resume and os.path.exists(path):
+        return TableProgress(uri, path, 0, os.path.getsize(path), 0.0, True)
+    start = time.time()
+    session = conn.open_session()
+    try:
+        with open(path + '.tmp', 'wb') as f:
+            records = session.export(uri, f, format, chunk_size)
+    finally:
+        session.close()
+    os.rename(path + '.tmp', path)
+    return TableProgress(uri, path, records, os.path.getsize(path),
+        time.time() - start, False)
+
+def dump(conn, directory, uris=None, workers=4, format='print', resume=False,
+    progress=None, chunk_size=1 << 20):
+    '''
+    Dump the objects named by uris, by default every table, to files in
+    directory, in up to workers threads.  The format is "print" or "hex",
+    see Session.export.  With resume set, files already in directory are
+    kept.  Returns a list of TableProgress.
+    '''
+    if format not in ('print', 'hex'):
+        raise ValueError('unknown dump format %r' % format)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    if uris is None:
+        uris = _tables(conn)
+    return _run(workers, progress, _dump_one,
+        [(conn, uri, directory, format, resume, chunk_size) for uri in uris])
+
+# Read a dump header, returning the format, a list of the (uri, config)
+# pairs of the objects to create, and the offset of the records.
+def _read_header(path, f):
+    if not f.readline().startswith(b'WiredTiger Dump'):
+        raise ValueError('%s: not a WiredTiger dump' % path)
+    line = f.readline()
+    if line == b'Format=print\n':
+        format = 'print'
+    elif line == b'Format=hex\n':
+        format = 'hex'
+    else:
+        raise ValueError('%s: unsupported dump format' % path)
+    if f.readline() != b'Header\n':
+        raise ValueError('%s: no dump header' % path)
+    objects = []
+    while True:
+        uri = f.readline()
+        if uri == b'Data\n':
+            break
+        config = f.readline()
+        if not uri.endswith(b'\n') or not config.endswith(b'\n'):
+            raise ValueError('%s: truncated dump header' % path)
+        objects.append((_str(uri[:-1]), _str(config[:-1])))
+    if not objects:
+        raise ValueError('%s: no objects in dump header' % path)
+    return format, objects, f.tell()
+
+# Load a file: an object being loaded is marked "loading" if this load
+# created it, and "loaded" once its records are loaded.
+def _load_one(conn, path, markers, resume, bulk, chunk_size):
+    name = os.path.join(markers, os.path.basename(path))
+    loading, loaded = name + '.loading', name + '.loaded'
+    if resume and os.path.exists(loaded):
+        with open(loaded) as f:
+            uri, records = f.read().split()
+        return TableProgress(uri, path, int(records), os.path.getsize(path),
+            0.0, True)
+    start = time.time()
+    with open(path, 'rb') as f:
+        format, objects, offset = _read_header(path, f)
+    uri = objects[0][0]
+    session = conn.open_session()
+    try:
+        exists = _exists(session, uri)
+        if exists and resume and os.path.exists(loading):
+            session.drop(uri)
+            exists = False
+        if not exists:
+            with open(loading, 'w') as f:
+                f.write('%s\n' % uri)
+        # Bulk cursors can't load tables with indices: create the
+        # indices once the records are loaded.
+        indices = [o for o in objects if o[0].startswith('index:')]
+        for name, config in objects:
+            if not name.startswith('index:'):
+                session.create(name, session._load_config(config))
+        config = 'dump=' + format + (',bulk' if bulk else '')
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.lseek(fd, offset, os.SEEK_SET)
+            records = session._load_records(uri, config, fd, chunk_size)
+        finally:
+            os.close(fd)
+        for name, config in indices:
+            session.create(name, session._load_config(config))
+    finally:
+        session.close()
+    with open(loaded, 'w') as f:
+        f.write('%s\n%d\n' % (uri, records))
+    if os.path.exists(loading):
+        os.remove(loading)
+    return TableProgress(uri, path, records, os.path.getsize(path),
+        time.time() - start, False)
+
+def load(conn, directory, workers=4, resume=False, bulk=True, progress=None,
+    chunk_size=1 << 20):
+    '''
+    Load the dump files in directory, in up to workers threads, creating
+    each object as described by its file's header.  Unless bulk is false,
+    objects are loaded through bulk cursors, which requires that they
+    don't already exist.  With resume set, objects an earlier load of
+    directory into the same database finished are skipped.  Returns a
+    list of TableProgress.
+    '''
+    paths = sorted(os.path.join(directory, name)
+        for name in os.listdir(directory) if name.endswith('.dump'))
+    markers = _markers(conn, directory)
+    if not os.path.isdir(markers):
+        os.makedirs(markers)
+    return _run(workers, progress, _load_one,
+        [(conn, path, markers, resume, bulk, chunk_size) for path in paths])
@@ -49,6 +49,10 @@ Format  Python  Notes
   u     str     raw byte array
 """
 
+import threading
+from collections import OrderedDict
+from functools import partial
+
 try:
     from wiredtiger.packutil import _chr, _is_string, _ord, _string_result, \
         empty_pack, x00
@@ -84,14 +88,11 @@ def __unpack_iter_fmt(fmt):
             size = 0
             havesize = 0
 
-def unpack(fmt, s):
-    tfmt, fmt = __get_type(fmt)
-    if not fmt:
-        return ()
-    if tfmt != '.':
-        raise ValueError('Only variable-length encoding is currently supported')
+# Unpack using a sequence of parsed fields, as generated by __unpack_iter_fmt;
+# last is the offset of the final character of the format.
+def __unpack_fields(fields, last, s):
     result = []
-    for offset, havesize, size, f in __unpack_iter_fmt(fmt):
+    for offset, havesize, size, f in fields:
         if f == 'x':
             s = s[size:]
             # Note: no value, don't increment i
@@ -101,7 +102,7 @@ def unpack(fmt, s):
                     pass
                 elif f == 'S':
                     size = s.find(x00)
-                elif f == 'u' and offset == len(fmt) - 1:
+                elif f == 'u' and offset == last:
                     # A WT_ITEM with a NULL data field will be appear as None.
                     if s == None:
                         s = empty_pack
@@ -137,9 +138,17 @@ def unpack(fmt, s):
                 result.append(v)
     return result
 
-def __pack_iter_fmt(fmt, values):
+def unpack(fmt, s):
+    tfmt, fmt = __get_type(fmt)
+    if not fmt:
+        return ()
+    if tfmt != '.':
+        raise ValueError('Only variable-length encoding is currently supported')
+    return __unpack_fields(__unpack_iter_fmt(fmt), len(fmt) - 1, s)
+
+def __pack_iter_fmt(fields, values):
     index = 0
-    for offset, havesize, size, char in __unpack_iter_fmt(fmt):
+    for offset, havesize, size, char in fields:
         if char == 'x':  # padding no value
             yield offset, havesize, size, char, None
         elif char in 'SsUut':
@@ -152,15 +161,10 @@ def __pack_iter_fmt(fmt, values):
                 yield offset, havesize, 1, char, value
                 index = index + 1
 
-def pack(fmt, *values):
-    tfmt, fmt = __get_type(fmt)
-    if not fmt:
-        return ()
-    if tfmt != '.':
-        raise ValueError('Only variable-length encoding is currently supported')
+# Pack using a sequence of parsed fields, see __unpack_fields.
+def __pack_fields(fields, last, *values):
     result = empty_pack
-    i = 0
-    for offset, havesize, size, f, val in __pack_iter_fmt(fmt, values):
+    for offset, havesize, size, f, val in __pack_iter_fmt(fields, values):
         if f == 'x':
             if not havesize:
                 result += x00
@@ -175,7 +179,7 @@ def pack(fmt, *values):
             if havesize or f == 's':
                 if l > size:
                     l = size
-            elif (f == 'u' and offset != len(fmt) - 1) or f == 'U':
+            elif (f == 'u' and offset != last) or f == 'U':
                 result += pack_int(l)
             if _is_string(val) and f in 'Ss':
                 result += str(val[:l]).encode()
@@ -212,3 +216,233 @@ def pack(fmt, *values):
             # integral type
             result += pack_int(val)
     return result
+
+def pack(fmt, *values):
+    tfmt, fmt = __get_type(fmt)
+    if not fmt:
+        return ()
+    if tfmt != '.':
+        raise ValueError('Only variable-length encoding is currently supported')
+    return __pack_fields(__unpack_iter_fmt(fmt), len(fmt) - 1, *values)
+
+# Keep the pure Python implementations available under their own names, then
+# use the compiled accelerator in their place if it was built.  It produces
+# byte-identical results, see _packing.c.
+_pack_python, _unpack_python = pack, unpack
+try:
+    from wiredtiger._packing import pack, unpack
+    accelerated = True
+except ImportError:
+    accelerated = False
+
+# Compiled format plans.
+#
+# A plan is a format string parsed once for repeated packing and unpacking.
+# Cursors hold plans for their key and value formats, so the per-record work
+# doesn't include parsing the format.  With the accelerator available, a plan
+# simply binds the format to the compiled functions.
+
+# Formats made up only of integers, the common case for keys, get simpler loops.
+def __unpack_ints(count, s):
+    result = []
+    for i in range(count):
+        v, s = unpack_int(s)
+        result.append(v)
+    return result
+
+def __pack_ints(count, *values):
+    return empty_pack.join([pack_int(values[i]) for i in range(count)])
+
+class PackPlan(object):
+    '''
+    A compiled format string, returned by compile_format.
+    plan.pack(*values) is equivalent to pack(fmt, *values), and
+    plan.unpack(s) is equivalent to unpack(fmt, s).
+    '''
+    __slots__ = ('format', 'pack', 'unpack', '_layout')
+
+    def __init__(self, fmt, pack, unpack):
+        self.format = fmt
+        self.pack = pack
+        self.unpack = unpack
+        self._layout = None
+
+    def __repr__(self):
+        return 'PackPlan(%r)' % self.format
+
+    def row(self, s, head=()):
+        '''
+        Return a Row for s, packed with this format, that unpacks each
+        column when it is used, after the already unpacked columns in head.
+        '''
+        if self._layout is None:
+            self._layout = _row_layout(self.format)
+        return Row(head, self._layout, s)
+
+# Build a plan from the pure Python functions.
+def _python_plan(fmt):
+    tfmt, body = __get_type(fmt)
+    if not body or tfmt != '.':
+        return PackPlan(fmt,
+            partial(_pack_python, fmt), partial(_unpack_python, fmt))
+    fields = tuple(__unpack_iter_fmt(body))
+    last = len(body) - 1
+    if all(f not in 'xSsUutBb' for offset, havesize, size, f in fields):
+        count = sum(size for offset, havesize, size, f in fields)
+        return PackPlan(fmt,
+            partial(__pack_ints, count), partial(__unpack_ints, count))
+    return PackPlan(fmt, partial(__pack_fields, fields, last),
+        partial(__unpack_fields, fields, last))
+
+def __new_plan(fmt):
+    if accelerated:
+        return PackPlan(fmt, partial(pack, fmt), partial(unpack, fmt))
+    return _python_plan(fmt)
+
+# Plans are kept in a small LRU cache keyed by the format string.
+plan_cache_size = 128
+_plan_cache = OrderedDict()
+_plan_lock = threading.Lock()
+
+def compile_format(fmt):
+    '''Return the PackPlan for a format string, compiling it if necessary.'''
+    with _plan_lock:
+        plan = _plan_cache.pop(fmt, None)
+        if plan is None:
+            plan = __new_plan(fmt)
+            while len(_plan_cache) >= plan_cache_size:
+                _plan_cache.popitem(last=False)
+        _plan_cache[fmt] = plan
+    return plan
+
+# Lazy rows.
+#
+# A row layout describes each column of a format: the pad bytes before it, how
+# to find its end, and the format used to unpack it alone.  Integers repeated
+# with a count are separate columns.
+_INT, _FIXED, _NUL, _LAST, _SIZED = range(5)
+
+def _row_layout(fmt):
+    tfmt, fmt = __get_type(fmt)
+    if not fmt:
+        return ()
+    if tfmt != '.':
+        raise ValueError('Only variable-length encoding is currently supported')
+    layout = []
+    pad = 0
+    last = len(fmt) - 1
+    for offset, havesize, size, f in __unpack_iter_fmt(fmt):
+        if f == 'x':
+            pad += size
+            continue
+        if f in 'SsUu':
+            colfmt = str(size) + f if havesize else f
+            if havesize or f == 's':
+                column = (pad, _FIXED, size, colfmt)
+            elif f == 'S':
+                column = (pad, _NUL, 0, f)
+            elif f == 'u' and offset == last:
+                column = (pad, _LAST, 0, f)
+            else:
+                column = (pad, _SIZED, 0, 'U')
+            layout.append(column)
+        elif f == 't':
+            colfmt = str(size) + f if havesize else f
+            layout.append((pad, _FIXED, 1, colfmt))
+        elif f in 'Bb':
+            layout.append((pad, _FIXED, 1, f))
+            layout.extend([(0, _FIXED, 1, f)] * (size - 1))
+        else:
+            layout.append((pad, _INT, 0, f))
+            layout.extend([(0, _INT, 0, f)] * (size - 1))
+        pad = 0
+    return tuple(layout)
+
+# The length of the packed integer starting at s[offset], see intpacking.py.
+def _int_size(s, offset):
+    marker = _ord(s[offset])
+    if marker < 0x20:
+        return 9 - (marker & 0xf)
+    if marker < 0x40 or 0xc0 <= marker < 0xe0:
+        return 2
+    if marker < 0xc0:
+        return 1
+    return 1 + (marker & 0xf)
+
+class Row(object):
+    '''
+    A record that keeps its packed columns, returned by PackPlan.row.  A
+    column is unpacked each time it is read, the offsets of the columns
+    before it are remembered.  A Row is a read-only sequence: it can be
+    indexed, sliced, iterated over and compared with a list.
+    '''
+    __slots__ = ('_head', '_layout', '_data', '_ends')
+
+    def __init__(self, head, layout, s):
+        self._head = head
+        self._layout = layout
+        self._data = empty_pack if s is None else s
+        self._ends = [0]
+
+    def __len__(self):
+        return len(self._head) + len(self._layout)
+
+    # Return the start and end offsets of a column in the packed data.
+    def _bounds(self, i):
+        ends = self._ends
+        layout = self._layout
+        s = self._data
+        while len(ends) <= i + 1:
+            pad, kind, size, colfmt = layout[len(ends) - 1]
+            start = ends[-1] + pad
+            if kind == _INT:
+                end = start + _int_size(s, start)
+            elif kind == _FIXED:
+                end = start + size
+            elif kind == _NUL:
+                end = s.find(x00, start) + 1
+            elif kind == _LAST:
+                end = len(s)
+            else:
+                end = start + _int_size(s, start)
+                end += unpack_int(s[start:end])[0]
+            ends.append(end)
+        return ends[i] + layout[i][0], ends[i + 1]
+
+    def _column(self, i):
+        start, end = self._bounds(i)
+        colfmt = self._layout[i][3]
+        if self._layout[i][1] == _INT:
+            return unpack_int(self._data[start:end])[0]
+        return unpack(colfmt, self._data[start:end])[0]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        nhead = len(self._head)
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError('row index out of range')
+        if i < nhead:
+            return self._head[i]
+        return self._column(i - nhead)
+
+    def __iter__(self):
+        for v in self._head:
+            yield v
+        for i in range(len(self._layout)):
+            yield self._column(i)
+
+    def __eq__(self, other):
+        if isinstance(other, Row):
+            other = list(other)
+        return list(self) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Row(%r)' % list(self)
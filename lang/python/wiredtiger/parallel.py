@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# WiredTiger parallel scans
+
+"""Parallel scans
+scan splits an object's key space into ranges and scans each range on its own
+session, in a pool of threads.  The scans release the interpreter lock while
+reading from WiredTiger, see Cursor.next_batch.
+
+    counts = scan(conn, 'table:t', workers=8, fn=lambda records:
+        sum(1 for r in records))
+
+Row-store objects are split using keys sampled by a next_random cursor,
+column-store objects into equal record number ranges.  The ranges are
+compared using the default collation.
+
+A database can only be open in one process, so only threads are used.
+
+The module needs concurrent.futures: Python 3, or on Python 2, the futures
+package.
+"""
+
+try:
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+except ImportError:
+    raise ImportError('wiredtiger.parallel needs concurrent.futures: '
+        'use Python 3, or install the futures package on Python 2')
+
+from wiredtiger import WT_NOTFOUND
+
+# Return the sorted, distinct packed keys splitting uri into at most n ranges.
+def _boundaries(session, uri, n, samples):
+    if n <= 1:
+        return []
+    cursor = session.open_cursor(uri, None, None)
+    try:
+        plan = cursor._key_plan
+        if cursor.key_format == 'r':
+            if cursor.prev() != 0:
+                return []
+            last = cursor.get_key()
+            keys = set(1 + last * i // n for i in range(1, n))
+            return [plan.pack(k) for k in sorted(keys) if k > 1]
+    finally:
+        cursor.close()
+
+    nsamples = n * samples
+    cursor = session.open_cursor(uri, None,
+        'next_random=true,next_random_sample_size=%d' % nsamples)
+    try:
+        keys = set()
+        for i in range(nsamples):
+            if cursor.next() != 0:
+                break
+            keys.add(plan.pack(*cursor.get_keys()))
+    finally:
+        cursor.close()
+    if not keys:
+        return []
+    keys = sorted(keys)
+    return sorted(set(keys[len(keys) * i // n] for i in range(1, n)))
+
+def _key(plan, packed):
+    key = plan.unpack(packed)
+    return key[0] if len(key) == 1 else tuple(key)
+
+def ranges(conn, uri, n, samples=100):
+    '''
+    Split the key space of uri into at most n ranges of roughly equal size,
+    returning a list of (start, stop) key pairs.  Each range includes start
+    and excludes stop, None is the beginning or end of the object.  samples
+    is the number of keys sampled for each range.
+    '''
+    session = conn.open_session()
+    try:
+        bounds = _boundaries(session, uri, n, samples)
+        cursor = session.open_cursor(uri, None, None)
+        plan = cursor._key_plan
+        cursor.close()
+    finally:
+        session.close()
+    keys = [None] + [_key(plan, k) for k in bounds] + [None]
+    return list(zip(keys[:-1], keys[1:]))
+
+# Yield the records from packed key start up to, but not including, packed
+# key stop.
+def _records(cursor, start, stop, batch):
+    kunpack = cursor._key_plan.unpack
+    vunpack = cursor._value_plan.unpack
+    if start is not None:
+        cursor.set_key(*kunpack(start))
+        exact = cursor.search_near()
+        if exact == WT_NOTFOUND:
+            return
+        if exact >= 0:
+            if stop is not None and \
+                cursor._key_plan.pack(*cursor.get_keys()) >= stop:
+                return
+            yield cursor.get_keys() + cursor.get_values()
+    while True:
+        records = cursor.next_batch(batch, raw=True)
+        for k, v in records:
+            if stop is not None and k >= stop:
+                return
+            yield kunpack(k) + vunpack(v)
+        if len(records) < batch:
+            return
+
+def _scan_range(conn, uri, config, start, stop, fn, batch):
+    session = conn.open_session()
+    try:
+        cursor = session.open_cursor(uri, None, config)
+        return fn(_records(cursor, start, stop, batch))
+    finally:
+        session.close()
+
+def iscan(conn, uri, workers=4, fn=list, ordered=True, config=None,
+    batch=1000, samples=100):
+    '''
+    A generator version of scan: yield the result of fn for each range as
+    the ranges finish, in key order if ordered is set.
+    '''
+    session = conn.open_session()
+    try:
+        bounds = _boundaries(session, uri, workers, samples)
+    finally:
+        session.close()
+    bounds = [None] + bounds + [None]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_scan_range, conn, uri, config,
+            bounds[i], bounds[i + 1], fn, batch)
+            for i in range(len(bounds) - 1)]
+        try:
+            for f in futures if ordered else as_completed(futures):
+                yield f.result()
+        finally:
+            for f in futures:
+                f.cancel()
+
+def scan(conn, uri, workers=4, fn=list, config=None, batch=1000,
+    samples=100):
+    '''
+    Scan uri in up to workers ranges in parallel, each on its own session
+    opened with conn.  fn is called for each range with an iterator over its
+    records, each a list of the key and value columns as returned when
+    iterating over a cursor, and the results of fn are returned in key
+    order.  The default returns the records.  The cursors are opened with
+    config, and read batch records at a time.
+    '''
+    return list(iscan(conn, uri, workers, fn, True, config, batch, samples))
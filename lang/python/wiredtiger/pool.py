@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# WiredTiger session and cursor pool
+
+"""Session and cursor pool
+A SessionPool lends sessions to threads, one thread at a time, and keeps the
+cursors opened in each session open between loans:
+
+    pool = SessionPool(conn, size=8)
+    with pool.session() as s:
+        cursor = s.cursor('table:t')
+        value = cursor[key]
+
+Cursors are reset when their session is returned to the pool, and a transaction
+left running is rolled back, so the next borrower doesn't inherit its snapshot
+or its uncommitted changes.  Cursors closed by the pool when a session has more
+than max_cursors go back to WiredTiger's cursor cache, so reopening them is
+still cheaper than opening a new cursor.
+"""
+
+import threading, time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from wiredtiger import WiredTigerError
+
+class PooledSession(object):
+    '''
+    A session lent by a SessionPool.  The session attribute is the Session,
+    cursor(uri) returns the session's cursor for a uri.
+    '''
+    def __init__(self, pool, session):
+        self.pool = pool
+        self.session = session
+        self.hits = 0
+        self.misses = 0
+        self._cursors = OrderedDict()
+
+    def cursor(self, uri):
+        '''Return the cursor on uri, opening it if necessary.'''
+        cursor = self._cursors.pop(uri, None)
+        if cursor is None:
+            self.misses += 1
+            cursor = self.session.open_cursor(uri, None,
+                self.pool.cursor_config)
+            while len(self._cursors) >= self.pool.max_cursors:
+                self._cursors.popitem(last=False)[1].close()
+        else:
+            self.hits += 1
+        self._cursors[uri] = cursor
+        return cursor
+
+    def _reset(self):
+        for cursor in self._cursors.values():
+            cursor.reset()
+
+class SessionPool(object):
+    '''
+    A pool of up to size sessions opened on conn with session_config, the
+    cursors in each opened with cursor_config.  stats returns counts of
+    cursor hits and misses, and of waits for a free session.
+    '''
+    def __init__(self, conn, size, cursor_config=None,
+        session_config='cache_cursors=true', max_cursors=32):
+        self.conn = conn
+        self.size = size
+        self.cursor_config = cursor_config
+        self.session_config = session_config
+        self.max_cursors = max_cursors
+        self._lock = threading.Condition(threading.Lock())
+        self._idle = []
+        self._sessions = []
+        self._closed = False
+        self._waits = 0
+        self._wait_time = 0.0
+
+    def acquire(self, timeout=None):
+        '''
+        Return an idle PooledSession, opening a session if fewer than size
+        are open, otherwise waiting up to timeout seconds for one to be
+        released.
+        '''
+        with self._lock:
+            if not self._idle and len(self._sessions) >= self.size:
+                self._waits += 1
+                start = time.time()
+                deadline = None if timeout is None else start + timeout
+                while not self._idle and not self._closed:
+                    remaining = None if deadline is None else \
+                        deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._lock.wait(remaining)
+                self._wait_time += time.time() - start
+            if self._closed:
+                raise WiredTigerError('session pool is closed')
+            if self._idle:
+                return self._idle.pop()
+            if len(self._sessions) >= self.size:
+                raise WiredTigerError(
+                    'timed out waiting for a pooled session')
+            # Reserve the slot while the session is opened.
+            self._sessions.append(None)
+        try:
+            pooled = PooledSession(self,
+                self.conn.open_session(self.session_config))
+        except:
+            with self._lock:
+                self._sessions.remove(None)
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._sessions[self._sessions.index(None)] = pooled
+        return pooled
+
+    def release(self, pooled):
+        '''
+        Roll back any transaction left running, reset the session's cursors
+        and return it to the pool.
+        '''
+        try:
+            if pooled.session._transaction_running():
+                pooled.session.rollback_transaction()
+            pooled._reset()
+        except:
+            # Don't lend a session in an unknown state.
+            self._discard(pooled)
+            raise
+        with self._lock:
+            if self._closed:
+                self._sessions.remove(pooled)
+                pooled.session.close()
+            else:
+                self._idle.append(pooled)
+                self._lock.notify()
+
+    def _discard(self, pooled):
+        with self._lock:
+            self._sessions.remove(pooled)
+            self._lock.notify()
+        pooled.session.close()
+
+    @contextmanager
+    def session(self, timeout=None):
+        '''A context manager that acquires and releases a PooledSession.'''
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def stats(self):
+        '''
+        Return a dictionary of the pool's statistics: cursor hits and
+        misses, the number of times and total seconds spent waiting for a
+        session, and the number of sessions open and in use.
+        '''
+        with self._lock:
+            sessions = [s for s in self._sessions if s is not None]
+            return {
+                'hits': sum(s.hits for s in sessions),
+                'misses': sum(s.misses for s in sessions),
+                'waits': self._waits,
+                'wait_time': self._wait_time,
+                'sessions': len(sessions),
+                'in_use': len(sessions) - len(self._idle),
+            }
+
+    def close(self):
+        '''
+        Close the idle sessions, sessions in use are closed when they are
+        released.
+        '''
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for pooled in idle:
+                self._sessions.remove(pooled)
+            self._lock.notify_all()
+        for pooled in idle:
+            pooled.session.close()
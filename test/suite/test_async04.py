@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import sys
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+# test_async04.py
+#    The asyncio adapter in wiredtiger.aio.
+class test_async04(wttest.WiredTigerTestCase):
+    nentries = 500
+    async_ops = 50
+    types = [
+        ('file-row', dict(uri='file:async04', keyfmt='S', valfmt='S')),
+        ('file-col', dict(uri='file:async04', keyfmt='r', valfmt='S')),
+        ('table', dict(uri='table:async04', keyfmt='iS', valfmt='Si')),
+    ]
+    scenarios = make_scenarios(types)
+
+    def conn_config(self):
+        return 'async=(enabled=true,ops_max=%d,threads=3)' % self.async_ops
+
+    def key(self, i):
+        if self.keyfmt == 'r':
+            return i + 1
+        if self.keyfmt == 'iS':
+            return (i % 10, 'key%06d' % i)
+        return 'key%06d' % i
+
+    def value(self, i, gen=0):
+        if self.valfmt == 'Si':
+            return ('value%d.%d' % (i, gen), i)
+        return 'value%d.%d' % (i, gen)
+
+    # Multi-column values are returned as lists.
+    def result(self, i, gen=0):
+        v = self.value(i, gen)
+        return list(v) if type(v) == tuple else v
+
+    def setUp(self):
+        if sys.version_info[0] < 3:
+            self.skipTest('asyncio needs Python 3')
+        super(test_async04, self).setUp()
+        import asyncio
+        from wiredtiger.aio import AsyncConnection
+        self.session.create(self.uri,
+            'key_format=%s,value_format=%s' % (self.keyfmt, self.valfmt))
+        self.loop = asyncio.new_event_loop()
+        self.gather = asyncio.gather
+        self.aconn = AsyncConnection(self.conn, self.async_ops, self.loop)
+
+    def tearDown(self):
+        if hasattr(self, 'aconn'):
+            self.aconn.close()
+            self.loop.close()
+        super(test_async04, self).tearDown()
+
+    # Wait for a list of futures, returning results and exceptions.
+    def wait(self, futures):
+        return self.loop.run_until_complete(
+            self.gather(*futures, return_exceptions=True))
+
+    def check(self, gen):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for i in range(self.nentries):
+            self.assertEqual(cursor[self.key(i)], self.result(i, gen))
+        cursor.close()
+
+    def test_ops(self):
+        aconn = self.aconn
+        r = range(self.nentries)
+        self.assertEqual(self.wait([aconn.insert(
+            self.uri, self.key(i), self.value(i)) for i in r]),
+            [None] * self.nentries)
+        self.assertEqual(aconn.in_flight, 0)
+        self.check(0)
+
+        self.assertEqual(self.wait([aconn.search(
+            self.uri, self.key(i)) for i in r]),
+            [self.result(i) for i in r])
+
+        self.assertEqual(self.wait([aconn.update(
+            self.uri, self.key(i), self.value(i, 1)) for i in r]),
+            [None] * self.nentries)
+        self.check(1)
+
+        # Remove the even records, then search for all of them.
+        self.assertEqual(self.wait([aconn.remove(
+            self.uri, self.key(i)) for i in r if i % 2 == 0]),
+            [None] * ((self.nentries + 1) // 2))
+        results = self.wait([aconn.search(self.uri, self.key(i)) for i in r])
+        for i in r:
+            if i % 2 == 0:
+                self.assertTrue(type(results[i]) == KeyError)
+            else:
+                self.assertEqual(results[i], self.result(i, 1))
+        self.assertEqual(aconn.in_flight, 0)
+
+    # Without a loop, the connection uses the loop running when it is first
+    # used.
+    def test_running_loop(self):
+        aconn = type(self.aconn)(self.conn, self.async_ops)
+        self.assertRaises(RuntimeError,
+            lambda: aconn.insert(self.uri, self.key(0), self.value(0)))
+        submitted = self.loop.create_future()
+        self.loop.call_soon(lambda: submitted.set_result(
+            aconn.insert(self.uri, self.key(0), self.value(0))))
+        future = self.loop.run_until_complete(submitted)
+        self.assertEqual(self.wait([future]), [None])
+        self.assertTrue(aconn.loop is self.loop)
+        aconn.close()
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.assertEqual(cursor[self.key(0)], self.result(0))
+        cursor.close()
+
+    def test_errors(self):
+        aconn = self.aconn
+        self.wait([aconn.insert(self.uri, self.key(0), self.value(0))])
+
+        # Errors from the operation.
+        result = self.wait([aconn.insert(self.uri, self.key(0),
+            self.value(0), 'overwrite=false')])[0]
+        self.assertTrue(type(result) == wiredtiger.WiredTigerError)
+        result = self.wait([aconn.update(self.uri, self.key(1),
+            self.value(1), 'overwrite=false')])[0]
+        self.assertTrue(type(result) == KeyError)
+
+        # Values that can't be packed fail without using an op.
+        for i in range(self.async_ops * 2):
+            future = aconn.insert(self.uri, self.key(i), object())
+            self.assertTrue(future.done())
+            self.assertRaises(Exception, future.result)
+        self.assertEqual(aconn.in_flight, 0)
+
+        # Every op is still available.
+        r = range(self.async_ops * 2)
+        self.assertEqual(self.wait([aconn.search(
+            self.uri, self.key(0)) for i in r]), [self.result(0)] * len(r))
+
+    # With more ops allowed than the connection has, operations wait for
+    # WiredTiger to free ops.
+    def test_backpressure(self):
+        aconn = self.aconn
+        aconn.ops_max = self.async_ops * 10
+        r = range(self.nentries)
+        self.assertEqual(self.wait([aconn.insert(
+            self.uri, self.key(i), self.value(i)) for i in r]),
+            [None] * self.nentries)
+        self.check(0)
+
+    # Operations queued by the adapter can be cancelled.
+    def test_cancel(self):
+        aconn = self.aconn
+        futures = [aconn.insert(self.uri, self.key(i), self.value(i))
+            for i in range(self.nentries)]
+        for f in futures[self.async_ops:]:
+            f.cancel()
+        self.wait(futures)
+        self.assertEqual(aconn.in_flight, 0)
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.assertEqual(len(list(cursor)), self.async_ops)
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import wiredtiger, wttest
+from wtdataset import SimpleDataSet, ComplexDataSet
+from wtscenario import make_scenarios
+
+# test_cursor17.py
+#    Cursor.next_batch and prev_batch, and iteration.
+class test_cursor17(wttest.WiredTigerTestCase):
+    nentries = 1000
+    scenarios = make_scenarios([
+        ('file-r', dict(type='file:', keyfmt='r', dataset=SimpleDataSet)),
+        ('file-S', dict(type='file:', keyfmt='S', dataset=SimpleDataSet)),
+        ('lsm-S', dict(type='lsm:', keyfmt='S', dataset=SimpleDataSet)),
+        ('table-r-complex', dict(type='table:', keyfmt='r',
+            dataset=ComplexDataSet)),
+        ('table-S-complex', dict(type='table:', keyfmt='S',
+            dataset=ComplexDataSet)),
+    ])
+
+    # Walk the cursor one record at a time, the expected results.
+    def walk(self, cursor, move):
+        result = []
+        cursor.reset()
+        while move() == 0:
+            result.append(cursor.get_keys() + cursor.get_values())
+        return result
+
+    def batches(self, cursor, move_batch, n, raw=False):
+        result = []
+        cursor.reset()
+        while True:
+            batch = move_batch(n, raw)
+            self.assertLessEqual(len(batch), n)
+            result += batch
+            if len(batch) < n:
+                return result
+
+    def test_batch(self):
+        uri = self.type + 'cursor17'
+        ds = self.dataset(self, uri, self.nentries, key_format=self.keyfmt)
+        ds.populate()
+        cursor = self.session.open_cursor(uri, None, None)
+        forward = self.walk(cursor, cursor.next)
+        backward = self.walk(cursor, cursor.prev)
+        self.assertEqual(len(forward), self.nentries)
+        self.assertEqual(forward, list(reversed(backward)))
+
+        for n in (1, 7, 100, self.nentries, self.nentries + 1):
+            self.assertEqual(
+                self.batches(cursor, cursor.next_batch, n), forward)
+            self.assertEqual(
+                self.batches(cursor, cursor.prev_batch, n), backward)
+
+        # Raw records are the packed key and value.
+        cursor.reset()
+        for (k, v), record in zip(self.batches(
+            cursor, cursor.next_batch, 100, True), forward):
+            nkeys = len(wiredtiger.unpack(cursor.key_format, k))
+            self.assertEqual(wiredtiger.unpack(cursor.key_format, k),
+                record[:nkeys])
+            self.assertEqual(wiredtiger.unpack(cursor.value_format, v),
+                record[nkeys:])
+
+        # After a full batch the cursor is positioned on the last record.
+        cursor.reset()
+        batch = cursor.next_batch(10)
+        self.assertEqual(cursor.get_keys() + cursor.get_values(), batch[-1])
+        self.assertEqual(cursor.next_batch(5), forward[10:15])
+
+        # The end of the data resets the cursor, so the next batch starts
+        # again from the beginning.
+        cursor.reset()
+        self.assertEqual(cursor.prev_batch(3), backward[:3])
+        self.assertEqual(cursor.next_batch(5), forward[-2:])
+        self.assertEqual(cursor.next_batch(5), forward[:5])
+        self.assertEqual(cursor.next_batch(0), [])
+
+        # Iteration leaves the cursor on the record returned.
+        cursor.reset()
+        self.assertEqual(list(cursor), forward)
+        cursor.reset()
+        for record in cursor:
+            self.assertEqual(cursor.get_keys() + cursor.get_values(), record)
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+# test_cursor18.py
+#    Cursor.insert_many, update_many and remove_many.
+class test_cursor18(wttest.WiredTigerTestCase):
+    nentries = 500
+    scenarios = make_scenarios([
+        ('file-r', dict(uri='file:cursor18', keyfmt='r', valfmt='S')),
+        ('file-S', dict(uri='file:cursor18', keyfmt='S', valfmt='S')),
+        ('table-r', dict(uri='table:cursor18', keyfmt='r', valfmt='iS')),
+        ('table-Si', dict(uri='table:cursor18', keyfmt='Si', valfmt='iS')),
+        ('lsm-S', dict(uri='lsm:cursor18', keyfmt='S', valfmt='S')),
+    ])
+
+    def key(self, i):
+        if self.keyfmt == 'r':
+            return i + 1
+        elif self.keyfmt == 'S':
+            return 'key%06d' % i
+        return ('key%06d' % i, i)
+
+    def value(self, i, tag='v'):
+        if self.valfmt == 'S':
+            return '%s%d' % (tag, i)
+        return (i, '%s%d' % (tag, i))
+
+    def records(self, start, stop, tag='v'):
+        return [(self.key(i), self.value(i, tag)) for i in range(start, stop)]
+
+    def check(self, expect):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        nkeys = len(self.keyfmt)
+        got = []
+        for record in cursor:
+            key = tuple(record[:nkeys]) if nkeys > 1 else record[0]
+            value = tuple(record[nkeys:]) if len(self.valfmt) > 1 \
+                else record[nkeys]
+            got.append((key, value))
+        self.assertEqual(got, expect)
+        cursor.close()
+
+    def create(self):
+        self.session.create(self.uri,
+            'key_format=%s,value_format=%s' % (self.keyfmt, self.valfmt))
+
+    def test_many(self):
+        self.create()
+        cursor = self.session.open_cursor(self.uri, None, None)
+        n = self.nentries
+        self.assertEqual(cursor.insert_many(self.records(0, n)), n)
+        self.check(self.records(0, n))
+
+        # Generators work as well as lists, and an empty batch is fine.
+        self.assertEqual(cursor.update_many(
+            iter(self.records(0, n // 2, 'u'))), n // 2)
+        self.assertEqual(cursor.update_many([]), 0)
+        self.check(self.records(0, n // 2, 'u') + self.records(n // 2, n))
+
+        self.assertEqual(cursor.remove_many(
+            self.key(i) for i in range(0, n, 2)), n // 2)
+        self.check([(self.key(i), self.value(i, 'u' if i < n // 2 else 'v'))
+            for i in range(1, n, 2)])
+
+        # The cursor is usable afterwards.
+        cursor.set_key(self.key(1))
+        self.assertEqual(cursor.search(), 0)
+        cursor.close()
+
+    # A failure stops the batch and reports where it stopped.
+    def test_failure(self):
+        self.create()
+        cursor = self.session.open_cursor(self.uri, None, 'overwrite=false')
+        cursor.insert_many(self.records(10, 20))
+        try:
+            cursor.insert_many(self.records(0, 30))
+            self.fail('insert_many succeeded with duplicate keys')
+        except wiredtiger.WiredTigerError as e:
+            self.assertEqual(e.applied, 10)
+            self.assertEqual(e.index, 10)
+        self.check(self.records(0, 20))
+
+        try:
+            cursor.remove_many([self.key(i) for i in range(15, 25)])
+            self.fail('remove_many succeeded with missing keys')
+        except wiredtiger.WiredTigerError as e:
+            self.assertTrue('WT_NOTFOUND' in str(e))
+            self.assertEqual(e.applied, 5)
+            self.assertEqual(e.index, 5)
+        self.check(self.records(0, 15))
+        cursor.close()
+
+    # In a transaction, a failure rolls the whole batch back.
+    def test_transaction(self):
+        self.create()
+        cursor = self.session.open_cursor(self.uri, None, 'overwrite=false')
+        cursor.insert_many(self.records(10, 20), transaction=True)
+        try:
+            cursor.insert_many(self.records(0, 30), transaction=True)
+            self.fail('insert_many succeeded with duplicate keys')
+        except wiredtiger.WiredTigerError as e:
+            self.assertEqual(e.applied, 0)
+            self.assertEqual(e.index, 10)
+        self.check(self.records(10, 20))
+        self.assertEqual(
+            cursor.insert_many(self.records(0, 10), transaction=True), 10)
+        self.check(self.records(0, 20))
+        cursor.close()
+
+    def test_bulk(self):
+        self.create()
+        cursor = self.session.open_cursor(self.uri, None, 'bulk')
+        self.assertEqual(cursor.insert_many(self.records(0, self.nentries)),
+            self.nentries)
+        cursor.close()
+        self.check(self.records(0, self.nentries))
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import array, sys
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+# test_cursor19.py
+#    Cursor.get_key_view, get_value_view and setting values from buffers.
+class test_cursor19(wttest.WiredTigerTestCase):
+    uri = 'table:cursor19'
+    scenarios = make_scenarios([
+        ('row', dict(keyfmt='S')),
+        ('col', dict(keyfmt='r')),
+    ])
+
+    def key(self, i):
+        return i + 1 if self.keyfmt == 'r' else 'key%04d' % i
+
+    def value(self, i):
+        return (b'%04d' % i) * 1000
+
+    def setUp(self):
+        if sys.version_info[0] < 3:
+            self.skipTest('views need Python 3')
+        super(test_cursor19, self).setUp()
+        self.session.create(self.uri,
+            'key_format=%s,value_format=u' % self.keyfmt)
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for i in range(100):
+            cursor[self.key(i)] = self.value(i)
+        cursor.close()
+
+    def assertReleased(self, view):
+        self.assertRaises(ValueError, lambda: view[0])
+        self.assertRaises(ValueError, bytes, view)
+
+    def test_views(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        cursor.set_key(self.key(10))
+        self.assertEqual(cursor.search(), 0)
+        kview = cursor.get_key_view()
+        vview = cursor.get_value_view()
+        self.assertTrue(vview.readonly)
+        self.assertEqual(bytes(vview), self.value(10))
+        self.assertEqual(
+            wiredtiger.unpack(cursor.key_format, bytes(kview)),
+            [self.key(10)])
+
+        # Moving the cursor releases the views.
+        self.assertEqual(cursor.next(), 0)
+        self.assertReleased(kview)
+        self.assertReleased(vview)
+        vview = cursor.get_value_view()
+        self.assertEqual(bytes(vview), self.value(11))
+
+        # As do the other operations that can invalidate the memory.
+        for op in (cursor.reset, cursor.prev, cursor.next_batch,
+            lambda: cursor.search_near(), cursor.close):
+            cursor.set_key(self.key(20))
+            self.assertEqual(cursor.search(), 0)
+            vview = cursor.get_value_view()
+            if op == cursor.next_batch:
+                op(1)
+            else:
+                op()
+            self.assertReleased(vview)
+
+    def test_transaction(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for end in (self.session.commit_transaction,
+            self.session.rollback_transaction):
+            self.session.begin_transaction()
+            cursor.set_key(self.key(5))
+            self.assertEqual(cursor.search(), 0)
+            vview = cursor.get_value_view()
+            self.assertEqual(bytes(vview), self.value(5))
+            end()
+            self.assertReleased(vview)
+
+        # Closing the session closes the cursor, and releases its views.
+        cursor.set_key(self.key(5))
+        self.assertEqual(cursor.search(), 0)
+        vview = cursor.get_value_view()
+        self.session.close()
+        self.assertReleased(vview)
+
+    # Slices and memoryviews of a view reference the cursor's memory, while
+    # any of them exist the view can't be released.
+    def test_exports(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        cursor.set_key(self.key(10))
+        self.assertEqual(cursor.search(), 0)
+        vview = cursor.get_value_view()
+        part = vview[2:5]
+        nested = memoryview(memoryview(vview))[1:3]
+        self.assertEqual(bytes(part), self.value(10)[2:5])
+        self.assertEqual(bytes(nested), self.value(10)[1:3])
+        self.assertRaises(BufferError, vview.release)
+
+        for op in (cursor.next, cursor.reset, cursor.close,
+            self.session.reset, self.session.close):
+            self.assertRaises(BufferError, op)
+        self.assertFalse(vview.released)
+        self.assertEqual(bytes(vview), self.value(10))
+        self.assertEqual(cursor.get_key(), self.key(10))
+
+        part.release()
+        self.assertRaises(BufferError, cursor.next)
+        del nested
+        self.assertEqual(cursor.next(), 0)
+        self.assertReleased(vview)
+        self.assertRaises(ValueError, memoryview, vview)
+        cursor.close()
+
+    # Values can be set from any object supporting the buffer protocol.
+    def test_set_buffer(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        values = [
+            bytearray(b'bytearray'),
+            memoryview(b'0123456789')[2:8],
+            array.array('B', [1, 2, 3, 4]),
+            b'bytes',
+            b'',
+        ]
+        for i, value in enumerate(values):
+            cursor[self.key(i)] = value
+        for i, value in enumerate(values):
+            self.assertEqual(cursor[self.key(i)], bytes(value))
+
+        # Values are copied, the buffer can change once the value is set.
+        buf = bytearray(b'copied')
+        cursor.set_key(self.key(50))
+        cursor.set_value(buf)
+        buf[0:6] = b'xxxxxx'
+        buf.extend(b'x' * 1000)
+        self.assertEqual(cursor.update(), 0)
+        self.assertEqual(cursor[self.key(50)], b'copied')
+
+        self.assertRaises(TypeError, cursor.set_value, 12)
+        cursor.close()
+
+    # With set_value_buffer, the value isn't copied: the buffer stays pinned
+    # until the cursor has finished with it.
+    def test_set_value_buffer(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        buf = bytearray(b'pinned')
+        cursor.set_key(self.key(50))
+        cursor.set_value_buffer(buf)
+        self.assertRaises(BufferError, buf.extend, b'x' * 1000)
+        buf[0:1] = b'P'
+        self.assertEqual(cursor.update(), 0)
+        self.assertEqual(cursor[self.key(50)], b'Pinned')
+        cursor.close()
+
+        self.session.create('table:cursor19s', 'key_format=S,value_format=S')
+        cursor = self.session.open_cursor('table:cursor19s', None, None)
+        self.assertRaises(ValueError, cursor.set_value_buffer, buf)
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
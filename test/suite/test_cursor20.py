@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+# test_cursor20.py
+#    Cursor.scan_to_arrays.
+class test_cursor20(wttest.WiredTigerTestCase):
+    uri = 'table:cursor20'
+    nentries = 500
+    scenarios = make_scenarios([
+        ('row', dict(keyfmt='Q')),
+        ('col', dict(keyfmt='r')),
+    ])
+
+    def key(self, i):
+        return i + 1
+
+    def value(self, i):
+        return (i % 7 - 3, i * 1000, 'v%d' % i, i % 256, -i * 70000)
+
+    def setUp(self):
+        super(test_cursor20, self).setUp()
+        self.session.create(self.uri, 'key_format=%s,value_format=hiSBq,'
+            'columns=(k,small,medium,name,byte,big)' % self.keyfmt)
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for i in range(self.nentries):
+            cursor[self.key(i)] = self.value(i)
+        cursor.close()
+
+    def expected(self, column, first, last):
+        if column == 0:
+            return [self.key(i) for i in range(first, last)]
+        return [self.value(i)[column - 1] for i in range(first, last)]
+
+    def check(self, arrays, columns, first, last):
+        self.assertEqual(len(arrays), len(columns))
+        for a, c in zip(arrays, columns):
+            self.assertEqual(list(a), self.expected(c, first, last))
+
+    def test_scan_all(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.check(cursor.scan_to_arrays([0, 1, 2, 4, 5]),
+            [0, 1, 2, 4, 5], 0, self.nentries)
+        self.check(cursor.scan_to_arrays(['big', 'k', 'byte']),
+            [5, 0, 4], 0, self.nentries)
+
+        # The cursor is reset after a scan.
+        self.assertEqual(cursor.next(), 0)
+        self.assertEqual(cursor.get_key(), self.key(0))
+
+        # Without a start key, a positioned cursor scans from the beginning.
+        cursor.set_key(self.key(250))
+        self.assertEqual(cursor.search(), 0)
+        self.check(cursor.scan_to_arrays([0, 1]), [0, 1], 0, self.nentries)
+        cursor.set_key(self.key(250))
+        self.assertEqual(cursor.search(), 0)
+        self.check(cursor.scan_to_arrays([0], stop=self.key(5)), [0], 0, 5)
+
+    def test_scan_range(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.check(cursor.scan_to_arrays([0, 2], start=self.key(100),
+            stop=self.key(200)), [0, 2], 100, 200)
+        self.check(cursor.scan_to_arrays([0, 2], start=self.key(100),
+            limit=10), [0, 2], 100, 110)
+        self.check(cursor.scan_to_arrays([0], stop=self.key(5)), [0], 0, 5)
+        self.check(cursor.scan_to_arrays([0], limit=0), [0], 0, 0)
+
+        # A start key that doesn't exist starts at the next larger key.
+        cursor.set_key(self.key(50))
+        self.assertEqual(cursor.remove(), 0)
+        self.check(cursor.scan_to_arrays([0], start=self.key(50), limit=3),
+            [0], 51, 54)
+
+        # Starting past the end returns empty arrays.
+        self.check(cursor.scan_to_arrays([0, 1],
+            start=self.key(self.nentries + 10)), [0, 1], 0, 0)
+
+    def test_scan_projection(self):
+        cursor = self.session.open_cursor(
+            self.uri + '(big,medium)', None, None)
+        self.check(cursor.scan_to_arrays(), [0, 5, 2], 0, self.nentries)
+        self.check(cursor.scan_to_arrays(['medium']), [2], 0, self.nentries)
+
+    def test_scan_empty(self):
+        self.session.create('table:empty',
+            'key_format=%s,value_format=i' % self.keyfmt)
+        cursor = self.session.open_cursor('table:empty', None, None)
+        self.assertEqual([list(a) for a in cursor.scan_to_arrays()], [[], []])
+        self.assertEqual([list(a) for a in
+            cursor.scan_to_arrays(start=self.key(1))], [[], []])
+
+    def test_scan_errors(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.assertRaises(ValueError, lambda: cursor.scan_to_arrays([3]))
+        self.assertRaises(ValueError, lambda: cursor.scan_to_arrays())
+        self.assertRaises(ValueError, lambda: cursor.scan_to_arrays([6]))
+        self.assertRaises(ValueError, lambda: cursor.scan_to_arrays([1, 1]))
+        self.assertRaises(ValueError, lambda: cursor.scan_to_arrays(['x']))
+
+if __name__ == '__main__':
+    wttest.run()
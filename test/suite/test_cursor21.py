@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import random
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+# test_cursor21.py
+#    Cursor.search_many and Session.get_many.
+class test_cursor21(wttest.WiredTigerTestCase):
+    nentries = 1000
+    types = [
+        ('file-row', dict(uri='file:cursor21', keyfmt='S', valfmt='S')),
+        ('file-col', dict(uri='file:cursor21', keyfmt='r', valfmt='S')),
+        ('lsm', dict(uri='lsm:cursor21', keyfmt='S', valfmt='S')),
+        ('table', dict(uri='table:cursor21', keyfmt='iS', valfmt='Si')),
+    ]
+    scenarios = make_scenarios(types)
+
+    def key(self, i):
+        if self.keyfmt == 'r':
+            return i + 1
+        if self.keyfmt == 'iS':
+            return (i % 10, 'key%06d' % i)
+        return 'key%06d' % i
+
+    def value(self, i):
+        if self.valfmt == 'Si':
+            return ('value%d' % i, i)
+        return 'value%d' % i
+
+    # Multi-column values are returned as lists.
+    def result(self, i):
+        v = self.value(i)
+        return list(v) if type(v) == tuple else v
+
+    def setUp(self):
+        super(test_cursor21, self).setUp()
+        self.session.create(self.uri,
+            'key_format=%s,value_format=%s' % (self.keyfmt, self.valfmt))
+        cursor = self.session.open_cursor(self.uri, None, None)
+        # Leave out every third record.
+        for i in range(self.nentries):
+            if i % 3 != 0:
+                cursor[self.key(i)] = self.value(i)
+        cursor.close()
+
+    def expected(self, ids, default=None):
+        return [default if i % 3 == 0 or i >= self.nentries else
+            self.result(i) for i in ids]
+
+    def test_search_many(self):
+        ids = list(range(self.nentries + 10))
+        random.shuffle(ids)
+        ids += ids[:20]
+        cursor = self.session.open_cursor(self.uri, None, None)
+        keys = [self.key(i) for i in ids]
+        self.assertEqual(cursor.search_many(keys), self.expected(ids))
+        self.assertEqual(cursor.search_many(keys, sort=False),
+            self.expected(ids))
+        missing = object()
+        self.assertEqual(cursor.search_many(keys, default=missing),
+            self.expected(ids, missing))
+        self.assertEqual(cursor.search_many([]), [])
+
+        # The cursor is left reset.
+        first = self.session.open_cursor(self.uri, None, None)
+        self.assertEqual(first.next(), 0)
+        self.assertEqual(cursor.next(), 0)
+        self.assertEqual(cursor.get_key(), first.get_key())
+        first.close()
+        cursor.close()
+
+    def test_get_many(self):
+        ids = [500, 3, 4, 999, 1]
+        self.assertEqual(self.session.get_many(self.uri,
+            [self.key(i) for i in ids]), self.expected(ids))
+        self.assertEqual(self.session.get_many(self.uri,
+            iter([self.key(2)]), sort=False), self.expected([2]))
+
+    def test_search_many_txn(self):
+        # Searches see the transaction's own updates.
+        self.session.begin_transaction()
+        cursor = self.session.open_cursor(self.uri, None, None)
+        cursor.set_key(self.key(0))
+        cursor.set_value(self.value(0))
+        self.assertEqual(cursor.insert(), 0)
+        self.assertEqual(cursor.search_many([self.key(1), self.key(0)]),
+            [self.result(1), self.result(0)])
+        self.session.rollback_transaction()
+        self.assertEqual(cursor.search_many([self.key(1), self.key(0)]),
+            [self.result(1), None])
+
+if __name__ == '__main__':
+    wttest.run()
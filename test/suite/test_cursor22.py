@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wiredtiger.packing import Row
+from wtdataset import SimpleDataSet, ComplexDataSet
+from wtscenario import make_scenarios
+
+# test_cursor22.py
+#    Cursors returning lazy rows.
+class test_cursor22(wttest.WiredTigerTestCase):
+    nentries = 100
+    types = [
+        ('file', dict(uri='file:cursor22', dataset=SimpleDataSet)),
+        ('table', dict(uri='table:cursor22', dataset=SimpleDataSet)),
+        ('table-complex', dict(uri='table:cursor22', dataset=ComplexDataSet)),
+    ]
+    keyfmt = [
+        ('recno', dict(keyfmt='r')),
+        ('string', dict(keyfmt='S')),
+    ]
+    scenarios = make_scenarios(types, keyfmt)
+
+    def setUp(self):
+        super(test_cursor22, self).setUp()
+        self.ds = self.dataset(self, self.uri, self.nentries,
+            key_format=self.keyfmt)
+        self.ds.populate()
+
+    def records(self, lazy, fn):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        cursor.lazy_rows = lazy
+        result = fn(cursor)
+        cursor.close()
+        return result
+
+    def test_iterate(self):
+        expected = self.records(False, list)
+        rows = self.records(True, list)
+        self.assertEqual(len(rows), self.nentries)
+        for row, record in zip(rows, expected):
+            self.assertTrue(isinstance(row, Row))
+            self.assertEqual(row, record)
+            self.assertEqual(list(row), record)
+
+        batch = lambda cursor: cursor.next_batch(self.nentries + 1)
+        self.assertEqual(self.records(True, batch), self.records(False, batch))
+
+    def test_get_values(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        cursor.set_key(self.ds.key(10))
+        self.assertEqual(cursor.search(), 0)
+        expected = cursor.get_values()
+        value = cursor.get_value()
+        cursor.lazy_rows = True
+        row = cursor.get_values()
+        self.assertTrue(isinstance(row, Row))
+        self.assertEqual(row, expected)
+        self.assertEqual(cursor.get_value(), value)
+        cursor.close()
+
+    # Reading one column only walks the columns before it.
+    def test_one_column(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        cursor.lazy_rows = True
+        for row in cursor:
+            # The key is unpacked already.
+            self.assertEqual(row[0], cursor.get_key())
+            self.assertEqual(len(row._ends), 1)
+            row[1]
+            self.assertEqual(len(row._ends), 2)
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+# test_cursor23.py
+#    Cursor.modify_from and Cursor.modify_many.
+class test_cursor23(wttest.WiredTigerTestCase):
+    nentries = 50
+    types = [
+        ('file', dict(uri='file:cursor23')),
+        ('table', dict(uri='table:cursor23')),
+    ]
+    valuefmt = [
+        ('item', dict(valuefmt='u')),
+        ('string', dict(valuefmt='S')),
+    ]
+    scenarios = make_scenarios(types, valuefmt)
+
+    def value(self, i, tag='a'):
+        v = (tag * 10 + str(i)) * 20
+        return v.encode() if self.valuefmt == 'u' else v
+
+    def setUp(self):
+        super(test_cursor23, self).setUp()
+        self.session.create(self.uri,
+            'key_format=i,value_format=' + self.valuefmt)
+        cursor = self.session.open_cursor(self.uri, None, None)
+        cursor.insert_many((i, self.value(i)) for i in range(self.nentries))
+        cursor.close()
+
+    def check(self, expected):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.assertEqual(list(cursor), [[k, v] for k, v in expected])
+        cursor.close()
+
+    def changed(self, i):
+        old = self.value(i)
+        new = old[:10] + old[12:40] + old[10:12] + old[40:]
+        return old, new
+
+    def test_modify_from(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.session.begin_transaction('isolation=snapshot')
+        old, new = self.changed(3)
+        cursor.set_key(3)
+        self.assertEqual(cursor.modify_from(old, new, len(new), 8), 0)
+
+        # A value too different for the limits is updated whole.
+        cursor.set_key(4)
+        self.assertEqual(
+            cursor.modify_from(self.value(4), self.value(4, 'b'), 10, 2), 0)
+
+        # Identical values leave the record as it was.
+        cursor.set_key(5)
+        self.assertEqual(
+            cursor.modify_from(self.value(5), self.value(5), 100, 4), 0)
+
+        # A missing record is reported the same way whether the change
+        # would be a modify, an update of the whole value, or nothing.
+        for o, n, maxdiff, nmod in ((old, new, 100, 8),
+            (self.value(4), self.value(4, 'b'), 10, 2),
+            (self.value(5), self.value(5), 100, 4)):
+            cursor.set_key(self.nentries)
+            self.assertEqual(cursor.modify_from(o, n, maxdiff, nmod),
+                wiredtiger.WT_NOTFOUND)
+        self.session.commit_transaction()
+        cursor.close()
+
+        expected = [(i, self.value(i)) for i in range(self.nentries)]
+        expected[3] = (3, new)
+        expected[4] = (4, self.value(4, 'b'))
+        self.check(expected)
+
+    def test_modify_many(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        records = [(i,) + self.changed(i) for i in range(0, self.nentries, 2)]
+        records.append((1, self.value(1), self.value(1, 'c')))
+        self.assertEqual(cursor.modify_many(records, 64, 4,
+            transaction=True), len(records))
+        cursor.close()
+
+        expected = [(i, self.value(i)) for i in range(self.nentries)]
+        for k, old, new in records:
+            expected[k] = (k, new)
+        self.check(expected)
+
+    def test_modify_many_notfound(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        records = [(i,) + self.changed(i) for i in (1, 2, self.nentries, 3)]
+        with self.assertRaises(wiredtiger.WiredTigerError) as cm:
+            cursor.modify_many(records, 64, 4, transaction=True)
+        self.assertEqual(cm.exception.applied, 0)
+        self.assertEqual(cm.exception.index, 2)
+        cursor.close()
+        self.check([(i, self.value(i)) for i in range(self.nentries)])
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import wiredtiger, wttest
+from wtdataset import SimpleDataSet, ComplexDataSet
+from wtscenario import make_scenarios
+
+# test_cursor24.py
+#    Cursor.range bounded iteration.
+class test_cursor24(wttest.WiredTigerTestCase):
+    nentries = 100
+    types = [
+        ('file', dict(uri='file:cursor24', dataset=SimpleDataSet)),
+        ('table', dict(uri='table:cursor24', dataset=SimpleDataSet)),
+        ('table-complex', dict(uri='table:cursor24', dataset=ComplexDataSet)),
+    ]
+    keyfmt = [
+        ('integer', dict(keyfmt='i')),
+        ('recno', dict(keyfmt='r')),
+        ('string', dict(keyfmt='S')),
+    ]
+    batch = [
+        ('batch-1', dict(batch=1)),
+        ('batch-7', dict(batch=7)),
+        ('batch-100', dict(batch=100)),
+    ]
+    scenarios = make_scenarios(types, keyfmt, batch)
+
+    def setUp(self):
+        super(test_cursor24, self).setUp()
+        self.ds = self.dataset(self, self.uri, self.nentries,
+            key_format=self.keyfmt)
+        self.ds.populate()
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.records = list(cursor)
+        cursor.close()
+
+    # The records range should return, found by iterating the table.
+    def expected(self, start, stop, inclusive, reverse):
+        result = [r for r in self.records
+            if (start is None or r[0] >= start) and
+            (stop is None or r[0] < stop or (inclusive and r[0] == stop))]
+        if reverse:
+            result.reverse()
+        return result
+
+    def check(self, start, stop, inclusive=False):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for reverse in (False, True):
+            expected = self.expected(start, stop, inclusive, reverse)
+            self.assertEqual(list(cursor.range(start, stop, inclusive,
+                reverse, batch=self.batch)), expected)
+            self.assertEqual(list(cursor.range(start, stop, inclusive,
+                reverse, keys_only=True, batch=self.batch)),
+                [[r[0]] for r in expected])
+        cursor.close()
+
+    def test_range(self):
+        key = self.ds.key
+        self.check(None, None)
+        self.check(key(10), key(20))
+        self.check(key(10), key(20), True)
+        self.check(key(10), None)
+        self.check(None, key(20), True)
+        self.check(key(15), key(15))
+        self.check(key(15), key(15), True)
+        self.check(key(20), key(10))
+        self.check(key(self.nentries), None)
+        self.check(None, key(1))
+
+    # Bounds that fall between or beyond the keys in the table.
+    def test_range_missing(self):
+        key = self.ds.key
+        cursor = self.session.open_cursor(self.uri, None, None)
+        cursor.set_key(key(30))
+        self.assertEqual(cursor.remove(), 0)
+        cursor.set_key(key(40))
+        self.assertEqual(cursor.remove(), 0)
+        cursor.close()
+        self.records = [r for r in self.records
+            if r[0] != key(30) and r[0] != key(40)]
+        self.check(key(30), key(40))
+        self.check(key(30), key(40), True)
+        self.check(key(90), key(self.nentries + 10))
+
+    # Without a bound at the starting end, a cursor just positioned by a
+    # search iterates from the start, or end, of the table.
+    def test_range_positioned(self):
+        key = self.ds.key
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for start, stop, reverse in ((None, key(20), False),
+            (key(20), None, True), (None, None, False), (None, None, True)):
+            expected = self.expected(start, stop, False, reverse)
+            cursor.set_key(key(50))
+            self.assertEqual(cursor.search(), 0)
+            self.assertEqual(list(cursor.range(start, stop, False,
+                reverse, batch=self.batch)), expected)
+        cursor.close()
+
+    def test_range_json(self):
+        cursor = self.session.open_cursor(self.uri, None, 'dump=json')
+        self.assertRaises(ValueError, lambda: cursor.range())
+        cursor.close()
+
+# test_cursor24_collator
+#    Cursor.range on objects with a custom collator.
+class test_cursor24_collator(wttest.WiredTigerTestCase):
+    def conn_extensions(self, extlist):
+        extlist.skip_if_missing = True
+        extlist.extension('collators', 'reverse')
+
+    def test_range_collator(self):
+        for uri in ('file:cursor24', 'table:cursor24'):
+            self.session.create(uri,
+                'key_format=S,value_format=S,collator=reverse')
+            cursor = self.session.open_cursor(uri, None, None)
+            cursor['a'] = 'a'
+            self.assertRaises(ValueError, lambda: cursor.range())
+            self.assertRaises(ValueError, lambda: cursor.range('a', 'b'))
+            cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
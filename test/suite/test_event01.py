@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import errno, threading, time
+import wiredtiger, wttest
+from wiredtiger.events import EventHandler
+
+class Collector(EventHandler):
+    def __init__(self, **kwargs):
+        super(Collector, self).__init__(**kwargs)
+        self.events = []
+
+    def handle(self, events):
+        self.events.extend(events)
+
+class Blocked(Collector):
+    def __init__(self, **kwargs):
+        super(Blocked, self).__init__(**kwargs)
+        self.release = threading.Event()
+
+    def handle(self, events):
+        self.release.wait()
+        super(Blocked, self).handle(events)
+
+# test_event01.py
+#    Buffered event handling.
+class test_event01(wttest.WiredTigerTestCase):
+    # The buffer keeps its size once allocated, use the same size throughout.
+    size = 4
+
+    def bad_create(self, i):
+        self.assertRaises(wiredtiger.WiredTigerError,
+            lambda: self.session.create('table:event01',
+            'key_format=S,badkey%d=1' % i))
+
+    def test_events(self):
+        handler = Collector(size=self.size, interval=0.01)
+        with handler:
+            self.assertRaises(wiredtiger.WiredTigerError, handler.start)
+            self.bad_create(1)
+        self.assertGreater(len(handler.events), 0)
+        session, error, message = handler.events[0]
+        self.assertTrue(isinstance(session, int))
+        self.assertEqual(error, errno.EINVAL)
+        self.assertTrue('badkey1' in message)
+        self.assertEqual(handler.stats()['queued'], 0)
+
+        # With the handler stopped, errors go to stderr again.
+        with self.expectedStderrPattern('badkey2'):
+            self.bad_create(2)
+
+    # Events queued while the handler stops are processed, none are left in
+    # the buffer.
+    def test_stop_racing(self):
+        handler = Collector(size=self.size, interval=0.01)
+        done = threading.Event()
+        def produce():
+            session = self.conn.open_session()
+            while not done.is_set():
+                self.assertRaises(wiredtiger.WiredTigerError,
+                    lambda: session.create('table:event01',
+                    'key_format=S,badkey=1'))
+            session.close()
+
+        with self.expectedStderrPattern('badkey'):
+            handler.start()
+            threads = [threading.Thread(target=produce) for i in range(4)]
+            for t in threads:
+                t.start()
+            while len(handler.events) == 0:
+                time.sleep(0.001)
+            handler.stop()
+            self.assertEqual(handler.stats()['queued'], 0)
+            done.set()
+            for t in threads:
+                t.join()
+            self.bad_create(0)
+
+    def test_dropped(self):
+        handler = Blocked(size=self.size, batch=1, interval=0.01)
+        dropped = handler.dropped
+        handler.start()
+        for i in range(20):
+            self.bad_create(i)
+        self.assertGreater(handler.dropped, dropped)
+        handler.release.set()
+        handler.stop()
+        self.assertLessEqual(len(handler.events), self.size + 1)
+        self.assertEqual(handler.stats()['size'], self.size)
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import os
+import wiredtiger, wttest
+from suite_subprocess import suite_subprocess
+from wtdataset import SimpleDataSet, SimpleIndexDataSet, ComplexDataSet
+from wtscenario import make_scenarios
+
+# test_export01.py
+#    Session.export writes what wt dump does.
+class test_export01(wttest.WiredTigerTestCase, suite_subprocess):
+    name = 'test_export01'
+    nentries = 1000
+
+    formats = [
+        ('print', dict(format='print', opts=[])),
+        ('hex', dict(format='hex', opts=['-x'])),
+        ('json', dict(format='json', opts=['-j'])),
+    ]
+    keyfmt = [
+        ('integer', dict(keyfmt='i')),
+        ('recno', dict(keyfmt='r')),
+        ('string', dict(keyfmt='S')),
+    ]
+    types = [
+        ('file', dict(uri='file:', dataset=SimpleDataSet)),
+        ('table-simple', dict(uri='table:', dataset=SimpleDataSet)),
+        ('table-index', dict(uri='table:', dataset=SimpleIndexDataSet)),
+        ('table-complex', dict(uri='table:', dataset=ComplexDataSet)),
+    ]
+    scenarios = make_scenarios(types, keyfmt, formats)
+
+    def setUp(self):
+        super(test_export01, self).setUp()
+        self.pop = self.dataset(self, self.uri + self.name, self.nentries,
+            key_format=self.keyfmt)
+        self.pop.populate()
+        self.session.checkpoint()
+
+    def expected(self, opts):
+        self.runWt(['dump'] + self.opts + opts + [self.uri + self.name],
+            outfilename='dump.out')
+        with open('dump.out', 'rb') as f:
+            return f.read()
+
+    def test_export(self):
+        uri = self.uri + self.name
+        with open('export.out', 'wb') as f:
+            count = self.session.export(uri, f, self.format, chunk_size=512)
+        self.assertEqual(count, self.nentries)
+        with open('export.out', 'rb') as f:
+            self.assertEqual(f.read(), self.expected([]))
+
+    def test_export_fd(self):
+        uri = self.uri + self.name
+        fd = os.open('export.out', os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            self.session.export(uri, fd, self.format, reverse=True)
+        finally:
+            os.close(fd)
+        with open('export.out', 'rb') as f:
+            self.assertEqual(f.read(), self.expected(['-r']))
+
+    # Configuration strings with non-ASCII characters are escaped as wt dump
+    # escapes them.
+    def test_export_metadata(self):
+        uri = self.uri + 'metadata'
+        self.session.create(uri, 'key_format=S,value_format=S,' +
+            u'app_metadata="caf\u00e9 \u20ac"')
+        with open('export.out', 'wb') as f:
+            self.session.export(uri, f, self.format)
+        self.runWt(['dump'] + self.opts + [uri], outfilename='dump.out')
+        with open('export.out', 'rb') as f, open('dump.out', 'rb') as g:
+            self.assertEqual(f.read(), g.read())
+
+    def test_export_missing(self):
+        with open('export.out', 'wb') as f:
+            self.assertRaises(wiredtiger.WiredTigerError,
+                lambda: self.session.export('table:missing', f, self.format))
+            self.assertRaises(ValueError,
+                lambda: self.session.export(self.uri + self.name, f, 'csv'))
+
+if __name__ == '__main__':
+    wttest.run()
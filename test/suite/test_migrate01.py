@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import os
+import wiredtiger, wttest
+from wiredtiger.migrate import dump, load, _markers
+from wtdataset import SimpleDataSet, SimpleIndexDataSet, ComplexDataSet
+from wtscenario import make_scenarios
+
+# test_migrate01.py
+#    Parallel dump and load of many tables.
+class test_migrate01(wttest.WiredTigerTestCase):
+    nentries = 200
+    datasets = [SimpleDataSet, SimpleIndexDataSet, ComplexDataSet]
+
+    formats = [
+        ('print', dict(format='print')),
+        ('hex', dict(format='hex')),
+    ]
+    keyfmt = [
+        ('recno', dict(keyfmt='r')),
+        ('string', dict(keyfmt='S')),
+    ]
+    scenarios = make_scenarios(formats, keyfmt)
+
+    def setUp(self):
+        super(test_migrate01, self).setUp()
+        self.uris = []
+        for i, dataset in enumerate(self.datasets):
+            uri = 'table:migrate%d' % i
+            dataset(self, uri, self.nentries, key_format=self.keyfmt).populate()
+            self.uris.append(uri)
+
+    def records(self, conn, uri):
+        session = conn.open_session()
+        cursor = session.open_cursor(uri, None, None)
+        result = list(cursor)
+        session.close()
+        return result
+
+    def target(self, home='load.dir'):
+        os.mkdir(home)
+        return self.wiredtiger_open(home, 'create')
+
+    def check(self, conn):
+        for uri in self.uris:
+            self.assertEqual(self.records(conn, uri),
+                self.records(self.conn, uri))
+        # The index was created and built once the records were loaded.
+        index = 'index:migrate1:index1'
+        self.assertEqual(self.records(conn, index),
+            self.records(self.conn, index))
+
+    def test_migrate(self):
+        reported = []
+        results = dump(self.conn, 'dump.dir', workers=3, format=self.format,
+            progress=reported.append)
+        self.assertEqual([r.uri for r in results], self.uris)
+        self.assertEqual(sorted(reported), results)
+        for r in results:
+            self.assertEqual(r.records, self.nentries)
+            self.assertFalse(r.skipped)
+
+        conn = self.target()
+        results = load(conn, 'dump.dir', workers=3)
+        self.assertEqual([r.uri for r in results], self.uris)
+        for r in results:
+            self.assertEqual(r.records, self.nentries)
+        self.check(conn)
+
+    def test_resume(self):
+        dump(self.conn, 'dump.dir', uris=self.uris[:1], format=self.format)
+        results = dump(self.conn, 'dump.dir', format=self.format, resume=True)
+        self.assertEqual([r.skipped for r in results], [True, False, False])
+        results = dump(self.conn, 'dump.dir', format=self.format)
+        self.assertEqual([r.skipped for r in results], [False, False, False])
+
+        # An interrupted load: one table loaded and marked, one created and
+        # partially loaded.
+        conn = self.target()
+        load(conn, 'dump.dir')
+        marker = os.path.join(_markers(conn, 'dump.dir'),
+            'table%3Amigrate2.dump')
+        os.rename(marker + '.loaded', marker + '.loading')
+        keys = [r[0] for r in self.records(conn, 'table:migrate2')[0::2]]
+        session = conn.open_session()
+        cursor = session.open_cursor('table:migrate2', None, None)
+        self.assertEqual(cursor.remove_many(keys), len(keys))
+        session.close()
+
+        results = load(conn, 'dump.dir', resume=True)
+        self.assertEqual([r.skipped for r in results], [True, True, False])
+        self.check(conn)
+
+    # A dump loaded into one database is loaded into another in full.
+    def test_two_targets(self):
+        dump(self.conn, 'dump.dir', format=self.format)
+        for home in ('load1.dir', 'load2.dir'):
+            conn = self.target(home)
+            results = load(conn, 'dump.dir', resume=True)
+            self.assertEqual([r.skipped for r in results], [False] * 3)
+            self.check(conn)
+            conn.close()
+
+    # A table already in the target isn't dropped, the dump's records are
+    # loaded into it.
+    def test_existing(self):
+        dump(self.conn, 'dump.dir', format=self.format)
+        conn = self.target()
+        session = conn.open_session()
+        session.create(self.uris[0],
+            'key_format=%s,value_format=S' % self.keyfmt)
+        key = self.nentries + 1 if self.keyfmt == 'r' else 'existing'
+        cursor = session.open_cursor(self.uris[0], None, None)
+        cursor[key] = 'existing'
+        session.close()
+
+        load(conn, 'dump.dir', resume=True, bulk=False)
+        records = self.records(conn, self.uris[0])
+        self.assertTrue([key, 'existing'] in records)
+        self.assertEqual(len(records), self.nentries + 1)
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# test_pack02.py
+#    Check the compiled packing accelerator against the pure Python packing
+#    functions.
+#
+
+import random
+import wiredtiger, wttest
+from wiredtiger import intpacking, packing
+
+class test_pack02(wttest.WiredTigerTestCase):
+    # Formats and values covering every conversion, with and without sizes.
+    formats = [
+        ('iii', (0, 101, -99)),
+        ('3i', (0, 101, -99)),
+        ('iS', (42, 'forty two')),
+        ('S', ('abc',)),
+        ('S', ('a\x00b',)),
+        ('9S', ('a' * 9,)),
+        ('9SS', ('forty two', 'spam egg')),
+        ('10SS', ('aaaaa\x00\x00\x00\x00\x00', 'something')),
+        ('S10S', ('something', 'aaaaa\x00\x00\x00\x00\x00')),
+        ('10S', (u'héllo',)),
+        ('s', ('4',)),
+        ('s', ('',)),
+        ('2s', ('42',)),
+        ('u', (b'\x42' * 20,)),
+        ('u', (b'',)),
+        ('uu', (b'\x42' * 10, b'\x42' * 10)),
+        ('uu', (b'', b'\x00')),
+        ('3uu', (b'\x04\x03\x02', b'\x42' * 10)),
+        ('u3u', (b'\x42' * 10, b'\x04\x03\x02')),
+        ('U', (b'abc',)),
+        ('5U', (b'ab',)),
+        ('x', ()),
+        ('3xi', (5,)),
+        ('t', (1,)),
+        ('3t', (7,)),
+        ('B', (200,)),
+        ('3B', (1, 2, 3)),
+        ('4b', (-128, -1, 0, 127)),
+        ('r', (7,)),
+        ('qQ', (-2**63, 2**64 - 1)),
+        ('5Q', (1, 2**40, 8256, 8257, 0)),
+        ('SiQu', (u'héllo wörld', -5, 2**63, b'\x00\x01' * 30)),
+        ('.iS', (1, 'a')),
+    ]
+
+    def test_accelerated(self):
+        if not packing.accelerated:
+            self.skipTest('packing accelerator not built')
+        self.assertNotEqual(packing.pack, packing._pack_python)
+        self.assertNotEqual(packing.unpack, packing._unpack_python)
+
+    def test_pack_int(self):
+        r = random.Random(42)
+        values = [0, 1, -1, 63, 64, -64, -65, 8255, 8256, 8257, -8256, -8257,
+                  2**31, -2**31, 2**63 - 1, -2**63, 2**63, 2**64 - 1]
+        values += [r.randint(-2**63, 2**64 - 1) for i in range(10000)]
+        for v in values:
+            expect = intpacking._pack_int_python(v)
+            self.assertEqual(intpacking.pack_int(v), expect)
+            self.assertEqual(intpacking.unpack_int(expect + b'tail'),
+                intpacking._unpack_int_python(expect + b'tail'))
+
+    def test_pack(self):
+        for fmt, values in self.formats:
+            expect = packing._pack_python(fmt, *values)
+            self.assertEqual(packing.pack(fmt, *values), expect)
+            self.assertEqual(packing.unpack(fmt, expect),
+                packing._unpack_python(fmt, expect))
+
+    def test_empty(self):
+        self.assertEqual(packing.pack(''), packing._pack_python(''))
+        self.assertEqual(packing.unpack('', b''),
+            packing._unpack_python('', b''))
+        # A WT_ITEM with a NULL data field appears as None.
+        self.assertEqual(packing.unpack('u', None), [b''])
+
+    def test_errors(self):
+        for fmt, values, exc in [
+            ('t', (256,), ValueError),
+            ('9t', (1,), ValueError),
+            ('B', (256,), ValueError),
+            ('b', (128,), ValueError),
+            ('i', (1.5,), TypeError),
+            ('ii', (1,), IndexError),
+            ('@i', (1,), ValueError)]:
+            self.assertRaises(exc, packing._pack_python, fmt, *values)
+            self.assertRaises(exc, packing.pack, fmt, *values)
+
+    # Round trip values through a table, packing with the accelerator.
+    def test_table(self):
+        uri = 'table:test_pack02'
+        self.session.create(uri,
+            'key_format=SiQu,value_format=5Q,columns=(a,b,c,d,v0,v1,v2,v3,v4)')
+        cursor = self.session.open_cursor(uri, None, None)
+        for i in range(100):
+            cursor[('key%d' % i, -i, 2**64 - i - 1, b'\x00' * i)] = \
+                (i, i * 1000, i * 1000000, 2**40 + i, 0)
+        cursor.reset()
+        keys = set()
+        for keys_values in cursor:
+            self.assertEqual(len(keys_values), 9)
+            keys.add(keys_values[0])
+        self.assertEqual(keys, set('key%d' % i for i in range(100)))
+        cursor.set_key('key7', -7, 2**64 - 8, b'\x00' * 7)
+        self.assertEqual(cursor.search(), 0)
+        self.assertEqual(cursor.get_value(),
+            [7, 7000, 7000000, 2**40 + 7, 0])
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
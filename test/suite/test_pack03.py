@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# test_pack03.py
+#    Compiled format plans: check them against pack and unpack, and check
+#    that cursors use them.
+#
+
+import wiredtiger, wttest
+from wiredtiger import packing
+import test_pack02
+
+class test_pack03(wttest.WiredTigerTestCase):
+    formats = test_pack02.test_pack02.formats + [('', ())]
+
+    def check_plan(self, plan, fmt, values):
+        expect = packing._pack_python(fmt, *values)
+        self.assertEqual(plan.format, fmt)
+        self.assertEqual(plan.pack(*values), expect)
+        self.assertEqual(plan.unpack(expect),
+            packing._unpack_python(fmt, expect))
+
+    def test_python_plan(self):
+        for fmt, values in self.formats:
+            self.check_plan(packing._python_plan(fmt), fmt, values)
+
+    def test_compile_format(self):
+        for fmt, values in self.formats:
+            self.check_plan(packing.compile_format(fmt), fmt, values)
+
+    # Rows unpack the same columns, in any order of access.
+    def test_row(self):
+        for fmt, values in self.formats:
+            packed = packing.pack(fmt, *values)
+            expect = list(packing.unpack(fmt, packed))
+            plan = packing.compile_format(fmt)
+            self.assertEqual(list(plan.row(packed)), expect)
+            self.assertEqual(len(plan.row(packed)), len(expect))
+            row = plan.row(packed)
+            for i in reversed(range(len(expect))):
+                self.assertEqual(row[i], expect[i])
+                self.assertEqual(row[i - len(expect)], expect[i])
+            self.assertEqual(row[1:], expect[1:])
+            self.assertRaises(IndexError, lambda: row[len(expect)])
+            row = plan.row(packed, ['key'])
+            self.assertEqual(row, ['key'] + expect)
+
+    def test_errors(self):
+        for fmt, values, exc in [
+            ('t', (256,), ValueError),
+            ('B', (256,), ValueError),
+            ('ii', (1,), IndexError),
+            ('3i', (1, 2), IndexError),
+            ('@i', (1,), ValueError)]:
+            for plan in (packing._python_plan(fmt),
+                packing.compile_format(fmt)):
+                self.assertRaises(exc, plan.pack, *values)
+
+    # Plans are cached, least recently used first out.
+    def test_cache(self):
+        save_size = packing.plan_cache_size
+        try:
+            packing.plan_cache_size = 4
+            first = packing.compile_format('iS')
+            self.assertTrue(packing.compile_format('iS') is first)
+            for fmt in ('i', 'Q', 'S'):
+                packing.compile_format(fmt)
+            # Use 'iS' again, so 'i' is now the oldest entry.
+            self.assertTrue(packing.compile_format('iS') is first)
+            packing.compile_format('u')
+            self.assertEqual(len(packing._plan_cache), 4)
+            self.assertTrue('iS' in packing._plan_cache)
+            self.assertFalse('i' in packing._plan_cache)
+        finally:
+            packing.plan_cache_size = save_size
+
+    def test_cursor_plans(self):
+        uri = 'table:test_pack03'
+        self.session.create(uri, 'key_format=SiQu,value_format=5Q')
+        cursor = self.session.open_cursor(uri, None, None)
+        self.assertEqual(cursor._key_plan.format, 'SiQu')
+        self.assertEqual(cursor._value_plan.format, '5Q')
+        for i in range(50):
+            cursor[('key%d' % i, -i, 2**64 - 1, b'\x01' * i)] = \
+                (i, i, i, i, 2**63 + i)
+        cursor.reset()
+        count = 0
+        for k0, k1, k2, k3, v0, v1, v2, v3, v4 in cursor:
+            self.assertEqual(k0, 'key%d' % -k1)
+            self.assertEqual(k3, b'\x01' * -k1)
+            self.assertEqual(v4, 2**63 + v0)
+            count += 1
+        self.assertEqual(count, 50)
+
+        # Duplicated cursors get plans too.
+        cursor.set_key('key3', -3, 2**64 - 1, b'\x01' * 3)
+        self.assertEqual(cursor.search(), 0)
+        dup = self.session.open_cursor(None, cursor, None)
+        self.assertEqual(dup.get_value(), [3, 3, 3, 3, 2**63 + 3])
+        dup.close()
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
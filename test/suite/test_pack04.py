@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# test_pack04.py
+#    Fixed-width formats in wiredtiger.fpacking: compiled structs, and
+#    packing into and unpacking from buffers.
+#
+
+import struct
+import wiredtiger, wttest
+from wiredtiger import fpacking
+
+class test_pack04(wttest.WiredTigerTestCase):
+    # Formats, values and the equivalent struct formats.
+    formats = [
+        ('iii', (0, 101, -99), '>iii'),
+        ('3i', (0, 101, -99), '>3i'),
+        ('<qQ', (-2**63, 2**64 - 1), '<qQ'),
+        ('r', (7,), '>Q'),
+        ('B2h', (200, -1, 1), '>B2h'),
+        ('3xi', (5,), '>3xi'),
+        ('10s', (b'abc',), '>10s'),
+        ('5S', (b'ab',), '>5s'),
+        ('4ui', (b'abcd', 9), '>4si'),
+        ('@il', (1, 2), '@il'),
+    ]
+
+    def test_pack(self):
+        for fmt, values, sfmt in self.formats:
+            expect = struct.pack(sfmt, *values)
+            self.assertEqual(fpacking.pack(fmt, *values), expect)
+            self.assertEqual(fpacking.unpack(fmt, expect),
+                struct.unpack(sfmt, expect))
+            self.assertEqual(fpacking.calcsize(fmt), len(expect))
+
+    def test_pack_into(self):
+        for fmt, values, sfmt in self.formats:
+            expect = struct.pack(sfmt, *values)
+            buf = bytearray(b'\xff' * (len(expect) + 10))
+            fpacking.pack_into(fmt, buf, 3, *values)
+            self.assertEqual(bytes(buf[3:3 + len(expect)]), expect)
+            self.assertEqual(bytes(buf[:3]), b'\xff' * 3)
+            self.assertEqual(bytes(buf[3 + len(expect):]), b'\xff' * 7)
+            self.assertEqual(fpacking.unpack_from(fmt, buf, 3),
+                struct.unpack(sfmt, expect))
+
+    # Stage several records in one buffer.
+    def test_records(self):
+        fmt = 'Qi8s'
+        size = fpacking.calcsize(fmt)
+        buf = bytearray(size * 100)
+        for i in range(100):
+            fpacking.pack_into(fmt, buf, i * size, i, -i, b'row%d' % i)
+        for i in range(100):
+            self.assertEqual(fpacking.unpack_from(fmt, buf, i * size),
+                (i, -i, (b'row%d' % i).ljust(8, b'\x00')))
+
+    def test_variable(self):
+        for fmt in ('S', 'iS', 'u', 'iu', 't', '3t', ''):
+            self.assertEqual(fpacking.compile_format(fmt), None)
+            self.assertRaises(ValueError, fpacking.calcsize, fmt)
+            self.assertRaises(ValueError,
+                fpacking.pack_into, fmt, bytearray(10), 0, 1)
+            self.assertRaises(ValueError,
+                fpacking.unpack_from, fmt, bytearray(10))
+
+    # Structs are cached, least recently used first out.
+    def test_cache(self):
+        save_size = fpacking.struct_cache_size
+        try:
+            fpacking.struct_cache_size = 3
+            first = fpacking.compile_format('iQ')
+            self.assertTrue(fpacking.compile_format('iQ') is first)
+            for fmt in ('i', 'S'):
+                fpacking.compile_format(fmt)
+            # Use 'iQ' again, so 'i' is now the oldest entry.
+            self.assertTrue(fpacking.compile_format('iQ') is first)
+            fpacking.compile_format('Q')
+            self.assertEqual(len(fpacking._struct_cache), 3)
+            self.assertTrue('iQ' in fpacking._struct_cache)
+            self.assertFalse('i' in fpacking._struct_cache)
+        finally:
+            fpacking.struct_cache_size = save_size
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+import sys
+import wiredtiger, wttest
+from wtscenario import make_scenarios
+
+# test_parallel01.py
+#    Parallel scans with wiredtiger.parallel.
+class test_parallel01(wttest.WiredTigerTestCase):
+    nentries = 10000
+    types = [
+        ('file-row', dict(uri='file:parallel01', keyfmt='S', valfmt='S')),
+        ('file-col', dict(uri='file:parallel01', keyfmt='r', valfmt='S')),
+        ('file-fix', dict(uri='file:parallel01', keyfmt='r', valfmt='8t')),
+        ('lsm', dict(uri='lsm:parallel01', keyfmt='S', valfmt='S')),
+        ('table-row', dict(uri='table:parallel01', keyfmt='iS', valfmt='Si')),
+        ('table-col', dict(uri='table:parallel01', keyfmt='r', valfmt='Si')),
+    ]
+    workers = [
+        ('1', dict(workers=1)),
+        ('3', dict(workers=3)),
+        ('8', dict(workers=8)),
+    ]
+    scenarios = make_scenarios(types, workers)
+
+    def key(self, i):
+        if self.keyfmt == 'r':
+            return i + 1
+        if self.keyfmt == 'iS':
+            return (i % 10, 'key%06d' % i)
+        return 'key%06d' % i
+
+    def value(self, i):
+        if self.valfmt == 'Si':
+            return ('value%d' % i, i)
+        if self.valfmt == '8t':
+            return i % 200 + 1
+        return 'value%d' % i
+
+    def setUp(self):
+        if sys.version_info[0] < 3:
+            self.skipTest('parallel scans need Python 3')
+        super(test_parallel01, self).setUp()
+        self.session.create(self.uri,
+            'key_format=%s,value_format=%s' % (self.keyfmt, self.valfmt))
+
+    def populate(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for i in range(self.nentries):
+            cursor[self.key(i)] = self.value(i)
+        cursor.close()
+        # Write the records to disk so sampling finds more than one page.
+        self.session.checkpoint()
+
+    def expected(self):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        records = list(cursor)
+        cursor.close()
+        return records
+
+    def test_scan(self):
+        from wiredtiger import parallel
+        self.populate()
+        expected = self.expected()
+        results = parallel.scan(self.conn, self.uri, self.workers)
+        self.assertLessEqual(len(results), self.workers)
+        self.assertEqual(sum(results, []), expected)
+
+        counts = parallel.scan(self.conn, self.uri, self.workers,
+            fn=lambda records: sum(1 for r in records))
+        self.assertEqual(sum(counts), len(expected))
+
+        # Unordered results are the same ranges.
+        results = list(parallel.iscan(self.conn, self.uri, self.workers,
+            ordered=False))
+        results.sort(key=lambda r: r[0] if r else [])
+        self.assertEqual(sum(results, []), expected)
+
+    # Each range holds the keys from its start up to its stop.
+    def test_ranges(self):
+        from wiredtiger import parallel
+        self.populate()
+        ranges = parallel.ranges(self.conn, self.uri, self.workers)
+        self.assertLessEqual(len(ranges), self.workers)
+        self.assertEqual(ranges[0][0], None)
+        self.assertEqual(ranges[-1][1], None)
+        for i in range(len(ranges) - 1):
+            self.assertEqual(ranges[i][1], ranges[i + 1][0])
+        if self.workers > 1:
+            self.assertGreater(len(ranges), 1)
+
+        nkey = 2 if self.keyfmt == 'iS' else 1
+        found = []
+        for start, stop in ranges:
+            keys = [r[0] if nkey == 1 else tuple(r[:nkey])
+                for r in self.range_records(start, stop)]
+            for k in keys:
+                if start is not None:
+                    self.assertGreaterEqual(k, start)
+                if stop is not None:
+                    self.assertLess(k, stop)
+            found += keys
+        self.assertEqual(len(found), len(self.expected()))
+
+    def range_records(self, start, stop):
+        from wiredtiger import parallel
+        cursor = self.session.open_cursor(self.uri, None, None)
+        plan = cursor._key_plan
+        pack = lambda k: None if k is None else \
+            plan.pack(*k) if type(k) == tuple else plan.pack(k)
+        records = list(parallel._records(cursor, pack(start), pack(stop), 7))
+        cursor.close()
+        return records
+
+    # Range boundaries that aren't in the object.
+    def test_missing_boundaries(self):
+        self.populate()
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for i in range(100, 200):
+            cursor.set_key(self.key(i))
+            cursor.remove()
+        for i in range(300, 400):
+            cursor.set_key(self.key(i))
+            cursor.remove()
+        cursor.close()
+        expected = self.expected()
+        ids = [0, 150, 250, 350, self.nentries - 1]
+        # Python compares the keys in the same order as WiredTiger.
+        ids.sort(key=lambda i: self.key(i))
+        nkey = 2 if self.keyfmt == 'iS' else 1
+        records = []
+        for a, b in zip(ids[:-1], ids[1:]):
+            records += self.range_records(self.key(a), self.key(b))
+        first = self.key(ids[0])
+        last = self.key(ids[-1])
+        key = lambda r: r[0] if nkey == 1 else tuple(r[:nkey])
+        self.assertEqual(records,
+            [r for r in expected if first <= key(r) < last])
+
+    def test_empty(self):
+        from wiredtiger import parallel
+        self.assertEqual(parallel.ranges(self.conn, self.uri, self.workers),
+            [(None, None)])
+        self.assertEqual(parallel.scan(self.conn, self.uri, self.workers),
+            [[]])
+
+if __name__ == '__main__':
+    wttest.run()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import threading
+import wiredtiger, wttest
+from wiredtiger.pool import SessionPool
+
+# test_pool01.py
+#    Session and cursor pools.
+class test_pool01(wttest.WiredTigerTestCase):
+    uri = 'table:pool01'
+
+    def setUp(self):
+        super(test_pool01, self).setUp()
+        self.session.create(self.uri, 'key_format=S,value_format=S')
+        self.session.create(self.uri + 'b', 'key_format=S,value_format=S')
+
+    def test_cursors(self):
+        pool = SessionPool(self.conn, 2)
+        with pool.session() as s:
+            cursor = s.cursor(self.uri)
+            cursor['a'] = 'A'
+            self.assertTrue(s.cursor(self.uri) is cursor)
+            s.cursor(self.uri + 'b')
+            first = s
+        self.assertEqual(pool.stats()['hits'], 1)
+        self.assertEqual(pool.stats()['misses'], 2)
+
+        # The same session and cursor are lent again, the cursor is reset.
+        with pool.session() as s:
+            self.assertTrue(s is first)
+            cursor = s.cursor(self.uri)
+            self.assertEqual(cursor['a'], 'A')
+            self.assertEqual(cursor.search(), 0)
+        self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
+            cursor.get_key, '/requires key be set/')
+        stats = pool.stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['sessions'], 1)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['waits'], 0)
+        pool.close()
+        stats = pool.stats()
+        self.assertEqual(stats['sessions'], 0)
+        self.assertEqual(stats['in_use'], 0)
+
+    # A transaction left running when a session is returned is rolled back.
+    def test_transaction(self):
+        pool = SessionPool(self.conn, 1)
+        def abandon():
+            with pool.session() as s:
+                s.session.begin_transaction()
+                s.cursor(self.uri)['uncommitted'] = 'X'
+                raise ValueError('abandoned')
+        self.assertRaises(ValueError, abandon)
+        with pool.session() as s:
+            # Beginning a transaction fails if one is still running.
+            s.session.begin_transaction()
+            cursor = s.cursor(self.uri)
+            cursor.set_key('uncommitted')
+            self.assertEqual(cursor.search(), wiredtiger.WT_NOTFOUND)
+            s.session.commit_transaction()
+        self.assertEqual(pool.stats()['sessions'], 1)
+        pool.close()
+
+    # Least recently used cursors are closed.
+    def test_max_cursors(self):
+        pool = SessionPool(self.conn, 1, max_cursors=1)
+        with pool.session() as s:
+            c1 = s.cursor(self.uri)
+            c2 = s.cursor(self.uri + 'b')
+            self.assertFalse(s.cursor(self.uri) is c1)
+            self.assertFalse(s.cursor(self.uri + 'b') is c2)
+        self.assertEqual(pool.stats()['misses'], 4)
+        pool.close()
+
+    def test_wait(self):
+        pool = SessionPool(self.conn, 1)
+        s = pool.acquire()
+        self.assertRaisesException(wiredtiger.WiredTigerError,
+            lambda: pool.acquire(0.1))
+        self.assertEqual(pool.stats()['waits'], 1)
+        self.assertGreater(pool.stats()['wait_time'], 0.0)
+
+        # A waiting thread gets the session when it's released.
+        got = []
+        def waiter():
+            with pool.session(10) as s2:
+                got.append(s2)
+        t = threading.Thread(target=waiter)
+        t.start()
+        while pool.stats()['waits'] < 2:
+            pass
+        pool.release(s)
+        t.join()
+        self.assertEqual(got, [s])
+        pool.close()
+        self.assertRaisesException(wiredtiger.WiredTigerError,
+            lambda: pool.acquire())
+
+    def test_threads(self):
+        nthreads, nrecords = 8, 200
+        pool = SessionPool(self.conn, 3)
+        def writer(n):
+            for i in range(nrecords):
+                with pool.session() as s:
+                    s.cursor(self.uri)['%d.%d' % (n, i)] = str(i)
+        threads = [threading.Thread(target=writer, args=(n,))
+            for n in range(nthreads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = pool.stats()
+        self.assertLessEqual(stats['sessions'], 3)
+        self.assertEqual(stats['hits'] + stats['misses'], nthreads * nrecords)
+        self.assertLessEqual(stats['misses'], 3)
+        pool.close()
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.assertEqual(len(list(cursor)), nthreads * nrecords)
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
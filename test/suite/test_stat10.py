@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import wiredtiger, wttest
+from wiredtiger import stat
+
+# test_stat10.py
+#    Statistics snapshots and deltas.
+class test_stat10(wttest.WiredTigerTestCase):
+    conn_config = 'statistics=(all)'
+    uri = 'table:test_stat10'
+
+    # The values read one at a time from a statistics cursor.
+    def cursor_stats(self, uri, config):
+        values = {}
+        cursor = self.session.open_cursor(uri, None, config)
+        while cursor.next() == 0:
+            values[cursor.get_key()] = cursor.get_values()[2]
+        cursor.close()
+        return values
+
+    def check_snapshot(self, snapshot, uri, config):
+        expected = self.cursor_stats(uri, config)
+        self.assertEqual(snapshot.base, min(expected))
+        self.assertEqual(len(snapshot), max(expected) - snapshot.base + 1)
+        # Many statistics change as the statistics are read: with all set,
+        # reading a table's statistics walks its tree through the cache.
+        # Compare the cursor operations, the table isn't being used.
+        if uri == 'statistics:':
+            keys = (stat.conn.cursor_insert, stat.conn.cursor_update,
+                stat.conn.cursor_remove)
+        else:
+            keys = (stat.dsrc.btree_entries, stat.dsrc.cursor_insert,
+                stat.dsrc.cursor_insert_bytes, stat.dsrc.cursor_update,
+                stat.dsrc.cursor_remove)
+        for key in keys:
+            self.assertEqual(snapshot[key], expected[key])
+
+    def populate(self, n):
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for i in range(n):
+            cursor['key%d' % i] = 'value%d' % i
+        cursor.close()
+
+    def test_snapshot(self):
+        self.session.create(self.uri, 'key_format=S,value_format=S')
+        self.populate(100)
+        self.session.checkpoint()
+        for fast in (True, False):
+            config = 'statistics=(fast)' if fast else 'statistics=(all)'
+            for uri in ('', 'statistics:', self.uri,
+                'statistics:' + self.uri):
+                snapshot = self.session.stat_snapshot(uri, fast)
+                if not uri.startswith('statistics:'):
+                    uri = 'statistics:' + uri
+                self.check_snapshot(snapshot, uri, config)
+
+        snapshot = self.session.stat_snapshot(self.uri)
+        self.assertEqual(snapshot[stat.dsrc.cursor_insert], 100)
+        self.assertRaises(IndexError, lambda: snapshot[0])
+        self.assertRaises(IndexError,
+            lambda: snapshot[snapshot.base + len(snapshot)])
+
+    def test_delta(self):
+        self.session.create(self.uri, 'key_format=S,value_format=S')
+        self.populate(10)
+        before = self.session.stat_snapshot(self.uri)
+        self.populate(50)
+        after = self.session.stat_snapshot(self.uri)
+        self.assertGreaterEqual(after.time, before.time)
+
+        delta = stat.delta(before, after)
+        self.assertEqual(delta.base, after.base)
+        self.assertEqual(len(delta), len(after))
+        self.assertEqual(delta[stat.dsrc.cursor_insert], 50)
+        for i in range(len(after)):
+            self.assertEqual(delta.values[i],
+                after.values[i] - before.values[i])
+
+        rate = stat.delta(before, after, 2)
+        self.assertEqual(rate[stat.dsrc.cursor_insert], 25.0)
+
+        conn = self.session.stat_snapshot('')
+        self.assertRaises(ValueError, stat.delta, before, conn)
+
+    def test_errors(self):
+        self.assertRaisesException(wiredtiger.WiredTigerError,
+            lambda: self.session.stat_snapshot('table:nonexistent'))
+
+if __name__ == '__main__':
+    wttest.run()
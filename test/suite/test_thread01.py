@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# test_thread01.py
+#    Python threads run while other threads are in WiredTiger calls.
+#
+
+import threading, time
+import wiredtiger, wttest
+
+class test_thread01(wttest.WiredTigerTestCase):
+    uri = 'table:test_thread01'
+    nrows = 20000
+    nthreads = 4
+
+    def populate(self):
+        self.session.create(self.uri, 'key_format=i,value_format=S')
+        cursor = self.session.open_cursor(self.uri, None, None)
+        self.session.begin_transaction()
+        for i in range(self.nrows):
+            cursor[i] = str(i) * 10
+        self.session.commit_transaction()
+        cursor.close()
+
+    # While one thread is inside long running engine calls, another Python
+    # thread must be able to run: that requires the interpreter lock to be
+    # released around the calls.
+    def test_release(self):
+        self.populate()
+        calls = []
+        samples = []
+        done = threading.Event()
+
+        def sampler():
+            while not done.is_set():
+                samples.append(time.time())
+
+        def worker():
+            session = self.conn.open_session()
+            for i in range(5):
+                start = time.time()
+                session.checkpoint('force')
+                session.verify(self.uri, None)
+                calls.append((start, time.time()))
+            session.close()
+
+        t = threading.Thread(target=sampler)
+        t.start()
+        try:
+            worker()
+        finally:
+            done.set()
+            t.join()
+
+        inside = [s for s in samples
+            for start, end in calls if start < s < end]
+        self.assertGreater(len(inside), 0)
+
+    # Threads with their own sessions and cursors read and write the same
+    # table concurrently.
+    def test_threads(self):
+        self.populate()
+        errors = []
+
+        def worker(n):
+            try:
+                session = self.conn.open_session()
+                cursor = session.open_cursor(self.uri, None, None)
+                for i in range(n, self.nrows, self.nthreads):
+                    cursor.set_key(i)
+                    self.assertEqual(cursor.search(), 0)
+                    self.assertEqual(cursor.get_value(), str(i) * 10)
+                    cursor.set_value(str(-i))
+                    self.assertEqual(cursor.update(), 0)
+                count = 0
+                cursor.reset()
+                while cursor.next() == 0:
+                    count += 1
+                self.assertEqual(count, self.nrows)
+                session.close()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,))
+            for n in range(self.nthreads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+        cursor = self.session.open_cursor(self.uri, None, None)
+        for key, value in cursor:
+            self.assertEqual(value, str(-key))
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()
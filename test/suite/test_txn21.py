@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+#
+# Public Domain 2014-2019 MongoDB, Inc.
+# Public Domain 2008-2014 WiredTiger, Inc.
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+#
+# test_txn21.py
+#   Transactions: Session.transaction retrying after conflicts
+#
+
+import wiredtiger, wttest
+
+class test_txn21(wttest.WiredTigerTestCase):
+    uri = 'table:test_txn21'
+
+    def setUp(self):
+        super(test_txn21, self).setUp()
+        self.session.create(self.uri, 'key_format=i,value_format=i')
+
+    def check(self, expected):
+        cursor = self.session.open_cursor(self.uri, None)
+        self.assertEqual(list(cursor), expected)
+        cursor.close()
+
+    # A conflict that outlasts the retries is raised.
+    def test_conflict(self):
+        cursor = self.session.open_cursor(self.uri, None)
+        cursor[1] = 1
+
+        other = self.conn.open_session()
+        other_cursor = other.open_cursor(self.uri, None)
+        other.begin_transaction()
+        other_cursor[1] = 2
+
+        calls = []
+        @self.session.transaction(retries=3, backoff=0.0001)
+        def update(value):
+            calls.append(value)
+            cursor[1] = value
+            return value
+
+        self.assertRaisesException(wiredtiger.WiredTigerError,
+            lambda: update(3), '/conflict between concurrent operations/')
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(self.session.txn_retries, 3)
+        self.assertGreaterEqual(self.session.txn_retry_wait, 0.0)
+        self.assertEqual(other.txn_retries, 0)
+
+        # Once the conflicting transaction resolves, the update succeeds.
+        other.rollback_transaction()
+        self.assertEqual(update(4), 4)
+        self.assertEqual(self.session.txn_retries, 3)
+        cursor.close()
+        self.check([[1, 4]])
+
+    # A failure other than a conflict isn't retried.
+    def test_exception(self):
+        cursor = self.session.open_cursor(self.uri, None)
+        calls = []
+        @self.session.transaction()
+        def fail():
+            calls.append(1)
+            cursor[1] = 1
+            raise KeyError('fail')
+
+        self.assertRaises(KeyError, fail)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.session.txn_retries, 0)
+        cursor.close()
+        self.check([])
+
+class test_txn21_rollback_error(wttest.WiredTigerTestCase):
+    conn_config = 'debug_mode=(rollback_error=3)'
+    uri = 'table:test_txn21'
+
+    # Simulated rollbacks are retried until the transactions commit.
+    def test_rollback_error(self):
+        self.session.create(self.uri, 'key_format=i,value_format=i')
+        cursor = self.session.open_cursor(self.uri, None)
+
+        @self.session.transaction(retries=100, backoff=0.0001)
+        def insert(k):
+            cursor[k] = k
+            cursor[k + 1000] = k
+
+        for k in range(1, 20):
+            insert(k)
+        self.assertGreater(self.session.txn_retries, 0)
+        cursor.close()
+
+        cursor = self.session.open_cursor(self.uri, None)
+        self.assertEqual(len(list(cursor)), 38)
+        cursor.close()
+
+if __name__ == '__main__':
+    wttest.run()